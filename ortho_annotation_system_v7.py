@@ -14,6 +14,15 @@ import cv2
 import copy
 from pathlib import Path
 import re
+import threading
+import hashlib
+import queue
+import itertools
+import bisect
+import struct
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 from io import BytesIO
 
 # cairosvgは不要になりました（PNG/JPG直接読み込みに変更）
@@ -33,6 +42,9 @@ except ImportError:
 
 import difflib
 
+# 温度解析はプロセスプールで実行するため、ワーカー関数は GUI を含まない別モジュールに置く
+from thermal_stats_worker import RADIOMETRIC_SCALE_NOTE, compute_thermal_stats_batch, iter_jpeg_segments
+
 # 管理レベルおよび拡張出力用の定数とユーティリティ
 MANAGEMENT_LEVELS = ['S', 'A', 'B', 'N']
 
@@ -49,6 +61,101 @@ def normalize_management_level(value):
     v = str(value).upper().strip()
     return v if v in MANAGEMENT_LEVELS else 'S'
 
+class TiledImageRenderer:
+    """ピラミッド（1/2縮小の多段画像）とタイルキャッシュで大きな画像をキャンバスへ部分描画する"""
+
+    TILE_SIZE = 256
+
+    def __init__(self, image, max_tiles=192):
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() or "transparency" in image.info else "RGB")
+        self.image = image
+        self.max_tiles = max_tiles
+        self._levels = [image]
+        self._tiles = OrderedDict()  # (zoom, tx, ty) -> PhotoImage
+        self._items = {}  # 現在キャンバス上にあるタイル (tx, ty) -> item id
+        self._items_zoom = None
+
+    @property
+    def size(self):
+        return self.image.size
+
+    def display_size(self, zoom):
+        w, h = self.image.size
+        return max(1, int(w * zoom)), max(1, int(h * zoom))
+
+    def level_for_zoom(self, zoom):
+        """表示倍率以上の解像度を持つ最小のピラミッド段を返す（段は必要時に生成）"""
+        level = 0
+        while zoom <= 0.5 ** (level + 1):
+            level += 1
+        while len(self._levels) <= level:
+            prev = self._levels[-1]
+            if prev.width < 2 or prev.height < 2:
+                break
+            self._levels.append(prev.reduce(2))
+        return self._levels[min(level, len(self._levels) - 1)]
+
+    def get_tile(self, zoom, tx, ty):
+        key = (round(zoom, 6), tx, ty)
+        photo = self._tiles.get(key)
+        if photo is not None:
+            self._tiles.move_to_end(key)
+            return photo
+        disp_w, disp_h = self.display_size(zoom)
+        t = self.TILE_SIZE
+        x0, y0 = tx * t, ty * t
+        x1, y1 = min(disp_w, x0 + t), min(disp_h, y0 + t)
+        if x1 <= x0 or y1 <= y0:
+            return None
+        level = self.level_for_zoom(zoom)
+        sx = level.width / float(disp_w)
+        sy = level.height / float(disp_h)
+        box = (x0 * sx, y0 * sy, x1 * sx, y1 * sy)
+        resample = Image.Resampling.BILINEAR if sx < 1.0 else Image.Resampling.LANCZOS
+        tile = level.resize((x1 - x0, y1 - y0), resample, box=box)
+        photo = ImageTk.PhotoImage(tile)
+        self._tiles[key] = photo
+        while len(self._tiles) > self.max_tiles:
+            self._tiles.popitem(last=False)
+        return photo
+
+    def reset_canvas_items(self):
+        """キャンバスが全消去された後に呼び出し、配置済みタイルの記録を破棄"""
+        self._items = {}
+        self._items_zoom = None
+
+    def render(self, canvas, zoom, viewport, tag="image_tile", offset=(0, 0), margin=1):
+        """viewport (x0, y0, x1, y1) に掛かるタイルだけを配置し、範囲外のタイルは外す"""
+        if self._items_zoom is not None and abs(self._items_zoom - zoom) > 1e-9:
+            canvas.delete(tag)
+            self._items = {}
+        self._items_zoom = zoom
+        t = self.TILE_SIZE
+        disp_w, disp_h = self.display_size(zoom)
+        ox, oy = offset
+        vx0, vy0, vx1, vy1 = viewport
+        tx0 = max(0, int((vx0 - ox) // t) - margin)
+        ty0 = max(0, int((vy0 - oy) // t) - margin)
+        tx1 = min((disp_w - 1) // t, int((vx1 - ox) // t) + margin)
+        ty1 = min((disp_h - 1) // t, int((vy1 - oy) // t) + margin)
+        wanted = set()
+        for ty in range(ty0, ty1 + 1):
+            for tx in range(tx0, tx1 + 1):
+                wanted.add((tx, ty))
+                if (tx, ty) in self._items:
+                    continue
+                photo = self.get_tile(zoom, tx, ty)
+                if photo is None:
+                    continue
+                self._items[(tx, ty)] = canvas.create_image(
+                    ox + tx * t, oy + ty * t, anchor=tk.NW, image=photo, tags=(tag,)
+                )
+        for key in [k for k in self._items if k not in wanted]:
+            canvas.delete(self._items.pop(key))
+        canvas.tag_lower(tag)
+
+
 class ODMImageSelector:
     def __init__(self, parent, annotation, image_type, webodm_path, callback, app_ref=None, rjpeg_folder=None):
         self.parent = parent
@@ -251,7 +358,7 @@ class ODMImageSelector:
         
         for pos in original_positions:
             webodm_filename = pos['filename']
-            webodm_path = pos['path']
+            webodm_path = self.position_path(pos) or ''
             webodm_x = pos['x']
             webodm_y = pos['y']
             
@@ -473,7 +580,7 @@ class ODMImageSelector:
             )
             # 判別用ラベル（番号＋ファイル名）
             try:
-                base = os.path.basename(pos_info.get('path') or pos_info.get('filename') or '')
+                base = os.path.basename(pos_info.get('filename') or pos_info.get('path') or '')
                 label = f"{i+1}: {base}" if base else f"{i+1}"
                 self.canvas.create_text(
                     x + 10 * self.zoom_factor, y - 10 * self.zoom_factor,
@@ -517,7 +624,7 @@ class ODMImageSelector:
         """指定されたインデックスの画像を選択"""
         if 0 <= index < len(self.image_positions):
             selected_image = self.image_positions[index]
-            self.selected_image_path = selected_image.get('path')
+            self.selected_image_path = self.position_path(selected_image)
             
             # 選択状態を視覚的に表示
             self.canvas.delete("selected")
@@ -583,6 +690,21 @@ def _odmselector_debug_log(self, msg: str):
     except Exception:
         pass
 
+ODM_PREVIEW_MAX_SIZE = (380, 240)
+ODM_PREVIEW_CACHE_LIMIT = 16
+
+
+def _odm_load_preview_pil(image_path):
+    """プレビュー用に縮小したPIL画像を生成（最大380x240、ワーカースレッドからも使用）"""
+    with Image.open(image_path) as img:
+        max_w, max_h = ODM_PREVIEW_MAX_SIZE
+        img.draft(None, (max_w, max_h))
+        w, h = img.size
+        scale = min(1.0, min(max_w / float(w), max_h / float(h)))
+        new_size = (max(1, int(w * scale)), max(1, int(h * scale)))
+        return img.resize(new_size, Image.Resampling.LANCZOS)
+
+
 def _odmselector_update_preview(self, image_path):
     try:
         if not image_path or not os.path.exists(image_path):
@@ -590,12 +712,11 @@ def _odmselector_update_preview(self, image_path):
                 self.preview_label.config(text="プレビューなし", image="")
             self._odm_preview_imgtk = None
             return
-        img = Image.open(image_path)
-        max_w, max_h = 380, 240
-        w, h = img.size
-        scale = min(1.0, min(max_w / float(w), max_h / float(h)))
-        new_size = (max(1, int(w * scale)), max(1, int(h * scale)))
-        img = img.resize(new_size, Image.Resampling.LANCZOS)
+        cache = getattr(self, '_preview_cache', None)
+        img = cache.get(image_path) if cache is not None else None
+        if img is None:
+            img = _odm_load_preview_pil(image_path)
+        new_size = img.size
         imgtk = ImageTk.PhotoImage(img)
         if hasattr(self, 'preview_label'):
             self.preview_label.config(image=imgtk, text="")
@@ -614,7 +735,7 @@ def _odmselector_select_image_by_index(self, index):
     """指定されたインデックスの画像を選択（プレビュー＆ログ付き）"""
     if 0 <= index < len(self.image_positions):
         selected_image = self.image_positions[index]
-        self.selected_image_path = selected_image.get('path')
+        self.selected_image_path = _odmselector_position_path(self, selected_image)
         # 選択状態の視覚表示
         self.canvas.delete("selected")
         ortho_w, ortho_h = self.ortho_image_size
@@ -630,13 +751,19 @@ def _odmselector_select_image_by_index(self, index):
             fill="yellow", outline="black", width=3,
             tags="selected"
         )
+        # 巡回状態の記録
+        _odmselector_ensure_neighbour_graph(self)
+        self._selected_index = index
+        self._visited.add(index)
         # プレビュー更新
         try:
             if self.selected_image_path:
                 _odmselector_update_preview(self, self.selected_image_path)
         except Exception:
             pass
+        _odmselector_scroll_into_view(self, x, y)
         self.update_info()
+        _odmselector_prefetch_neighbours(self, index)
         _odmselector_debug_log(self, f"selected index={index}, path={self.selected_image_path}")
 
 # メソッドをクラスへ付与
@@ -676,7 +803,20 @@ def _odmselector_create_selector_window(self):
     self.canvas = tk.Canvas(canvas_frame, bg="white")
     v_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=self.canvas.yview)
     h_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL, command=self.canvas.xview)
-    self.canvas.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+
+    # 表示範囲が変わるたびに可視タイルを補充する
+    def on_yscroll(first, last):
+        v_scrollbar.set(first, last)
+        _odmselector_schedule_tile_render(self)
+
+    def on_xscroll(first, last):
+        h_scrollbar.set(first, last)
+        _odmselector_schedule_tile_render(self)
+
+    self.canvas.configure(yscrollcommand=on_yscroll, xscrollcommand=on_xscroll)
+    self.canvas.bind("<Configure>", lambda _e: _odmselector_schedule_tile_render(self), add="+")
+    self._coverage_renderer = None
+    self._tile_render_job = None
 
     self.canvas.grid(row=0, column=0, sticky="nsew")
     v_scrollbar.grid(row=0, column=1, sticky="ns")
@@ -688,13 +828,75 @@ def _odmselector_create_selector_window(self):
     self.canvas.bind("<Button-1>", self.on_canvas_click)
     self.canvas.bind("<MouseWheel>", self.on_mouse_wheel)
 
+    # キーボード巡回（近傍グラフ）
+    self.window.bind("<Right>", lambda _e: self.step_nearest_unvisited())
+    self.window.bind("<n>", lambda _e: self.step_nearest_unvisited())
+    self.window.bind("<Left>", lambda _e: self.step_back())
+    self.window.bind("<b>", lambda _e: self.step_back())
+    self.window.bind("<a>", lambda _e: self.step_closest_to_annotation(1))
+    self.window.bind("<A>", lambda _e: self.step_closest_to_annotation(-1))
+    self.window.bind("<Return>", lambda _e: self.confirm_selection())
+
     button_frame = ttk.Frame(main_frame)
     button_frame.pack(fill=tk.X, pady=(10, 0))
     ttk.Button(button_frame, text="画像フォルダ選択", command=self.select_images_folder).pack(side=tk.LEFT, padx=(0, 10))
+    ttk.Label(
+        button_frame,
+        text="→/N: 最寄り未表示  ←/B: 戻る  A/Shift+A: アノテーションに近い順  Enter: 選択",
+        foreground="#666666"
+    ).pack(side=tk.LEFT)
     ttk.Button(button_frame, text="選択", command=self.confirm_selection).pack(side=tk.RIGHT, padx=(10, 0))
     ttk.Button(button_frame, text="キャンセル", command=self.window.destroy).pack(side=tk.RIGHT)
 
 
+def _odmselector_coverage_renderer(self):
+    """カバレッジ画像用のタイルレンダラー（画像差し替え時に作り直す）"""
+    renderer = getattr(self, '_coverage_renderer', None)
+    if renderer is None or getattr(self, '_coverage_renderer_source', None) is not self.coverage_image:
+        renderer = TiledImageRenderer(self.coverage_image)
+        self._coverage_renderer = renderer
+        self._coverage_renderer_source = self.coverage_image
+    return renderer
+
+
+def _odmselector_render_coverage_tiles(self):
+    """現在の表示範囲に掛かるカバレッジ画像タイルを描画"""
+    self._tile_render_job = None
+    if not getattr(self, 'coverage_image', None):
+        return
+    try:
+        left = self.canvas.canvasx(0)
+        top = self.canvas.canvasy(0)
+        viewport = (left, top, left + self.canvas.winfo_width(), top + self.canvas.winfo_height())
+        _odmselector_coverage_renderer(self).render(self.canvas, self.zoom_factor, viewport, tag="coverage_tile")
+    except tk.TclError:
+        pass
+
+
+def _odmselector_schedule_tile_render(self):
+    """スクロール・リサイズ時のタイル描画をアイドル時に1回へまとめる"""
+    if getattr(self, '_tile_render_job', None) is not None:
+        return
+    try:
+        self._tile_render_job = self.window.after_idle(lambda: _odmselector_render_coverage_tiles(self))
+    except Exception:
+        self._tile_render_job = None
+
+
+def _odmselector_display_coverage_image(self):
+    """カバレッジ画像（タイル描画）と各種マーカーを表示"""
+    if not self.coverage_image:
+        return
+    renderer = _odmselector_coverage_renderer(self)
+    display_w, display_h = renderer.display_size(self.zoom_factor)
+    self.canvas.delete("all")
+    renderer.reset_canvas_items()
+    self.canvas.configure(scrollregion=(0, 0, display_w, display_h))
+    _odmselector_render_coverage_tiles(self)
+    self.draw_image_markers()
+    self.draw_current_annotation()
+
+
 def _odmselector_norm_key(name: str):
     """拡張子を除き、大小文字差を無視した照合キーを生成（DJI_XXXX.*対応）"""
     try:
@@ -707,6 +909,110 @@ def _odmselector_norm_key(name: str):
         return str(name).lower()
 
 
+# WebODMフォルダ単位で保持する stem -> (px, py) インデックス（座標ファイルの mtime で無効化）
+_ODM_GEO_INDEX_CACHE = {}
+# フォルダ単位の os.scandir 結果（フォルダの mtime で無効化）
+_ODM_SCANDIR_CACHE = {}
+
+
+def _odm_build_geo_index(positions):
+    """georeferencing由来の basename（stem小文字） -> (px, py) インデックスを構築"""
+    geo_index = {}
+    for p in positions or []:
+        base = os.path.basename(p.get('filename') or p.get('path') or '')
+        key = _odmselector_norm_key(base)
+        if key:
+            geo_index[key] = (float(p.get('x', 0)), float(p.get('y', 0)))
+    return geo_index
+
+
+def _odm_world_file_candidates(raster_path):
+    """ラスタに対応するワールドファイル候補（.tfw / .wld / 拡張子由来の .pgw・.jgw 等）"""
+    base, ext = os.path.splitext(raster_path)
+    candidates = [base + '.tfw', base + '.wld']
+    if len(ext) >= 3:
+        derived = base + '.' + ext[1] + ext[-1] + 'w'
+        if derived.lower() not in (c.lower() for c in candidates):
+            candidates.append(derived)
+    return candidates
+
+
+def _odm_register_geo_index(webodm_path, source_paths, positions):
+    """WebODMフォルダに対応する永続インデックスを取得（座標ファイル・オルソ未変更なら再利用）"""
+    key = os.path.normcase(os.path.abspath(webodm_path))
+    stamp = []
+    for src in source_paths:
+        try:
+            stamp.append((src, os.stat(src).st_mtime_ns))
+        except (OSError, TypeError):
+            stamp.append((src, None))
+    stamp = tuple(stamp)
+    cached = _ODM_GEO_INDEX_CACHE.get(key)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    geo_index = _odm_build_geo_index(positions)
+    _ODM_GEO_INDEX_CACHE[key] = (stamp, geo_index)
+    return geo_index
+
+
+def _odmselector_get_geo_index(self):
+    """現在のWebODMフォルダの geo index を返す（未登録なら image_positions から構築）"""
+    geo_index = getattr(self, '_geo_index', None)
+    if geo_index:
+        return geo_index
+    key = os.path.normcase(os.path.abspath(self.webodm_path or ''))
+    cached = _ODM_GEO_INDEX_CACHE.get(key)
+    if cached and cached[1]:
+        geo_index = cached[1]
+    else:
+        geo_index = _odm_build_geo_index(getattr(self, 'image_positions', None))
+        _odmselector_debug_log(self, f"geo index built from positions: keys={len(geo_index)}")
+    self._geo_index = geo_index
+    return geo_index
+
+
+def _odm_scandir_cached(folder):
+    """フォルダ直下の (ファイルパス一覧, サブフォルダ一覧) を返す（mtime 不変ならキャッシュ）"""
+    try:
+        mtime = os.stat(folder).st_mtime_ns
+    except OSError:
+        _ODM_SCANDIR_CACHE.pop(folder, None)
+        return [], []
+    cached = _ODM_SCANDIR_CACHE.get(folder)
+    if cached and cached[0] == mtime:
+        return cached[1], cached[2]
+    files = []
+    dirs = []
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.path)
+                    elif entry.is_file():
+                        files.append(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        return [], []
+    _ODM_SCANDIR_CACHE[folder] = (mtime, files, dirs)
+    return files, dirs
+
+
+def _odm_collect_image_files(folder, target_exts):
+    """フォルダ配下（再帰）の対象拡張子ファイルを収集（変更のないフォルダは再走査しない）"""
+    result = []
+    stack = [folder]
+    while stack:
+        current = stack.pop()
+        files, dirs = _odm_scandir_cached(current)
+        for fp in files:
+            if os.path.splitext(fp)[1].lower() in target_exts:
+                result.append(fp)
+        stack.extend(reversed(dirs))
+    return result
+
+
 def _odmselector_select_images_folder(self):
     """画像フォルダを選択し、basename（拡張子除く）とgeoreferencingの照合でマーカーを展開"""
     try:
@@ -714,24 +1020,11 @@ def _odmselector_select_images_folder(self):
         if not folder:
             return
         target_exts = {'.jpg', '.jpeg', '.png', '.tif', '.tiff'}
-        files = []
-        for root, dirs, fnames in os.walk(folder):
-            for fn in fnames:
-                ext = os.path.splitext(fn)[1].lower()
-                if ext in target_exts:
-                    files.append(os.path.join(root, fn))
+        files = _odm_collect_image_files(folder, target_exts)
         _odmselector_debug_log(self, f"scan folder done: {folder}, candidates={len(files)}")
 
         # georeferencing由来の basename（stem小文字） -> (px, py) インデックス
-        geo_index = {}
-        for p in getattr(self, 'image_positions', []):
-            base = os.path.basename(p.get('filename') or p.get('path') or '')
-            if not base:
-                base = os.path.basename(p.get('path') or '')
-            key = _odmselector_norm_key(base)
-            if key:
-                geo_index[key] = (float(p.get('x', 0)), float(p.get('y', 0)))
-        self._geo_index = geo_index
+        geo_index = _odmselector_get_geo_index(self)
 
         matched = []
         unmatched_samples = []
@@ -769,19 +1062,9 @@ def _odmselector_select_images_folder(self):
 
 def _odmselector_update_info(self):
     """情報表示を更新＋必要ならフォルダ選択を促す"""
-    # geo index 構築（未構築時）
+    # geo index 取得（未構築時のみ構築）
     try:
-        if not hasattr(self, '_geo_index') or not self._geo_index:
-            geo_index = {}
-            for p in getattr(self, 'image_positions', []) or []:
-                base = os.path.basename(p.get('filename') or p.get('path') or '')
-                if not base:
-                    base = os.path.basename(p.get('path') or '')
-                key = _odmselector_norm_key(base)
-                if key:
-                    geo_index[key] = (float(p.get('x', 0)), float(p.get('y', 0)))
-            self._geo_index = geo_index
-            _odmselector_debug_log(self, f"geo index built in update_info: keys={len(self._geo_index)}")
+        _odmselector_get_geo_index(self)
     except Exception:
         pass
 
@@ -805,16 +1088,289 @@ def _odmselector_update_info(self):
     except Exception:
         pass
 
+# --- 近傍グラフによるキーボード巡回 ---
+
+ODM_NEIGHBOUR_K = 8
+
+
+def _odm_knn_graph(points, k=ODM_NEIGHBOUR_K):
+    """各点の近傍インデックス (n, k) を距離順で返す（自身は除く）"""
+    n = len(points)
+    k = min(k, n - 1)
+    if k <= 0:
+        return np.empty((n, 0), dtype=np.intp)
+    try:
+        from scipy.spatial import cKDTree
+        _dist, idx = cKDTree(points).query(points, k=k + 1)
+        return np.asarray(idx[:, 1:], dtype=np.intp)
+    except ImportError:
+        pass
+    graph = np.empty((n, k), dtype=np.intp)
+    sq_norm = np.einsum('ij,ij->i', points, points)
+    chunk = 512
+    for start in range(0, n, chunk):
+        block = points[start:start + chunk]
+        d2 = sq_norm[start:start + chunk, None] + sq_norm[None, :] - 2.0 * block @ points.T
+        rows = np.arange(block.shape[0])
+        d2[rows, rows + start] = np.inf
+        part = np.argpartition(d2, k - 1, axis=1)[:, :k]
+        order = np.argsort(np.take_along_axis(d2, part, axis=1), axis=1)
+        graph[start:start + chunk] = np.take_along_axis(part, order, axis=1)
+    return graph
+
+
+def _odmselector_ensure_neighbour_graph(self):
+    """image_positions に対する座標配列・近傍グラフ・巡回状態を用意（位置情報差し替え時に再構築）"""
+    positions = getattr(self, 'image_positions', None) or []
+    if getattr(self, '_knn_positions', None) is positions and getattr(self, '_knn_count', -1) == len(positions):
+        return
+    points = np.array([(p.get('x', 0.0), p.get('y', 0.0)) for p in positions], dtype=np.float64).reshape(-1, 2)
+    self._position_points = points
+    self._knn_graph = _odm_knn_graph(points)
+    ann = getattr(self, 'annotation', None) or {}
+    if len(points):
+        target = np.array([float(ann.get('x', 0.0)), float(ann.get('y', 0.0))])
+        self._annotation_order = np.argsort(np.hypot(*(points - target).T), kind='stable')
+    else:
+        self._annotation_order = np.empty(0, dtype=np.intp)
+    self._annotation_rank = -1
+    self._knn_positions = positions
+    self._knn_count = len(positions)
+    self._visited = set()
+    self._nav_history = []
+    self._selected_index = None
+    self._preview_cache = {}
+    _odmselector_debug_log(self, f"neighbour graph built: n={len(points)}, k={self._knn_graph.shape[1]}")
+
+
+def _odmselector_nearest_unvisited(self, index):
+    """index から最も近い未表示画像のインデックス（無ければ None）"""
+    for j in self._knn_graph[index]:
+        if int(j) not in self._visited:
+            return int(j)
+    # 近傍がすべて表示済みなら未表示全体から探索
+    unvisited = np.ones(len(self._position_points), dtype=bool)
+    unvisited[list(self._visited)] = False
+    if not unvisited.any():
+        return None
+    candidates = np.flatnonzero(unvisited)
+    d = np.hypot(*(self._position_points[candidates] - self._position_points[index]).T)
+    return int(candidates[int(np.argmin(d))])
+
+
+def _odmselector_step_nearest_unvisited(self):
+    """現在の画像から空間的に最も近い未表示画像へ移動"""
+    if not getattr(self, 'image_positions', None) or not self.coverage_image:
+        return "break"
+    _odmselector_ensure_neighbour_graph(self)
+    current = self._selected_index
+    if current is None:
+        return _odmselector_step_closest_to_annotation(self, 1)
+    nxt = _odmselector_nearest_unvisited(self, current)
+    if nxt is not None:
+        self._nav_history.append(current)
+        self.select_image_by_index(nxt)
+    return "break"
+
+
+def _odmselector_step_back(self):
+    """キーボード巡回の履歴を1つ戻る"""
+    if getattr(self, '_nav_history', None):
+        self.select_image_by_index(self._nav_history.pop())
+    return "break"
+
+
+def _odmselector_step_closest_to_annotation(self, direction=1):
+    """アノテーション位置に近い順で次（direction=-1 で前）の画像へ移動"""
+    if not getattr(self, 'image_positions', None) or not self.coverage_image:
+        return "break"
+    _odmselector_ensure_neighbour_graph(self)
+    order = self._annotation_order
+    if not len(order):
+        return "break"
+    rank = max(0, min(len(order) - 1, self._annotation_rank + direction))
+    if rank == self._annotation_rank:
+        return "break"
+    self._annotation_rank = rank
+    if self._selected_index is not None:
+        self._nav_history.append(self._selected_index)
+    self.select_image_by_index(int(order[rank]))
+    return "break"
+
+
+def _odmselector_scroll_into_view(self, x, y):
+    """選択マーカーが表示範囲外ならキャンバスをスクロール"""
+    try:
+        region = self.canvas.bbox("all")
+        if not region:
+            return
+        total_w = max(1, region[2])
+        total_h = max(1, region[3])
+        view_w = self.canvas.winfo_width()
+        view_h = self.canvas.winfo_height()
+        left = self.canvas.canvasx(0)
+        top = self.canvas.canvasy(0)
+        if not (left <= x <= left + view_w):
+            self.canvas.xview_moveto(max(0.0, (x - view_w / 2) / total_w))
+        if not (top <= y <= top + view_h):
+            self.canvas.yview_moveto(max(0.0, (y - view_h / 2) / total_h))
+    except Exception:
+        pass
+
+
+def _odmselector_prefetch_neighbours(self, index):
+    """次に巡回しそうな画像のプレビューをバックグラウンドで先読み"""
+    targets = []
+    nxt = _odmselector_nearest_unvisited(self, index)
+    if nxt is not None:
+        targets.append(nxt)
+    rank = self._annotation_rank + 1
+    if 0 <= rank < len(self._annotation_order):
+        targets.append(int(self._annotation_order[rank]))
+    cache = self._preview_cache
+    paths = []
+    for i in targets:
+        path = _odmselector_position_path(self, self.image_positions[i])
+        if path and path not in cache and path not in paths:
+            paths.append(path)
+    if not paths:
+        return
+
+    def worker():
+        for path in paths:
+            try:
+                img = _odm_load_preview_pil(path)
+            except Exception:
+                continue
+            if len(cache) >= ODM_PREVIEW_CACHE_LIMIT:
+                try:
+                    cache.pop(next(iter(cache)))
+                except (StopIteration, KeyError, RuntimeError):
+                    pass
+            cache[path] = img
+
+    threading.Thread(target=worker, daemon=True).start()
+
+
 ODMImageSelector.debug_log = _odmselector_debug_log
+ODMImageSelector.step_nearest_unvisited = _odmselector_step_nearest_unvisited
+ODMImageSelector.step_back = _odmselector_step_back
+ODMImageSelector.step_closest_to_annotation = _odmselector_step_closest_to_annotation
 ODMImageSelector.update_preview = _odmselector_update_preview
 ODMImageSelector.select_image_by_index = _odmselector_select_image_by_index
 ODMImageSelector.select_images_folder = _odmselector_select_images_folder
 ODMImageSelector._norm_key = _odmselector_norm_key
+ODMImageSelector.get_geo_index = _odmselector_get_geo_index
 ODMImageSelector.update_info = _odmselector_update_info
 ODMImageSelector.create_selector_window = _odmselector_create_selector_window
+ODMImageSelector.display_coverage_image = _odmselector_display_coverage_image
 
 # --- Robust WebODM asset loader (monkey patch) ---
 
+_GEO_FILENAME_RE = re.compile(r'([^\s,\"]+\.(?:jpg|jpeg|png|tif|tiff))', re.IGNORECASE)
+_GEO_NUMBER_RE = re.compile(r'[-+]?(?:\d*\.\d+|\d+)')
+
+
+def _odm_list_directory(folder):
+    """フォルダ直下のファイル名→フルパスの辞書を1回の os.scandir で取得
+
+    キーは os.path.normcase 済み（Windows では大小文字を区別しない os.path.exists と同じ照合になる）。
+    """
+    listing = {}
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                listing[os.path.normcase(entry.name)] = entry.path
+    except OSError:
+        pass
+    return listing
+
+
+def _odm_parse_georeferencing(geo_ref_path):
+    """座標ファイルを解析し、(ファイル名リスト, X配列, Y配列) を返す"""
+    fnames = []
+    xs = []
+    ys = []
+    with open(geo_ref_path, 'r', encoding='utf-8', errors='ignore') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            nums = _GEO_NUMBER_RE.findall(line)
+            if len(nums) < 2:
+                continue
+            try:
+                x, y = float(nums[0]), float(nums[1])
+            except ValueError:
+                continue
+            m = _GEO_FILENAME_RE.search(line)
+            fnames.append(m.group(1) if m else None)
+            xs.append(x)
+            ys.append(y)
+    return fnames, np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64)
+
+
+def _odm_world_to_pixel_array(gt, wx, wy):
+    """ワールド座標配列をピクセル座標配列へ一括変換（変換不能時は None）"""
+    A, B, D, E, C, F = gt['A'], gt['B'], gt['D'], gt['E'], gt['C'], gt['F']
+    # no rotation
+    if abs(B) < 1e-9 and abs(D) < 1e-9:
+        return (wx - C) / A, (F - wy) / abs(E)
+    det = A * E - B * D
+    if abs(det) < 1e-12:
+        return None
+    px = (E * (wx - C) - B * (wy - F)) / det
+    py = (-D * (wx - C) + A * (wy - F)) / det
+    return px, py
+
+
+def _odm_bbox_to_pixel_array(wx, wy, ortho_w, ortho_h):
+    """ワールドファイルが無い場合、座標範囲をオルソ画像サイズへ正規化（y軸反転）"""
+    if wx.size == 0:
+        return wx, wy
+    minx, maxx = wx.min(), wx.max()
+    miny, maxy = wy.min(), wy.max()
+    dx = max(maxx - minx, 1e-6)
+    dy = max(maxy - miny, 1e-6)
+    return (wx - minx) / dx * ortho_w, (maxy - wy) / dy * ortho_h
+
+
+def _odmselector_listed_path(self, folder, name):
+    """キャッシュ済みディレクトリ一覧からファイルパスを引く（一覧は初回のみ取得）"""
+    listings = getattr(self, '_dir_listings', None)
+    if listings is None:
+        listings = self._dir_listings = {}
+    if folder not in listings:
+        listings[folder] = _odm_list_directory(folder)
+    return listings[folder].get(os.path.normcase(name))
+
+
+def _odmselector_resolve_image_path(self, filename):
+    """座標ファイル記載のファイル名を実在する画像パスへ解決"""
+    if not filename:
+        return None
+    if os.path.isabs(filename):
+        return filename if os.path.exists(filename) else None
+    base_path = self.webodm_path
+    images_dir = os.path.join(base_path, 'images')
+    if os.path.basename(filename) == filename:
+        return (_odmselector_listed_path(self, base_path, filename)
+                or _odmselector_listed_path(self, images_dir, filename))
+    for c in (os.path.join(base_path, filename), os.path.join(images_dir, filename)):
+        if os.path.exists(c):
+            return c
+    return _odmselector_listed_path(self, images_dir, os.path.basename(filename))
+
+
+def _odmselector_position_path(self, pos):
+    """位置情報の画像パスを必要時に解決し、結果を位置情報へメモ化する"""
+    if not pos:
+        return None
+    if 'path' not in pos:
+        pos['path'] = _odmselector_resolve_image_path(self, pos.get('source'))
+    return pos['path']
+
+
 def load_webodm_assets_robust(self):
     """WebODMアセットを読み込み、座標情報を解析する（堅牢化版）"""
     import re
@@ -831,9 +1387,7 @@ def load_webodm_assets_robust(self):
             return None
 
         def read_world_file(raster_path):
-            base, _ = os.path.splitext(raster_path)
-            candidates = [base + '.tfw', base + '.wld']
-            for wf in candidates:
+            for wf in _odm_world_file_candidates(raster_path):
                 if os.path.exists(wf):
                     try:
                         with open(wf, 'r') as f:
@@ -851,50 +1405,6 @@ def load_webodm_assets_robust(self):
                         pass
             return None
 
-        def world_to_pixel(gt, x, y):
-            if not gt:
-                return None
-            A, B, D, E, C, F = gt['A'], gt['B'], gt['D'], gt['E'], gt['C'], gt['F']
-            # no rotation
-            if abs(B) < 1e-9 and abs(D) < 1e-9:
-                px = (x - C) / A
-                py = (F - y) / abs(E)
-                return px, py
-            det = A * E - B * D
-            if abs(det) < 1e-12:
-                return None
-            px = (E * (x - C) - B * (y - F)) / det
-            py = (-D * (x - C) + A * (y - F)) / det
-            return px, py
-
-        def extract_filename_and_xy(line):
-            # filename
-            m = re.search(r'([^\s,\"]+\.(?:jpg|jpeg|png|tif|tiff))', line, re.IGNORECASE)
-            fname = m.group(1) if m else None
-            # numbers
-            nums = re.findall(r'[-+]?(?:\d*\.\d+|\d+)', line)
-            if len(nums) >= 2:
-                try:
-                    return fname, float(nums[0]), float(nums[1])
-                except Exception:
-                    return fname, None, None
-            return fname, None, None
-
-        def resolve_image_path(base_path, filename):
-            if not filename:
-                return None
-            candidates = []
-            if os.path.isabs(filename):
-                candidates.append(filename)
-            else:
-                candidates.append(os.path.join(base_path, filename))
-                candidates.append(os.path.join(base_path, 'images', filename))
-                candidates.append(os.path.join(base_path, 'images', os.path.basename(filename)))
-            for c in candidates:
-                if os.path.exists(c):
-                    return c
-            return None
-
         # 1) オルソ画像
         ortho_candidates = [
             os.path.join(self.webodm_path, 'odm_orthophoto', 'odm_orthophoto.tif'),
@@ -1074,41 +1584,34 @@ def load_webodm_assets_robust(self):
         if not geo_ref_path:
             raise FileNotFoundError(os.path.join(self.webodm_path, 'odm_georeferencing', 'odm_georeferencing_model_geo.txt'))
 
-        # 5) ファイル読込とXY抽出
-        raw_positions = []
-        with open(geo_ref_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                fname, x, y = extract_filename_and_xy(line)
-                if x is None or y is None:
-                    continue
-                img_path = resolve_image_path(self.webodm_path, fname) if fname else None
-                raw_positions.append({'filename': os.path.basename(fname) if fname else '', 'path': img_path, 'wx': x, 'wy': y})
+        # 5) ファイル読込とXY抽出（NumPy配列化）
+        fnames, wx, wy = _odm_parse_georeferencing(geo_ref_path)
 
-        # 6) ピクセル座標へ
+        # 6) ピクセル座標へ（アフィン変換／範囲正規化を一括適用）
+        # 画像パスはここでは解決せず、選択・プレビュー時に遅延解決する
         self.image_positions = []
+        self._dir_listings = {}
         ortho_w, ortho_h = self.ortho_image_size
         if geotransform:
-            for p in raw_positions:
-                res = world_to_pixel(geotransform, p['wx'], p['wy'])
-                if not res:
-                    continue
-                px, py = res
-                self.image_positions.append({'filename': p['filename'], 'path': p['path'], 'x': float(px), 'y': float(py)})
+            pixels = _odm_world_to_pixel_array(geotransform, wx, wy)
         else:
-            xs = [p['wx'] for p in raw_positions]
-            ys = [p['wy'] for p in raw_positions]
-            if xs and ys:
-                minx, maxx = min(xs), max(xs)
-                miny, maxy = min(ys), max(ys)
-                dx = max(maxx - minx, 1e-6)
-                dy = max(maxy - miny, 1e-6)
-                for p in raw_positions:
-                    px = (p['wx'] - minx) / dx * ortho_w
-                    py = (maxy - p['wy']) / dy * ortho_h  # y軸反転
-                    self.image_positions.append({'filename': p['filename'], 'path': p['path'], 'x': float(px), 'y': float(py)})
+            pixels = _odm_bbox_to_pixel_array(wx, wy, ortho_w, ortho_h)
+        if pixels is not None:
+            px_list = pixels[0].tolist()
+            py_list = pixels[1].tolist()
+            for fname, px, py in zip(fnames, px_list, py_list):
+                self.image_positions.append({
+                    'filename': os.path.basename(fname) if fname else '',
+                    'source': fname,
+                    'x': px,
+                    'y': py,
+                })
+        # ワールドファイルは候補すべてを監視（編集・新規作成のどちらでも作り直す）
+        self._geo_index = _odm_register_geo_index(
+            self.webodm_path,
+            (geo_ref_path, self.ortho_path, *_odm_world_file_candidates(self.ortho_path)),
+            self.image_positions
+        )
 
         # 7) 表示
         self.display_coverage_image()
@@ -1123,6 +1626,7 @@ def load_webodm_assets_robust(self):
 
 # 既存メソッドを差し替え
 ODMImageSelector.load_webodm_assets = load_webodm_assets_robust
+ODMImageSelector.position_path = _odmselector_position_path
 
 try:
     from openpyxl import load_workbook, Workbook
@@ -1146,6 +1650,650 @@ def normalize_management_level(value):
     v = str(value).upper().strip()
     return v if v in MANAGEMENT_LEVELS else 'S'
 
+
+def open_image_reduced(path, target_size=None, mode="RGBA", with_original_size=False):
+    """表示用に画像を開く（JPEGは目標サイズ以上となる最小の1/2^n縮小でDCTデコード）"""
+    with Image.open(path) as img:
+        # draft 前のサイズが元画像の寸法
+        original_size = img.size
+        if target_size:
+            try:
+                img.draft(None, (max(1, int(target_size[0])), max(1, int(target_size[1]))))
+            except Exception:
+                pass
+        img.load()
+        if mode and img.mode != mode:
+            result = img.convert(mode)
+        else:
+            result = img.copy()
+    if with_original_size:
+        return result, original_size
+    return result
+
+
+class ImageMemoryCache:
+    """バイト数上限付きのLRUキャッシュ（PIL画像・PhotoImage 用、ヒット／ミス回数を記録）"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (value, nbytes)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def estimate_bytes(value):
+        if isinstance(value, tuple):
+            return sum(ImageMemoryCache.estimate_bytes(v) for v in value)
+        if isinstance(value, Image.Image):
+            return value.width * value.height * len(value.getbands())
+        if isinstance(value, (ImageTk.PhotoImage, tk.PhotoImage)):
+            try:
+                return value.width() * value.height() * 4
+            except Exception:
+                return 0
+        return 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, nbytes=None):
+        if nbytes is None:
+            nbytes = self.estimate_bytes(value)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = (value, nbytes)
+            self.current_bytes += nbytes
+            while self.current_bytes > self.max_bytes and self._entries:
+                _key, (_value, size) = self._entries.popitem(last=False)
+                self.current_bytes -= size
+                self.evictions += 1
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return default
+            self.current_bytes -= entry[1]
+            return entry[0]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits / total) if total else 0.0,
+        }
+
+
+class ThumbnailDiskCache:
+    """サムネイルのディスクキャッシュ（パス・サイズ・更新時刻・サムネイル寸法をキーとする内容アドレス方式）"""
+
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+    def __init__(self, root, max_bytes=DEFAULT_MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._total_bytes = None
+        self._lock = threading.Lock()
+
+    def key_for(self, path, thumb_size):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        raw = f"{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}|{thumb_size[0]}x{thumb_size[1]}"
+        return hashlib.sha1(raw.encode("utf-8", "surrogatepass")).hexdigest()
+
+    def _entry_paths(self, key):
+        folder = self.root / key[:2]
+        return folder / f"{key}.jpg", folder / f"{key}.png"
+
+    def get(self, path, thumb_size):
+        """キャッシュ済みサムネイルを返す（無ければ None）。読み込んだエントリは最終利用時刻を更新"""
+        key = self.key_for(path, thumb_size)
+        if not key:
+            return None
+        for entry in self._entry_paths(key):
+            try:
+                with Image.open(entry) as img:
+                    img.load()
+                    result = img.convert("RGBA")
+            except (OSError, ValueError):
+                continue
+            try:
+                os.utime(entry, None)
+            except OSError:
+                pass
+            return result
+        return None
+
+    def put(self, path, thumb_size, image):
+        """サムネイルを書き込み、容量上限を超えた場合は古いものから削除"""
+        key = self.key_for(path, thumb_size)
+        if not key:
+            return
+        jpg_path, png_path = self._entry_paths(key)
+        has_alpha = image.mode == "RGBA" and image.getextrema()[3][0] < 255
+        target = png_path if has_alpha else jpg_path
+        tmp_path = target.with_name(f"{target.name}.{threading.get_ident()}.tmp")
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if has_alpha:
+                image.save(tmp_path, "PNG")
+            else:
+                image.convert("RGB").save(tmp_path, "JPEG", quality=90)
+            os.replace(tmp_path, target)
+            written = target.stat().st_size
+        except (OSError, ValueError):
+            # キャッシュへの書き込み失敗は呼び出し側のサムネイルに影響させない
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total_bytes()
+            else:
+                self._total_bytes += written
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _iter_entries(self):
+        try:
+            with os.scandir(self.root) as shards:
+                for shard in shards:
+                    if not shard.is_dir():
+                        continue
+                    with os.scandir(shard.path) as entries:
+                        for entry in entries:
+                            if entry.is_file() and not entry.name.endswith(".tmp"):
+                                yield entry
+        except OSError:
+            return
+
+    def _scan_total_bytes(self):
+        total = 0
+        for entry in self._iter_entries():
+            try:
+                total += entry.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def _evict(self):
+        """最終利用時刻の古い順に削除し、上限の 90% まで減らす"""
+        entries = []
+        for entry in self._iter_entries():
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, entry.path))
+        entries.sort()
+        total = sum(size for _mtime, size, _path in entries)
+        limit = int(self.max_bytes * 0.9)
+        for _mtime, size, entry_path in entries:
+            if total <= limit:
+                break
+            try:
+                os.remove(entry_path)
+                total -= size
+            except OSError:
+                pass
+        self._total_bytes = total
+
+
+def _read_tiff_ifd(data, offset, endian):
+    """TIFF形式のIFDを読み、{タグ: (型, 個数, 値フィールド4バイト)} と次IFDオフセットを返す"""
+    count = struct.unpack_from(endian + "H", data, offset)[0]
+    entries = {}
+    pos = offset + 2
+    for _ in range(count):
+        tag, typ, cnt = struct.unpack_from(endian + "HHI", data, pos)
+        entries[tag] = (typ, cnt, data[pos + 8:pos + 12])
+        pos += 12
+    next_offset = struct.unpack_from(endian + "I", data, pos)[0] if pos + 4 <= len(data) else 0
+    return entries, next_offset
+
+
+def _tiff_endian(data):
+    if data[:2] == b"II":
+        return "<"
+    if data[:2] == b"MM":
+        return ">"
+    return None
+
+
+def find_embedded_jpeg_images(path):
+    """JPEG内に埋め込まれた縮小画像（EXIFサムネイル・MPFプレビュー）の (先頭位置, バイト長) 一覧"""
+    found = []
+    with open(path, "rb") as f:
+        for code, seg_start, size in iter_jpeg_segments(f):
+            if code not in (0xE1, 0xE2):
+                continue
+            data = f.read(size)
+            try:
+                if code == 0xE1 and data[:6] == b"Exif\x00\x00":
+                    found.extend(_exif_thumbnail_location(data[6:], seg_start + 6))
+                elif code == 0xE2 and data[:4] == b"MPF\x00":
+                    found.extend(_mpf_image_locations(data[4:], seg_start + 4))
+            except (struct.error, IndexError):
+                pass
+    return found
+
+
+def _exif_thumbnail_location(tiff, tiff_base):
+    endian = _tiff_endian(tiff)
+    if not endian:
+        return []
+    ifd0 = struct.unpack_from(endian + "I", tiff, 4)[0]
+    _entries, ifd1 = _read_tiff_ifd(tiff, ifd0, endian)
+    if not ifd1 or ifd1 >= len(tiff):
+        return []
+    entries, _next = _read_tiff_ifd(tiff, ifd1, endian)
+    if 0x0201 not in entries or 0x0202 not in entries:
+        return []
+    offset = struct.unpack(endian + "I", entries[0x0201][2])[0]
+    length = struct.unpack(endian + "I", entries[0x0202][2])[0]
+    if not length:
+        return []
+    return [(tiff_base + offset, length)]
+
+
+def _mpf_image_locations(tiff, tiff_base):
+    endian = _tiff_endian(tiff)
+    if not endian:
+        return []
+    ifd = struct.unpack_from(endian + "I", tiff, 4)[0]
+    entries, _next = _read_tiff_ifd(tiff, ifd, endian)
+    if 0xB002 not in entries:
+        return []
+    _typ, count, value = entries[0xB002]
+    table = struct.unpack(endian + "I", value)[0]
+    result = []
+    for i in range(count // 16):
+        _attr, size, offset, _dep1, _dep2 = struct.unpack_from(endian + "IIIHH", tiff, table + i * 16)
+        # オフセット0は主画像そのもの
+        if offset and size:
+            result.append((tiff_base + offset, size))
+    return result
+
+
+def open_embedded_preview(path, target_size):
+    """埋め込み縮小画像のうち、目標サイズ（縮小表示時の実寸）を満たす最小のものを開く（無ければ None）"""
+    try:
+        with Image.open(path) as img:
+            if img.format not in ("JPEG", "MPO"):
+                return None
+            orig_w, orig_h = img.size
+        locations = find_embedded_jpeg_images(path)
+    except (OSError, ValueError, struct.error):
+        return None
+    if not locations:
+        return None
+    fit = min(1.0, target_size[0] / orig_w, target_size[1] / orig_h)
+    need_w, need_h = orig_w * fit * 0.98, orig_h * fit * 0.98
+    aspect = orig_w / float(orig_h)
+    best = None
+    with open(path, "rb") as f:
+        for offset, length in locations:
+            try:
+                f.seek(offset)
+                data = f.read(length)
+                candidate = Image.open(BytesIO(data))
+                w, h = candidate.size
+            except (OSError, ValueError):
+                continue
+            if w < need_w or h < need_h or abs(w / float(h) - aspect) > 0.02:
+                continue
+            if best is None or w * h < best[0]:
+                best = (w * h, data)
+    if best is None:
+        return None
+    return open_image_reduced(BytesIO(best[1]), target_size)
+
+
+class ThermalStatsIndex:
+    """サーモ画像の温度統計インデックス（パス→統計）。ファイルの mtime が変われば再解析対象
+
+    生データの温度（℃）とパレット輝度のスコアは比較できないため、並び替えでは別枠に分ける。
+    """
+
+    BATCH_CHUNK = 16
+
+    def __init__(self, store_path=None):
+        self.store_path = Path(store_path) if store_path else None
+        self._entries = {}
+        self._dirty = False
+        self.version = 0
+        self._executor = None
+        self._futures = []
+        self._batch_total = 0
+        self._batch_done = 0
+        self._batch_analyzed = 0
+        self.load()
+
+    def load(self):
+        if not self.store_path or not self.store_path.exists():
+            return
+        try:
+            with open(self.store_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict):
+            # パレット画像を℃換算していた旧形式の結果は読み込まず、解析し直す
+            self._entries = {k: v for k, v in data.items() if self.is_valid_entry(v)}
+
+    @staticmethod
+    def is_valid_entry(stats):
+        if not isinstance(stats, dict):
+            return False
+        if stats.get("source") == "radiometric":
+            return "max" in stats
+        return stats.get("source") == "palette" and "score_max" in stats
+
+    @staticmethod
+    def peak_temperature(stats):
+        """生データから換算した最高温度（℃）。パレット画像・未解析は None"""
+        if stats and stats.get("source") == "radiometric":
+            return stats["max"]
+        return None
+
+    @staticmethod
+    def peak_rank_key(stats, descending=True):
+        """最高温度順の並びキー: 生データの温度 → パレット輝度スコア → 未解析 の順に別枠で並べる"""
+        sign = -1.0 if descending else 1.0
+        if stats is None:
+            return (2, 0.0)
+        if stats.get("source") == "radiometric":
+            return (0, sign * stats["max"])
+        return (1, sign * stats["score_max"])
+
+    def save(self):
+        if not self._dirty or not self.store_path:
+            return
+        try:
+            self.store_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.store_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            self._dirty = False
+        except OSError as e:
+            print(f"温度解析結果の保存に失敗しました: {e}")
+
+    def get(self, path):
+        return self._entries.get(str(path))
+
+    def update(self, path, stats):
+        """解析結果を登録（stats["mtime"] はワーカーが解析時に取得した値）"""
+        self._entries[str(path)] = stats
+        self._dirty = True
+        self.version += 1
+
+    def is_running(self):
+        return bool(self._futures)
+
+    def progress(self):
+        return self._batch_done, self._batch_total
+
+    def analyzed_count(self):
+        """今回のバッチで新たに解析した件数（更新の無い画像は含まない）"""
+        return self._batch_analyzed
+
+    def start_batch(self, paths, workers=None):
+        """一覧をプロセスプールへ投入。更新有無の確認（os.stat）もワーカー側で行う。投入件数を返す"""
+        self.cancel_batch()
+        targets = [(str(p), (self._entries.get(str(p)) or {}).get("mtime")) for p in paths]
+        self._batch_total = len(targets)
+        self._batch_done = 0
+        self._batch_analyzed = 0
+        if not targets:
+            return 0
+        self._executor = ProcessPoolExecutor(max_workers=workers)
+        self._futures = []
+        for i in range(0, len(targets), self.BATCH_CHUNK):
+            chunk = targets[i:i + self.BATCH_CHUNK]
+            self._futures.append((self._executor.submit(compute_thermal_stats_batch, chunk), len(chunk)))
+        return len(targets)
+
+    def collect(self):
+        """完了分をインデックスへ取り込み、取り込んだ件数を返す"""
+        merged = 0
+        pending = []
+        for future, count in self._futures:
+            if not future.done():
+                pending.append((future, count))
+                continue
+            try:
+                results = future.result()
+            except Exception:
+                results = []
+            for path, stats in results:
+                if stats is not None:
+                    self.update(path, stats)
+                    merged += 1
+            self._batch_done += count
+        self._batch_analyzed += merged
+        self._futures = pending
+        if not pending and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        return merged
+
+    def cancel_batch(self):
+        for future, _count in self._futures:
+            future.cancel()
+        self._futures = []
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+# フォルダ単位のサーモ画像一覧キャッシュ（フォルダの mtime で無効化）
+_THERMAL_LISTING_CACHE = {}
+
+
+class VisibleCounterpartIndex:
+    """可視画像フォルダを1回だけ走査して作る サーモ画像→可視画像 の対応表"""
+
+    # 可視側の末尾識別子（V: 通常、W: 広角カメラ）。先頭ほど優先
+    VISIBLE_MARKERS = ("V", "W")
+
+    def __init__(self, visible_dir, image_exts):
+        self.visible_dir = Path(visible_dir)
+        self.by_name = {}
+        self.by_key = {}
+        try:
+            with os.scandir(self.visible_dir) as it:
+                for entry in it:
+                    try:
+                        if not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
+                    stem, ext = os.path.splitext(entry.name)
+                    if ext.lower() not in image_exts:
+                        continue
+                    path = Path(entry.path)
+                    self.by_name[entry.name.lower()] = path
+                    marker = stem[-1:].upper()
+                    if marker in self.VISIBLE_MARKERS:
+                        rank = self.VISIBLE_MARKERS.index(marker)
+                        key = self.pair_key(stem)
+                        current = self.by_key.get(key)
+                        if current is None or rank < current[0]:
+                            self.by_key[key] = (rank, path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def pair_key(stem):
+        """末尾の T/V/W 識別子と区切り文字を除いた小文字の照合キー"""
+        return stem[:-1].rstrip("_- ").lower()
+
+    def lookup(self, thermal_path: Path):
+        stem = thermal_path.stem
+        if not stem or stem[-1].upper() != "T":
+            return None
+        # 同名（末尾 T→V・同じ拡張子）を優先し、次に大小文字・拡張子・区切りの揺れを許容
+        exact = self.by_name.get(f"{stem[:-1]}V{thermal_path.suffix}".lower())
+        if exact is not None:
+            return exact
+        entry = self.by_key.get(self.pair_key(stem))
+        return entry[1] if entry else None
+
+
+def read_capture_metadata(path):
+    """EXIF から撮影日時（"YYYY:MM:DD HH:MM:SS"）と (緯度, 経度) を取得（無い項目は None）"""
+    try:
+        with Image.open(path) as img:
+            exif = img.getexif()
+            exif_ifd = exif.get_ifd(0x8769)
+            gps_ifd = exif.get_ifd(0x8825)
+    except (OSError, ValueError, KeyError):
+        return None, None
+    capture_time = exif_ifd.get(0x9003) or exif.get(0x0132)
+    capture_time = str(capture_time).strip("\x00 ") if capture_time else None
+    gps = None
+    try:
+        lat_dms, lon_dms = gps_ifd.get(2), gps_ifd.get(4)
+        if lat_dms and lon_dms:
+            lat = float(lat_dms[0]) + float(lat_dms[1]) / 60 + float(lat_dms[2]) / 3600
+            lon = float(lon_dms[0]) + float(lon_dms[1]) / 60 + float(lon_dms[2]) / 3600
+            if gps_ifd.get(1) == "S":
+                lat = -lat
+            if gps_ifd.get(3) == "W":
+                lon = -lon
+            gps = (lat, lon)
+    except (TypeError, ValueError, IndexError, ZeroDivisionError):
+        gps = None
+    return capture_time or None, gps
+
+
+class ThermalFileIndex:
+    """サーモ画像一覧の検索・並び替え用インデックス（ファイル名・撮影日時・GPS・可視画像の有無）"""
+
+    def __init__(self):
+        self.records = {}
+        self._sorted_names = []
+        self._names_key = None
+        self.metadata_version = 0
+        self.metadata_loaded = 0
+        self.metadata_total = 0
+
+    def sync(self, paths, counterpart_index, generation):
+        """一覧のレコードを用意する。可視画像の有無は対応表が替わった時だけ引き直す
+
+        generation は一覧を差し替えるたびに進む番号。変わった時は一覧に無いレコードを捨てる。
+        """
+        if generation != self._names_key:
+            listed = set(paths)
+            if any(p not in listed for p in self.records):
+                self.records = {p: r for p, r in self.records.items() if p in listed}
+        records = self.records
+        for path in paths:
+            record = records.get(path)
+            if record is None:
+                record = {"lower": path.name.lower(), "time": None, "gps": None, "meta": False,
+                          "paired": False, "pair_source": None}
+                records[path] = record
+            if record["pair_source"] is not counterpart_index:
+                try:
+                    record["paired"] = counterpart_index.lookup(path) is not None
+                except Exception:
+                    record["paired"] = False
+                record["pair_source"] = counterpart_index
+        if generation != self._names_key:
+            # 前方一致検索用に (小文字名, パス) の昇順リストを保持
+            self._sorted_names = sorted((records[p]["lower"], p) for p in paths)
+            self._names_key = generation
+
+    def search(self, paths, text, mode="substring"):
+        """ファイル名検索（mode: "prefix" は前方一致、それ以外は部分一致）。元の順序を保つ"""
+        if not text:
+            return list(paths)
+        needle = text.lower()
+        if mode == "prefix":
+            names = self._sorted_names
+            hits = set()
+            for i in range(bisect.bisect_left(names, (needle,)), len(names)):
+                name, path = names[i]
+                if not name.startswith(needle):
+                    break
+                hits.add(path)
+            return [p for p in paths if p in hits]
+        records = self.records
+        return [p for p in paths if needle in records[p]["lower"]]
+
+    def filter_paired(self, paths, paired):
+        records = self.records
+        return [p for p in paths if records[p]["paired"] == paired]
+
+    def sort_key(self, mode):
+        """並び替えキー。値の無い画像は末尾にまとめる"""
+        records = self.records
+        if mode == "time":
+            return lambda p: (records[p]["time"] is None, records[p]["time"] or "", records[p]["lower"])
+        if mode == "gps":
+            # 北から南、同緯度は西から東
+            return lambda p: ((1, 0.0, 0.0) if records[p]["gps"] is None
+                              else (0, -records[p]["gps"][0], records[p]["gps"][1]))
+        if mode == "paired":
+            return lambda p: (not records[p]["paired"], records[p]["lower"])
+        return lambda p: records[p]["lower"]
+
+    def missing_metadata(self, paths):
+        return [p for p in paths if not self.records[p]["meta"]]
+
+    def load_metadata(self, paths, cancel_event):
+        """撮影日時・GPS をバックグラウンドで読み込む（完了時に metadata_version を進める）"""
+        self.metadata_loaded = 0
+        self.metadata_total = len(paths)
+        for path in paths:
+            if cancel_event.is_set():
+                return
+            capture_time, gps = read_capture_metadata(path)
+            record = self.records.get(path)
+            if record is None:
+                # 読み込み中にフォルダが替わり、レコードが破棄された
+                continue
+            record["time"] = capture_time
+            record["gps"] = gps
+            record["meta"] = True
+            self.metadata_loaded += 1
+        self.metadata_version += 1
+
+
 class ThermalVisibleFileDialog:
     """サーモ画像と可視画像を同時に選択するカスタムダイアログ"""
 
@@ -1154,6 +2302,40 @@ class ThermalVisibleFileDialog:
     PREVIEW_BASE_SIZE = (1000, 650)
     PREVIEW_MIN_ZOOM = 0.25
     PREVIEW_MAX_ZOOM = 3.0
+    THUMBNAIL_WORKERS = 3
+    THUMBNAIL_CACHE_BYTES = 256 * 1024 * 1024
+    PREFETCH_THUMBNAIL_BYTES = 64 * 1024 * 1024
+    PREFETCH_NEIGHBOURS = 2
+    PREFETCH_DELAY_MS = 200
+    DIR_SCAN_CHUNK = 2000
+    PREVIEW_BASE_CACHE_BYTES = 384 * 1024 * 1024
+    THUMBNAIL_CELL_PADDING = 10
+    THUMBNAIL_LABEL_HEIGHT = 40
+    THUMBNAIL_ROW_BUFFER = 2
+    PAGE_SIZE_ALL_LABEL = "全件"
+    THUMBNAIL_POLL_MS = 40
+    STATS_POLL_MS = 300
+    SORT_OPTIONS = (
+        ("name", "ファイル名"),
+        ("time", "撮影日時"),
+        ("gps", "GPS（北→南）"),
+        ("paired", "可視画像ありを先頭"),
+        ("peak_desc", "推定最高温度（高い順・輝度のみの画像は後）"),
+        ("peak_asc", "推定最高温度（低い順・輝度のみの画像は後）"),
+    )
+    SEARCH_MODES = (("substring", "部分一致"), ("prefix", "前方一致"))
+    PAIR_FILTERS = ((None, "すべて"), (True, "可視画像あり"), (False, "可視画像なし"))
+    SEARCH_DELAY_MS = 250
+
+    @property
+    def files_in_current_dir(self):
+        return self._files_in_current_dir
+
+    @files_in_current_dir.setter
+    def files_in_current_dir(self, files):
+        # 一覧を差し替えるたびに世代を進め、絞り込み結果・検索インデックスのキャッシュを無効化する
+        self._files_in_current_dir = files
+        self._files_generation = getattr(self, "_files_generation", 0) + 1
 
     def __init__(self, parent, initial_dir=None, title="サーモ画像同時選択"):
         self.parent = parent
@@ -1162,16 +2344,64 @@ class ThermalVisibleFileDialog:
         self.visible_photo = None
         self.display_mode = "list"
         self.files_in_current_dir = []
-        self.thumbnail_cache = {}
+        self.thumbnail_cache = ImageMemoryCache(self.THUMBNAIL_CACHE_BYTES)
+        self.preview_base_cache = ImageMemoryCache(self.PREVIEW_BASE_CACHE_BYTES)
+        self.prefetched_thumbnails = ImageMemoryCache(self.PREFETCH_THUMBNAIL_BYTES)
+        self._prefetch_queue = queue.Queue()
+        self._prefetch_generation = 0
+        self._prefetch_thread = None
+        self._prefetch_job = None
+        self._last_preview_sizes = {}
+        self._counterpart_indexes = {}
+        self._dir_scan = None
+        self._dir_scan_job = None
         self.thumbnail_buttons = {}
+        self.thumbnail_rows = {}
+        self.thumbnail_files = []
+        self._thumbnail_slots = {}
+        self._thumbnail_free_slots = []
+        self._thumbnail_view_job = None
+        self._thumbnail_placeholder = None
+        self._thumbnail_queue = queue.PriorityQueue()
+        self._thumbnail_results = queue.Queue()
+        self._thumbnail_pending = {}
+        self._thumbnail_active = 0
+        self._thumbnail_inflight = {}  # 生成中の path -> 世代
+        self._thumbnail_lock = threading.Lock()
+        self._thumbnail_generation = 0
+        self._thumbnail_sequence = itertools.count()
+        self._thumbnail_workers = []
+        self._thumbnail_poll_job = None
+        self._thumbnail_reprioritize_job = None
         self.thumbnail_columns = 3
         self.selected_file = None
         self._suppress_listbox_event = False
         self.preview_zoom = 1.0
         self._preview_refresh_job = None
+        self._preview_sources = {}
+        self._preview_pyramids = {}
+        self._deferred_previews = set()
+        self._deferred_preview_job = None
         self._updating_zoom_var = False
 
         self.layout_config_path = Path.home() / ".ortho_annotation_system_v7" / "layout.json"
+        self.thumbnail_disk_cache = ThumbnailDiskCache(self.layout_config_path.parent / "thumbnails")
+        self.thermal_stats = ThermalStatsIndex(self.layout_config_path.parent / "thermal_stats.json")
+        self._stats_poll_job = None
+        self.sort_mode = "name"
+        self.min_peak_temp = None
+        self._view_files_key = None
+        self._view_files = []
+        self._view_stats_version = self.thermal_stats.version
+        self.file_index = ThermalFileIndex()
+        self.search_text = ""
+        self.search_mode = "substring"
+        self.pair_filter = None
+        self._search_job = None
+        self._metadata_thread = None
+        self._metadata_cancel = threading.Event()
+        self._metadata_poll_job = None
+        self._view_metadata_version = 0
         self.layout_preferences = {"main_ratio": 0.5, "preview_ratio": 1.0}
         self.load_layout_preferences()
         self.zoom_options = [
@@ -1183,7 +2413,7 @@ class ThermalVisibleFileDialog:
             ("200%", 2.0),
             ("300%", 3.0),
         ]
-        self.page_size_options = [10, 50, 500, 400]
+        self.page_size_options = [10, 50, 500, 400, 0]
         self.page_size = 100
         self.current_page = 1
 
@@ -1234,13 +2464,13 @@ class ThermalVisibleFileDialog:
         pagination_frame = ttk.Frame(self.window)
         pagination_frame.pack(fill=tk.X, padx=10, pady=(0, 8))
         ttk.Label(pagination_frame, text="表示件数:").pack(side=tk.LEFT)
-        self.page_size_var = tk.StringVar(value=str(self.page_size))
+        self.page_size_var = tk.StringVar(value=self.get_page_size_label(self.page_size))
         self.page_size_combo = ttk.Combobox(
             pagination_frame,
             textvariable=self.page_size_var,
             state="readonly",
             width=5,
-            values=[str(v) for v in self.page_size_options]
+            values=[self.get_page_size_label(v) for v in self.page_size_options]
         )
         self.page_size_combo.pack(side=tk.LEFT, padx=(5, 10))
         self.page_size_combo.bind("<<ComboboxSelected>>", self.on_page_size_change)
@@ -1252,11 +2482,70 @@ class ThermalVisibleFileDialog:
         self.page_info_var = tk.StringVar(value="")
         ttk.Label(pagination_frame, textvariable=self.page_info_var).pack(side=tk.LEFT)
 
+        filter_frame = ttk.Frame(self.window)
+        filter_frame.pack(fill=tk.X, padx=10, pady=(0, 8))
+        ttk.Label(filter_frame, text="検索:").pack(side=tk.LEFT)
+        self.search_var = tk.StringVar(value="")
+        self.search_var.trace_add("write", lambda *_: self.schedule_search())
+        ttk.Entry(filter_frame, textvariable=self.search_var, width=24).pack(side=tk.LEFT, padx=(5, 5))
+        self.search_mode_var = tk.StringVar(value=self.SEARCH_MODES[0][1])
+        search_mode_combo = ttk.Combobox(
+            filter_frame,
+            textvariable=self.search_mode_var,
+            state="readonly",
+            width=8,
+            values=[label for _, label in self.SEARCH_MODES]
+        )
+        search_mode_combo.pack(side=tk.LEFT)
+        search_mode_combo.bind("<<ComboboxSelected>>", lambda _evt: self.apply_search())
+        ttk.Label(filter_frame, text="可視画像:").pack(side=tk.LEFT, padx=(10, 5))
+        self.pair_filter_var = tk.StringVar(value=self.PAIR_FILTERS[0][1])
+        pair_combo = ttk.Combobox(
+            filter_frame,
+            textvariable=self.pair_filter_var,
+            state="readonly",
+            width=12,
+            values=[label for _, label in self.PAIR_FILTERS]
+        )
+        pair_combo.pack(side=tk.LEFT)
+        pair_combo.bind("<<ComboboxSelected>>", self.on_pair_filter_change)
+
+        stats_frame = ttk.Frame(self.window)
+        stats_frame.pack(fill=tk.X, padx=10, pady=(0, 8))
+        self.stats_button = ttk.Button(stats_frame, text="温度解析", command=self.start_thermal_analysis)
+        self.stats_button.pack(side=tk.LEFT)
+        ttk.Label(stats_frame, text="並び順:").pack(side=tk.LEFT, padx=(10, 5))
+        self.sort_var = tk.StringVar(value=self.SORT_OPTIONS[0][1])
+        sort_combo = ttk.Combobox(
+            stats_frame,
+            textvariable=self.sort_var,
+            state="readonly",
+            width=34,
+            values=[label for _, label in self.SORT_OPTIONS]
+        )
+        sort_combo.pack(side=tk.LEFT)
+        sort_combo.bind("<<ComboboxSelected>>", self.on_sort_change)
+        ttk.Label(stats_frame, text="推定最高温度 ≥").pack(side=tk.LEFT, padx=(10, 5))
+        self.min_peak_var = tk.StringVar(value="")
+        min_peak_entry = ttk.Entry(stats_frame, textvariable=self.min_peak_var, width=6)
+        min_peak_entry.pack(side=tk.LEFT)
+        min_peak_entry.bind("<Return>", self.on_temperature_filter_change)
+        min_peak_entry.bind("<FocusOut>", self.on_temperature_filter_change)
+        ttk.Label(stats_frame, text="℃").pack(side=tk.LEFT, padx=(2, 10))
+        # 温度の条件は生データのある画像だけが対象（パレット画像は温度に換算しない）
+        ttk.Label(
+            stats_frame,
+            text=f"※温度は{RADIOMETRIC_SCALE_NOTE}。生データの無い画像は輝度スコア（0〜100）で表示し、温度条件の指定中は表示しない",
+            foreground="#666666",
+        ).pack(side=tk.LEFT, padx=(0, 10))
+        self.stats_status_var = tk.StringVar(value="")
+        ttk.Label(stats_frame, textvariable=self.stats_status_var, foreground="#666666").pack(side=tk.LEFT)
+
         self.main_paned = ttk.Panedwindow(self.window, orient=tk.HORIZONTAL)
         self.main_paned.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
         self.main_paned.bind("<ButtonRelease-1>", lambda _evt: self.schedule_preview_refresh())
 
-        list_frame = ttk.LabelFrame(self.main_paned, text="サーモ画像ファイル")
+        list_frame = ttk.LabelFrame(self.main_paned, text="サーモ画像ファイル（●: 可視画像あり）")
         self.main_paned.add(list_frame, weight=1)
         self.list_container = ttk.Frame(list_frame)
         self.list_container.pack(fill=tk.BOTH, expand=True)
@@ -1277,14 +2566,9 @@ class ThermalVisibleFileDialog:
             self.thumbnail_frame, orient=tk.VERTICAL, command=self.thumbnail_canvas.yview
         )
         self.thumbnail_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.thumbnail_canvas.configure(yscrollcommand=self.thumbnail_scrollbar.set)
-        self.thumbnail_inner = ttk.Frame(self.thumbnail_canvas)
-        self.thumbnail_window = self.thumbnail_canvas.create_window((0, 0), window=self.thumbnail_inner, anchor="nw")
-        self.thumbnail_inner.bind(
-            "<Configure>",
-            lambda _: self.thumbnail_canvas.configure(scrollregion=self.thumbnail_canvas.bbox("all"))
-        )
+        self.thumbnail_canvas.configure(yscrollcommand=self._on_thumbnail_yscroll)
         self.thumbnail_canvas.bind("<Configure>", self._on_thumbnail_canvas_configure)
+        self.thumbnail_canvas.bind("<MouseWheel>", self._on_thumbnail_mousewheel)
         self.thumbnail_frame.pack_forget()
 
         preview_wrapper = ttk.Frame(self.main_paned)
@@ -1305,7 +2589,8 @@ class ThermalVisibleFileDialog:
         self.preview_canvas.grid(row=0, column=0, sticky="nsew")
         preview_scrollbar = ttk.Scrollbar(preview_container, orient=tk.VERTICAL, command=self.preview_canvas.yview)
         preview_scrollbar.grid(row=0, column=1, sticky="ns")
-        self.preview_canvas.configure(yscrollcommand=preview_scrollbar.set)
+        self.preview_scrollbar = preview_scrollbar
+        self.preview_canvas.configure(yscrollcommand=self._on_preview_yscroll)
 
         self.preview_inner = ttk.Frame(self.preview_canvas)
         self.preview_window = self.preview_canvas.create_window((0, 0), window=self.preview_inner, anchor="nw")
@@ -1376,32 +2661,123 @@ class ThermalVisibleFileDialog:
 
     def populate_file_list(self, rescan=True):
         if rescan or not hasattr(self, "files_in_current_dir"):
-            if not self.current_dir.exists():
-                self.files_in_current_dir = []
-            else:
-                self.files_in_current_dir = [
-                    p for p in sorted(self.current_dir.iterdir())
-                    if p.is_file() and p.suffix.lower() in self.IMAGE_EXTS and p.stem[-1:].upper() == "T"
-                ]
+            if self.start_directory_scan():
+                # 大きなフォルダは走査しながら順次表示し、完了時に選択状態を確定する
+                return
         self.ensure_current_page_valid()
         self.refresh_views()
         self.ensure_selection_in_current_page()
+        self.ensure_sort_metadata()
+
+    def is_thermal_entry(self, entry):
+        name = entry.name
+        stem, ext = os.path.splitext(name)
+        if ext.lower() not in self.IMAGE_EXTS or stem[-1:].upper() != "T":
+            return False
+        try:
+            return entry.is_file()
+        except OSError:
+            return False
+
+    def start_directory_scan(self):
+        """フォルダ一覧を取得（mtime 不変ならキャッシュを使用）。走査を継続中なら True を返す"""
+        self.cancel_directory_scan()
+        directory = self.current_dir
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            self.files_in_current_dir = []
+            self.refresh_counterpart_index()
+            return False
+        cached = _THERMAL_LISTING_CACHE.get(str(directory))
+        if cached and cached[0] == mtime:
+            self.files_in_current_dir = list(cached[1])
+            self.refresh_counterpart_index()
+            return False
+        try:
+            iterator = os.scandir(directory)
+        except OSError:
+            self.files_in_current_dir = []
+            self.refresh_counterpart_index()
+            return False
+        self._dir_scan = {"iterator": iterator, "found": [], "mtime": mtime, "dir": directory}
+        self.refresh_counterpart_index()
+        if self._consume_directory_scan():
+            return False
+        self.files_in_current_dir = sorted(self._dir_scan["found"])
+        self.ensure_current_page_valid()
+        self.refresh_views()
+        self._dir_scan_job = self.window.after(1, self._continue_directory_scan)
+        return True
+
+    def _consume_directory_scan(self):
+        """走査を DIR_SCAN_CHUNK 件分進める。完了したら一覧を確定して True を返す"""
+        scan = self._dir_scan
+        iterator = scan["iterator"]
+        found = scan["found"]
+        for _ in range(self.DIR_SCAN_CHUNK):
+            try:
+                entry = next(iterator)
+            except StopIteration:
+                break
+            except OSError:
+                break
+            if self.is_thermal_entry(entry):
+                found.append(Path(entry.path))
+        else:
+            return False
+        iterator.close()
+        found.sort()
+        _THERMAL_LISTING_CACHE[str(scan["dir"])] = (scan["mtime"], tuple(found))
+        self.files_in_current_dir = list(found)
+        self._dir_scan = None
+        return True
+
+    def _continue_directory_scan(self):
+        self._dir_scan_job = None
+        if self._dir_scan is None:
+            return
+        if self._consume_directory_scan():
+            self.ensure_current_page_valid()
+            self.refresh_views(keep_position=True)
+            self.ensure_selection_in_current_page()
+            self.ensure_sort_metadata()
+            return
+        self.files_in_current_dir = sorted(self._dir_scan["found"])
+        self.refresh_views(keep_position=True)
+        self._dir_scan_job = self.window.after(1, self._continue_directory_scan)
+
+    def cancel_directory_scan(self):
+        if self._dir_scan_job is not None:
+            try:
+                self.window.after_cancel(self._dir_scan_job)
+            except Exception:
+                pass
+            self._dir_scan_job = None
+        if self._dir_scan is not None:
+            try:
+                self._dir_scan["iterator"].close()
+            except Exception:
+                pass
+            self._dir_scan = None
 
     def select_directory(self):
         selected_dir = filedialog.askdirectory(parent=self.window, initialdir=str(self.current_dir))
         if selected_dir:
             path = Path(selected_dir)
             if path.exists():
+                self.cancel_prefetch()
+                self.prefetched_thumbnails.clear()
                 self.current_dir = path
                 self.dir_var.set(str(self.current_dir))
                 self.selected_file = None
                 self.current_page = 1
-                self.thumbnail_cache.clear()
                 self.populate_file_list()
 
     def clear_previews(self):
         self.thermal_photo = None
         self.visible_photo = None
+        self._reset_preview_sources()
         self.thermal_preview.config(image="", text="ファイルを選択してください")
         self.visible_preview.config(image="", text="対応する可視画像を表示します")
         self.visible_status_var.set("")
@@ -1477,6 +2853,7 @@ class ThermalVisibleFileDialog:
         new_index = max(0, min(new_index, len(page_files) - 1))
         target = page_files[new_index]
         self.set_selected_file(target)
+        self.scroll_thumbnail_into_view(target)
 
     def load_layout_preferences(self):
         try:
@@ -1541,30 +2918,72 @@ class ThermalVisibleFileDialog:
         except Exception:
             pass
 
-    def refresh_views(self):
-        self.refresh_listbox()
-        self.refresh_thumbnail_view()
+    def refresh_views(self, keep_position=False):
+        """一覧・サムネイル・ページ表示を更新（keep_position=True ならスクロール位置と生成中のサムネイルを保つ）"""
+        self.refresh_listbox(keep_position=keep_position)
+        self.refresh_thumbnail_view(keep_position=keep_position)
         self.update_pagination_controls()
 
+    def get_view_files(self):
+        """検索・フィルタ・並び順を適用した一覧（条件と元一覧が変わらない限り再計算しない）"""
+        files = getattr(self, "files_in_current_dir", [])
+        counterpart = self.get_counterpart_index(self.get_visible_dir(self.current_dir))
+        generation = getattr(self, "_files_generation", 0)
+        key = (
+            generation, counterpart, self.search_text, self.search_mode, self.pair_filter,
+            self.sort_mode, self.min_peak_temp, self._view_stats_version, self._view_metadata_version,
+        )
+        if key == self._view_files_key:
+            return self._view_files
+        self.file_index.sync(files, counterpart, generation)
+        view = self.file_index.search(files, self.search_text, self.search_mode)
+        if self.pair_filter is not None:
+            view = self.file_index.filter_paired(view, self.pair_filter)
+        if self.min_peak_temp is not None:
+            # ℃の条件は生データから換算できた画像だけに適用し、パレット画像・未解析は除外する
+            threshold = self.min_peak_temp
+            peak_temperature = ThermalStatsIndex.peak_temperature
+
+            def passes(path):
+                peak = peak_temperature(self.thermal_stats.get(path))
+                return peak is not None and peak >= threshold
+
+            view = [p for p in view if passes(p)]
+        if self.sort_mode in ("time", "gps", "paired"):
+            view.sort(key=self.file_index.sort_key(self.sort_mode))
+        elif self.sort_mode != "name":
+            descending = self.sort_mode == "peak_desc"
+            rank_key = ThermalStatsIndex.peak_rank_key
+            view.sort(key=lambda path: rank_key(self.thermal_stats.get(path), descending))
+        self._view_files_key = key
+        self._view_files = view
+        return view
+
+    def apply_file_view(self):
+        self._view_stats_version = self.thermal_stats.version
+        self.populate_file_list(rescan=False)
+
     def get_total_pages(self):
-        if not hasattr(self, "files_in_current_dir") or not self.files_in_current_dir:
+        files = self.get_view_files()
+        if not files:
             return 0
         if self.page_size <= 0:
             return 1
-        return math.ceil(len(self.files_in_current_dir) / self.page_size)
+        return math.ceil(len(files) / self.page_size)
 
     def get_page_files(self):
-        if not hasattr(self, "files_in_current_dir") or not self.files_in_current_dir:
+        files = self.get_view_files()
+        if not files:
             return []
         if self.page_size <= 0:
-            return list(self.files_in_current_dir)
+            return list(files)
         total_pages = self.get_total_pages()
         if total_pages == 0:
             return []
         page = max(1, min(self.current_page, total_pages))
         start = (page - 1) * self.page_size
         end = start + self.page_size
-        return self.files_in_current_dir[start:end]
+        return files[start:end]
 
     def ensure_current_page_valid(self):
         total_pages = self.get_total_pages()
@@ -1574,11 +2993,12 @@ class ThermalVisibleFileDialog:
                 self.selected_file = None
             return
         self.current_page = max(1, min(self.current_page, total_pages))
-        if self.page_size > 0 and self.selected_file and self.selected_file in self.files_in_current_dir:
-            page_index = self.files_in_current_dir.index(self.selected_file) // self.page_size + 1
+        files = self.get_view_files()
+        if self.page_size > 0 and self.selected_file and self.selected_file in files:
+            page_index = files.index(self.selected_file) // self.page_size + 1
             if page_index != self.current_page:
                 self.current_page = page_index
-        elif self.selected_file and self.selected_file not in self.files_in_current_dir:
+        elif self.selected_file and self.selected_file not in files:
             self.selected_file = None
 
     def ensure_selection_in_current_page(self):
@@ -1592,14 +3012,17 @@ class ThermalVisibleFileDialog:
             self.set_selected_file(page_files[0])
 
     def update_pagination_controls(self):
-        total_files = len(self.files_in_current_dir) if hasattr(self, "files_in_current_dir") else 0
+        total_files = len(self.get_view_files())
         total_pages = self.get_total_pages()
-        if hasattr(self, "page_size_var") and self.page_size_var.get() != str(self.page_size):
-            self.page_size_var.set(str(self.page_size))
+        page_size_label = self.get_page_size_label(self.page_size)
+        if hasattr(self, "page_size_var") and self.page_size_var.get() != page_size_label:
+            self.page_size_var.set(page_size_label)
         if total_pages == 0:
             page_text = "ページ 0 / 0 (0件)"
         else:
             page_text = f"ページ {self.current_page} / {total_pages} ({total_files}件)"
+        if self._dir_scan is not None:
+            page_text += " 読み込み中…"
         if hasattr(self, "page_info_var"):
             self.page_info_var.set(page_text)
         if hasattr(self, "prev_page_button"):
@@ -1624,13 +3047,17 @@ class ThermalVisibleFileDialog:
         self.selected_file = None
         self.populate_file_list(rescan=False)
 
+    def get_page_size_label(self, size):
+        return self.PAGE_SIZE_ALL_LABEL if size <= 0 else str(size)
+
     def on_page_size_change(self, event=None):
+        value = self.page_size_var.get()
         try:
-            new_size = int(self.page_size_var.get())
+            new_size = 0 if value == self.PAGE_SIZE_ALL_LABEL else int(value)
         except (ValueError, TypeError):
-            self.page_size_var.set(str(self.page_size))
+            self.page_size_var.set(self.get_page_size_label(self.page_size))
             return
-        if new_size <= 0:
+        if new_size < 0:
             new_size = self.page_size_options[0]
         if new_size == self.page_size:
             return
@@ -1638,53 +3065,291 @@ class ThermalVisibleFileDialog:
         self.current_page = 1
         self.populate_file_list(rescan=False)
 
-    def refresh_listbox(self):
+    def refresh_listbox(self, keep_position=False):
         self._suppress_listbox_event = True
+        top = self.file_listbox.yview()[0] if keep_position else None
         self.file_listbox.delete(0, tk.END)
         page_files = self.get_page_files()
         for file_path in page_files:
-            self.file_listbox.insert(tk.END, file_path.name)
+            self.file_listbox.insert(tk.END, self.get_file_label(file_path))
         if self.selected_file and self.selected_file in page_files:
             index = page_files.index(self.selected_file)
             self.file_listbox.selection_set(index)
-            self.file_listbox.see(index)
+            if top is None:
+                self.file_listbox.see(index)
+        if top is not None:
+            self.file_listbox.yview_moveto(top)
         self._suppress_listbox_event = False
 
-    def refresh_thumbnail_view(self):
-        for child in self.thumbnail_inner.winfo_children():
-            child.destroy()
-        self.thumbnail_buttons.clear()
-        page_files = self.get_page_files()
-        if not page_files:
-            ttk.Label(self.thumbnail_inner, text="サーモ画像が見つかりません").grid(row=0, column=0, padx=10, pady=10)
-            bbox = self.thumbnail_canvas.bbox("all")
-            self.thumbnail_canvas.configure(scrollregion=bbox if bbox else (0, 0, 0, 0))
+    def refresh_thumbnail_view(self, keep_position=False):
+        """サムネイル一覧を再構成（ボタンは表示行＋前後バッファ分だけ生成し、スクロール時に再利用）
+
+        keep_position=True（フォルダ走査中の追加分の反映）では生成待ちのジョブを破棄せず、
+        スクロール位置も先頭へ戻さない。
+        """
+        if not keep_position:
+            self._cancel_thumbnail_jobs()
+        self._release_thumbnail_slots()
+        self.thumbnail_canvas.delete("thumbnail_message")
+        self.thumbnail_files = list(self.get_page_files())
+        columns = max(1, self.thumbnail_columns)
+        self.thumbnail_rows = {path: idx // columns for idx, path in enumerate(self.thumbnail_files)}
+        if not self.thumbnail_files:
+            self.thumbnail_canvas.create_text(
+                10, 10, anchor="nw", text="サーモ画像が見つかりません", tags="thumbnail_message"
+            )
+            self.thumbnail_canvas.configure(scrollregion=(0, 0, 0, 0))
             return
-        for idx, file_path in enumerate(page_files):
-            photo = self.get_thumbnail_image(file_path)
-            btn = tk.Button(
-                self.thumbnail_inner,
+        cell_w, cell_h = self.get_thumbnail_cell_size()
+        total_rows = math.ceil(len(self.thumbnail_files) / columns)
+        self.thumbnail_canvas.configure(scrollregion=(0, 0, columns * cell_w, total_rows * cell_h))
+        if not keep_position:
+            self.thumbnail_canvas.yview_moveto(0)
+        self.update_virtual_thumbnails()
+
+    def get_thumbnail_cell_size(self):
+        pad = self.THUMBNAIL_CELL_PADDING
+        return (
+            self.THUMBNAIL_SIZE[0] + pad,
+            self.THUMBNAIL_SIZE[1] + self.THUMBNAIL_LABEL_HEIGHT + pad,
+        )
+
+    def _create_thumbnail_slot(self):
+        cell_w, cell_h = self.get_thumbnail_cell_size()
+        pad = self.THUMBNAIL_CELL_PADDING
+        button = tk.Button(
+            self.thumbnail_canvas,
+            compound="top",
+            wraplength=self.THUMBNAIL_SIZE[0] + 10,
+            relief=tk.RAISED,
+            bd=2,
+            justify="center",
+        )
+        button.bind("<MouseWheel>", self._on_thumbnail_mousewheel)
+        item = self.thumbnail_canvas.create_window(
+            0, 0, window=button, anchor="nw", width=cell_w - pad, height=cell_h - pad, state="hidden"
+        )
+        return button, item
+
+    def _release_thumbnail_slots(self, keep_range=None):
+        """範囲外となったボタンを非表示にして再利用プールへ戻す"""
+        for idx in list(self._thumbnail_slots):
+            if keep_range is not None and keep_range[0] <= idx < keep_range[1]:
+                continue
+            button, item = self._thumbnail_slots.pop(idx)
+            self.thumbnail_canvas.itemconfigure(item, state="hidden")
+            self._thumbnail_free_slots.append((button, item))
+            if idx < len(self.thumbnail_files):
+                path = self.thumbnail_files[idx]
+                if self.thumbnail_buttons.get(path) is button:
+                    del self.thumbnail_buttons[path]
+        if keep_range is None:
+            self.thumbnail_buttons.clear()
+
+    def update_virtual_thumbnails(self):
+        """表示中の行＋前後バッファ分だけボタンを割り当て、未生成サムネイルを要求"""
+        self._thumbnail_view_job = None
+        files = self.thumbnail_files
+        if not files:
+            return
+        columns = max(1, self.thumbnail_columns)
+        cell_w, cell_h = self.get_thumbnail_cell_size()
+        pad = self.THUMBNAIL_CELL_PADDING
+        first_row, last_row = self.get_visible_thumbnail_rows()
+        start = max(0, (first_row - self.THUMBNAIL_ROW_BUFFER) * columns)
+        end = min(len(files), (last_row + self.THUMBNAIL_ROW_BUFFER + 1) * columns)
+        self._release_thumbnail_slots(keep_range=(start, end))
+        missing = []
+        for idx in range(start, end):
+            if idx in self._thumbnail_slots:
+                continue
+            path = files[idx]
+            slot = self._thumbnail_free_slots.pop() if self._thumbnail_free_slots else self._create_thumbnail_slot()
+            button, item = slot
+            photo = self.thumbnail_cache.get((str(path), self.THUMBNAIL_SIZE))
+            if photo is None:
+                photo = self.get_thumbnail_placeholder()
+                missing.append(path)
+            selected = self.selected_file is not None and path == self.selected_file
+            button.thumbnail_photo = photo
+            button.configure(
                 image=photo,
-                text=file_path.name,
-                compound="top",
-                wraplength=self.THUMBNAIL_SIZE[0] + 10,
-                relief=tk.RAISED,
-                bd=2,
-                justify="center",
-                command=lambda p=file_path: self.on_thumbnail_click(p)
+                text=self.get_file_label(path),
+                command=lambda p=path: self.on_thumbnail_click(p),
+                relief=tk.SUNKEN if selected else tk.RAISED,
+                bd=3 if selected else 2,
             )
-            btn.grid(row=idx // self.thumbnail_columns, column=idx % self.thumbnail_columns, padx=5, pady=5, sticky="nsew")
-            self.thumbnail_buttons[file_path] = btn
-        for col in range(self.thumbnail_columns):
-            self.thumbnail_inner.grid_columnconfigure(col, weight=1)
-        if self.selected_file:
-            self.update_thumbnail_selection(self.selected_file)
-        self.thumbnail_canvas.yview_moveto(0)
-        bbox = self.thumbnail_canvas.bbox("all")
-        self.thumbnail_canvas.configure(scrollregion=bbox if bbox else (0, 0, 0, 0))
+            row, col = divmod(idx, columns)
+            self.thumbnail_canvas.coords(item, col * cell_w + pad // 2, row * cell_h + pad // 2)
+            self.thumbnail_canvas.itemconfigure(item, state="normal")
+            self._thumbnail_slots[idx] = slot
+            self.thumbnail_buttons[path] = button
+        self.submit_thumbnail_jobs(missing)
+
+    def _schedule_thumbnail_view_update(self):
+        if self._thumbnail_view_job is not None:
+            return
+        try:
+            self._thumbnail_view_job = self.window.after_idle(self.update_virtual_thumbnails)
+        except Exception:
+            self._thumbnail_view_job = None
+
+    def _on_thumbnail_mousewheel(self, event):
+        if not self.thumbnail_files:
+            return "break"
+        step = -1 if event.delta > 0 else 1
+        self.thumbnail_canvas.yview_scroll(step, "units")
+        return "break"
+
+    def scroll_thumbnail_into_view(self, path):
+        row = self.thumbnail_rows.get(path)
+        if row is None:
+            return
+        _cell_w, cell_h = self.get_thumbnail_cell_size()
+        total_rows = max(1, math.ceil(len(self.thumbnail_files) / max(1, self.thumbnail_columns)))
+        top = self.thumbnail_canvas.canvasy(0)
+        bottom = top + self.thumbnail_canvas.winfo_height()
+        row_top = row * cell_h
+        if row_top < top or row_top + cell_h > bottom:
+            self.thumbnail_canvas.yview_moveto(row_top / float(total_rows * cell_h))
+
+    def get_thumbnail_placeholder(self):
+        if self._thumbnail_placeholder is None:
+            self._thumbnail_placeholder = ImageTk.PhotoImage(
+                Image.new("RGB", self.THUMBNAIL_SIZE, color="#e0e0e0")
+            )
+        return self._thumbnail_placeholder
+
+    def get_visible_thumbnail_rows(self):
+        """サムネイル一覧で現在表示されている行範囲 (first, last) を返す"""
+        total_rows = math.ceil(len(self.thumbnail_files) / max(1, self.thumbnail_columns))
+        if total_rows <= 0:
+            return 0, -1
+        try:
+            top, bottom = self.thumbnail_canvas.yview()
+        except tk.TclError:
+            top, bottom = 0.0, 1.0
+        first = int(top * total_rows)
+        last = min(total_rows - 1, int(math.ceil(bottom * total_rows)))
+        return first, last
+
+    def _thumbnail_priority(self, row, visible_rows):
+        first, last = visible_rows
+        if first <= row <= last:
+            return 0
+        return 1 + (first - row if row < first else row - last)
+
+    def submit_thumbnail_jobs(self, paths):
+        """未生成のサムネイルをワーカーへ投入（表示中の行を優先）"""
+        if not paths:
+            return
+        self._ensure_thumbnail_workers()
+        visible_rows = self.get_visible_thumbnail_rows()
+        generation = self._thumbnail_generation
+        for path in paths:
+            # 同じ世代で生成中・待機中のものは積み直さない（走査中の再描画で二重にデコードしない）
+            with self._thumbnail_lock:
+                if self._thumbnail_inflight.get(path) == generation:
+                    continue
+                if self._thumbnail_pending.get(path) == generation:
+                    continue
+            row = self.thumbnail_rows.get(path, 0)
+            self._thumbnail_pending[path] = generation
+            priority = self._thumbnail_priority(row, visible_rows)
+            self._thumbnail_queue.put((priority, next(self._thumbnail_sequence), generation, path))
+        self._schedule_thumbnail_poll()
+
+    def _cancel_thumbnail_jobs(self):
+        with self._thumbnail_lock:
+            self._thumbnail_generation += 1
+            self._thumbnail_pending.clear()
+
+    def _ensure_thumbnail_workers(self):
+        self._thumbnail_workers = [t for t in self._thumbnail_workers if t.is_alive()]
+        while len(self._thumbnail_workers) < self.THUMBNAIL_WORKERS:
+            worker = threading.Thread(target=self._thumbnail_worker_loop, daemon=True)
+            worker.start()
+            self._thumbnail_workers.append(worker)
+
+    def _shutdown_thumbnail_workers(self):
+        self._cancel_thumbnail_jobs()
+        for _ in self._thumbnail_workers:
+            self._thumbnail_queue.put((-1, next(self._thumbnail_sequence), None, None))
+        self._thumbnail_workers = []
+
+    def _thumbnail_worker_loop(self):
+        while True:
+            _priority, _seq, generation, path = self._thumbnail_queue.get()
+            if path is None:
+                return
+            # 既に別優先度で処理済み、またはディレクトリ／ページ変更で破棄されたジョブは飛ばす
+            with self._thumbnail_lock:
+                if self._thumbnail_pending.pop(path, None) != generation:
+                    continue
+                self._thumbnail_active += 1
+                self._thumbnail_inflight[path] = generation
+            try:
+                img = self.build_thumbnail_pil(path)
+            except Exception:
+                img = None
+            self._thumbnail_results.put((generation, path, img))
+            with self._thumbnail_lock:
+                self._thumbnail_active -= 1
+                if self._thumbnail_inflight.get(path) == generation:
+                    del self._thumbnail_inflight[path]
+
+    def _schedule_thumbnail_poll(self):
+        if self._thumbnail_poll_job is None:
+            try:
+                self._thumbnail_poll_job = self.window.after(self.THUMBNAIL_POLL_MS, self._drain_thumbnail_results)
+            except Exception:
+                self._thumbnail_poll_job = None
+
+    def _drain_thumbnail_results(self):
+        """ワーカーの生成結果をメインスレッドで PhotoImage 化してボタンへ反映"""
+        self._thumbnail_poll_job = None
+        while True:
+            try:
+                generation, path, img = self._thumbnail_results.get_nowait()
+            except queue.Empty:
+                break
+            if generation != self._thumbnail_generation or img is None:
+                continue
+            photo = ImageTk.PhotoImage(img)
+            self.thumbnail_cache.put((str(path), self.THUMBNAIL_SIZE), photo)
+            button = self.thumbnail_buttons.get(path)
+            if button is not None:
+                try:
+                    button.configure(image=photo)
+                    # キャッシュから追い出されても表示中の画像が消えないよう参照を保持
+                    button.thumbnail_photo = photo
+                except tk.TclError:
+                    pass
+        if self._thumbnail_pending or self._thumbnail_active or not self._thumbnail_results.empty():
+            self._schedule_thumbnail_poll()
+
+    def _on_thumbnail_yscroll(self, first, last):
+        self.thumbnail_scrollbar.set(first, last)
+        self._schedule_thumbnail_view_update()
+        if self._thumbnail_pending and self._thumbnail_reprioritize_job is None:
+            try:
+                self._thumbnail_reprioritize_job = self.window.after_idle(self._reprioritize_thumbnail_jobs)
+            except Exception:
+                self._thumbnail_reprioritize_job = None
+
+    def _reprioritize_thumbnail_jobs(self):
+        """スクロール後に表示中の行となった未生成サムネイルを先頭に積み直す"""
+        self._thumbnail_reprioritize_job = None
+        visible_rows = self.get_visible_thumbnail_rows()
+        generation = self._thumbnail_generation
+        for path, gen in list(self._thumbnail_pending.items()):
+            if gen != generation:
+                continue
+            if self._thumbnail_priority(self.thumbnail_rows.get(path, 0), visible_rows) == 0:
+                self._thumbnail_queue.put((0, next(self._thumbnail_sequence), generation, path))
 
     def _on_thumbnail_canvas_configure(self, event):
-        self.thumbnail_canvas.itemconfigure(self.thumbnail_window, width=event.width)
+        self._schedule_thumbnail_view_update()
 
     def _on_preview_canvas_configure(self, event):
         if hasattr(self, "preview_window"):
@@ -1718,9 +3383,117 @@ class ThermalVisibleFileDialog:
         self.update_thumbnail_selection(thermal_path)
         if thermal_path:
             self.update_previews(thermal_path)
+            self.schedule_prefetch()
         else:
             self.clear_previews()
 
+    def schedule_prefetch(self):
+        """選択が落ち着いたら近傍ファイルのプレビューと次ページのサムネイルを先読み"""
+        if self._prefetch_job is not None:
+            try:
+                self.window.after_cancel(self._prefetch_job)
+            except Exception:
+                pass
+        try:
+            self._prefetch_job = self.window.after(self.PREFETCH_DELAY_MS, self.start_prefetch)
+        except Exception:
+            self._prefetch_job = None
+
+    def cancel_prefetch(self):
+        """未処理の先読みを破棄（ディレクトリ変更時など）"""
+        self._prefetch_generation += 1
+        if self._prefetch_job is not None:
+            try:
+                self.window.after_cancel(self._prefetch_job)
+            except Exception:
+                pass
+            self._prefetch_job = None
+
+    def get_prefetch_neighbours(self):
+        files = self.get_view_files()
+        if not self.selected_file or self.selected_file not in files:
+            return []
+        index = files.index(self.selected_file)
+        offsets = []
+        for step in range(1, self.PREFETCH_NEIGHBOURS + 1):
+            offsets.extend((step, -step))
+        if self.display_mode == "thumbnail":
+            columns = max(1, self.thumbnail_columns)
+            offsets.extend((columns, -columns))
+        neighbours = []
+        for offset in offsets:
+            i = index + offset
+            if 0 <= i < len(files) and files[i] not in neighbours:
+                neighbours.append(files[i])
+        return neighbours
+
+    def get_prefetch_thumbnail_capacity(self):
+        """先読みバッファに収まるサムネイル枚数（THUMBNAIL_SIZE の RGBA で見積もり）"""
+        per_thumbnail = self.THUMBNAIL_SIZE[0] * self.THUMBNAIL_SIZE[1] * 4
+        return max(1, self.PREFETCH_THUMBNAIL_BYTES // per_thumbnail)
+
+    def start_prefetch(self):
+        self._prefetch_job = None
+        self._prefetch_generation += 1
+        generation = self._prefetch_generation
+        thermal_size = self._last_preview_sizes.get("thermal", self.PREVIEW_BASE_SIZE)
+        visible_size = self._last_preview_sizes.get("visible", self.PREVIEW_BASE_SIZE)
+        for path in self.get_prefetch_neighbours():
+            self._prefetch_queue.put((generation, "preview", path, (thermal_size, visible_size)))
+        if self.display_mode == "thumbnail" and self.page_size > 0 and self.current_page < self.get_total_pages():
+            # 先読みバッファに収まる枚数（次ページ先頭の表示範囲）に限る。超えると使う前に追い出される
+            start = self.current_page * self.page_size
+            count = min(self.page_size, self.get_prefetch_thumbnail_capacity())
+            for path in self.get_view_files()[start:start + count]:
+                if self.thumbnail_cache.get((str(path), self.THUMBNAIL_SIZE)) is None:
+                    self._prefetch_queue.put((generation, "thumbnail", path, None))
+        if self._prefetch_thread is None or not self._prefetch_thread.is_alive():
+            self._prefetch_thread = threading.Thread(target=self._prefetch_worker_loop, daemon=True)
+            self._prefetch_thread.start()
+
+    def _prefetch_worker_loop(self):
+        while True:
+            generation, kind, path, sizes = self._prefetch_queue.get()
+            if path is None:
+                return
+            if generation != self._prefetch_generation:
+                continue
+            try:
+                if kind == "preview":
+                    self.warm_preview_base(path, sizes[0])
+                    visible_path = self.find_visible_counterpart(path)
+                    if visible_path is not None and generation == self._prefetch_generation:
+                        self.warm_preview_base(visible_path, sizes[1])
+                elif kind == "thumbnail":
+                    key = (str(path), self.THUMBNAIL_SIZE)
+                    if key not in self.prefetched_thumbnails:
+                        self.prefetched_thumbnails.put(key, self.build_thumbnail_pil(path))
+            except Exception:
+                continue
+
+    def _shutdown_prefetch(self):
+        self.cancel_prefetch()
+        if self._prefetch_thread is not None:
+            self._prefetch_queue.put((None, None, None, None))
+            self._prefetch_thread = None
+
+    @staticmethod
+    def _preview_base_key(path):
+        """デコード済み画像のキャッシュキー（上書きされた画像を取り違えないよう更新時刻・サイズを含む）"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return ("base", str(path), st.st_mtime_ns, st.st_size)
+
+    def warm_preview_base(self, path: Path, target_size):
+        """プレビュー用のデコード済み画像をキャッシュへ読み込む（ワーカースレッド用）"""
+        key = self._preview_base_key(path)
+        if key is None or key in self.preview_base_cache:
+            return
+        img, original_size = open_image_reduced(path, target_size, with_original_size=True)
+        self.preview_base_cache.put(key, (img, original_size))
+
     def update_listbox_selection(self, thermal_path):
         self._suppress_listbox_event = True
         self.file_listbox.selection_clear(0, tk.END)
@@ -1741,6 +3514,7 @@ class ThermalVisibleFileDialog:
 
     def update_previews(self, thermal_path: Path):
         thermal_path = Path(thermal_path)
+        self._reset_preview_sources()
         if not thermal_path.exists():
             self.thermal_photo = None
             self.visible_photo = None
@@ -1748,30 +3522,92 @@ class ThermalVisibleFileDialog:
             self.visible_preview.config(image="", text="対応する可視画像を表示します")
             self.visible_status_var.set("")
             return
-        self.visible_status_var.set("")
-        thermal_size = self.get_preview_size(self.thermal_preview)
-        self.thermal_photo = self.load_preview_image(thermal_path, size=thermal_size, allow_upscale=True)
-        if self.thermal_photo:
-            self.thermal_preview.config(image=self.thermal_photo, text="")
-        else:
-            self.thermal_preview.config(image="", text="プレビューできません")
-
         visible_path = self.find_visible_counterpart(thermal_path)
-        if visible_path and visible_path.exists():
-            visible_size = self.get_preview_size(self.visible_preview)
-            self.visible_photo = self.load_preview_image(visible_path, size=visible_size, allow_upscale=True)
-            if self.visible_photo:
-                self.visible_preview.config(image=self.visible_photo, text="")
+        self._preview_sources = {"thermal": thermal_path, "visible": visible_path}
+        self.visible_status_var.set(f"可視画像: {visible_path.name}" if visible_path else "")
+        if hasattr(self, "preview_canvas"):
+            self.preview_canvas.yview_moveto(0)
+        self.render_previews()
+
+    def _reset_preview_sources(self):
+        self._preview_sources = {}
+        self._preview_pyramids = {}
+        self._deferred_previews = set()
+        if self._deferred_preview_job is not None:
+            try:
+                self.window.after_cancel(self._deferred_preview_job)
+            except Exception:
+                pass
+            self._deferred_preview_job = None
+
+    def render_previews(self):
+        """選択中の画像をデコード済みデータから再サンプルして表示（見えていない側は後回し）"""
+        if not self._preview_sources:
+            return
+        self._deferred_previews = set()
+        for kind in ("thermal", "visible"):
+            if self.is_preview_widget_visible(self._preview_widget(kind)):
+                self.render_preview(kind)
             else:
-                self.visible_preview.config(image="", text="プレビューできません")
-            self.visible_status_var.set(f"可視画像: {visible_path.name}")
+                self._deferred_previews.add(kind)
+        if self._deferred_previews:
+            self._schedule_deferred_previews()
+
+    def _preview_widget(self, kind):
+        return self.thermal_preview if kind == "thermal" else self.visible_preview
+
+    def render_preview(self, kind):
+        path = self._preview_sources.get(kind)
+        widget = self._preview_widget(kind)
+        photo = None
+        if path is not None:
+            size = self.get_preview_size(widget)
+            self._last_preview_sizes[kind] = size
+            photo = self.load_preview_image(path, size=size, allow_upscale=True)
+            if photo:
+                widget.config(image=photo, text="")
+            else:
+                widget.config(image="", text="プレビューできません")
+        elif kind == "visible":
+            widget.config(image="", text="同名ファイルが見つかりません")
+        if kind == "thermal":
+            self.thermal_photo = photo
         else:
-            self.visible_photo = None
-            self.visible_preview.config(image="", text="同名ファイルが見つかりません")
-            self.visible_status_var.set("")
+            self.visible_photo = photo
 
-        if hasattr(self, "preview_canvas"):
-            self.preview_canvas.yview_moveto(0)
+    def is_preview_widget_visible(self, widget):
+        """プレビュー領域のスクロール範囲内に widget が表示されているか"""
+        try:
+            canvas_height = self.preview_canvas.winfo_height()
+            if canvas_height <= 1 or not widget.winfo_ismapped():
+                return True
+            top = widget.winfo_rooty() - self.preview_canvas.winfo_rooty()
+            return top < canvas_height and top + widget.winfo_height() > 0
+        except tk.TclError:
+            return True
+
+    def _schedule_deferred_previews(self, delay=150):
+        if self._deferred_preview_job is not None:
+            try:
+                self.window.after_cancel(self._deferred_preview_job)
+            except Exception:
+                pass
+        try:
+            self._deferred_preview_job = self.window.after(delay, self._render_deferred_previews)
+        except Exception:
+            self._deferred_preview_job = None
+
+    def _render_deferred_previews(self):
+        self._deferred_preview_job = None
+        pending, self._deferred_previews = self._deferred_previews, set()
+        for kind in ("thermal", "visible"):
+            if kind in pending:
+                self.render_preview(kind)
+
+    def _on_preview_yscroll(self, first, last):
+        self.preview_scrollbar.set(first, last)
+        if self._deferred_previews:
+            self._schedule_deferred_previews(delay=0)
 
     def get_preview_size(self, target_widget):
         base_width, base_height = self.PREVIEW_BASE_SIZE
@@ -1791,12 +3627,45 @@ class ThermalVisibleFileDialog:
             max(1, int(base_height * self.preview_zoom)),
         )
 
+    def get_preview_base_image(self, path: Path, target_size):
+        """プレビュー用のデコード済み画像を取得（選択中画像は保持分、他はキャッシュ。解像度不足時のみ再デコード）"""
+        key = self._preview_base_key(path)
+        pyramid = self._preview_pyramids.get(str(path))
+        if pyramid and pyramid[3] != key:
+            pyramid = None
+        if pyramid:
+            cached = (pyramid[0], pyramid[1])
+        else:
+            cached = self.preview_base_cache.get(key) if key is not None else None
+        if cached is not None:
+            img, original_size = cached
+            fit = min(target_size[0] / original_size[0], target_size[1] / original_size[1])
+            if img.size != original_size and (img.width < original_size[0] * fit or img.height < original_size[1] * fit):
+                cached = None
+        if cached is None:
+            img, original_size = open_image_reduced(path, target_size, with_original_size=True)
+            if key is not None:
+                self.preview_base_cache.put(key, (img, original_size))
+        if path in self._preview_sources.values() and (not pyramid or pyramid[0] is not img):
+            self._preview_pyramids[str(path)] = (img, original_size, [img], key)
+        return img
+
+    def get_preview_pyramid_level(self, path: Path, width, height):
+        """選択中画像の1/2縮小ピラミッドから、指定サイズ以上で最小の段を返す"""
+        _base, _original_size, levels, _key = self._preview_pyramids[str(path)]
+        idx = 0
+        while True:
+            level = levels[idx]
+            if level.width // 2 < width or level.height // 2 < height:
+                return level
+            if idx + 1 >= len(levels):
+                levels.append(level.reduce(2))
+            idx += 1
+
     def load_preview_image(self, path: Path, size=None, allow_upscale=True):
         try:
-            with Image.open(path) as img:
-                img = img.copy()
-                img = img.convert("RGBA")
             target_size = size or self.PREVIEW_BASE_SIZE
+            img = self.get_preview_base_image(path, target_size)
             max_w, max_h = target_size
             if max_w <= 0:
                 max_w = 1
@@ -1815,24 +3684,38 @@ class ThermalVisibleFileDialog:
             new_width = max(1, int(orig_w * scale))
             new_height = max(1, int(orig_h * scale))
             resample = Image.Resampling.LANCZOS if scale <= 1.0 else Image.Resampling.BICUBIC
+            if str(path) in self._preview_pyramids:
+                img = self.get_preview_pyramid_level(path, new_width, new_height)
             img = img.resize((new_width, new_height), resample=resample)
             return ImageTk.PhotoImage(img)
         except Exception:
             return None
 
+    def build_thumbnail_pil(self, path: Path):
+        """サムネイル用PIL画像を生成（先読み済み・ディスクキャッシュ優先。ワーカースレッドから呼ばれる）"""
+        img = self.prefetched_thumbnails.pop((str(path), self.THUMBNAIL_SIZE))
+        if img is not None:
+            return img
+        img = self.thumbnail_disk_cache.get(path, self.THUMBNAIL_SIZE)
+        if img is None:
+            try:
+                # 埋め込みプレビューで足りればそれを使い、無ければ縮小デコード
+                img = open_embedded_preview(path, self.THUMBNAIL_SIZE)
+                if img is None:
+                    img = open_image_reduced(path, self.THUMBNAIL_SIZE)
+                img.thumbnail(self.THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
+                self.thumbnail_disk_cache.put(path, self.THUMBNAIL_SIZE, img)
+            except Exception:
+                img = Image.new("RGB", self.THUMBNAIL_SIZE, color="#cccccc")
+        return img
+
     def get_thumbnail_image(self, path: Path):
         key = (str(path), self.THUMBNAIL_SIZE)
-        if key in self.thumbnail_cache:
-            return self.thumbnail_cache[key]
-        try:
-            with Image.open(path) as img:
-                img = img.copy()
-                img = img.convert("RGBA")
-            img.thumbnail(self.THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
-        except Exception:
-            img = Image.new("RGB", self.THUMBNAIL_SIZE, color="#cccccc")
-        photo = ImageTk.PhotoImage(img)
-        self.thumbnail_cache[key] = photo
+        photo = self.thumbnail_cache.get(key)
+        if photo is not None:
+            return photo
+        photo = ImageTk.PhotoImage(self.build_thumbnail_pil(path))
+        self.thumbnail_cache.put(key, photo)
         return photo
 
     def adjust_preview_zoom(self, factor=None, absolute=None):
@@ -1887,7 +3770,12 @@ class ThermalVisibleFileDialog:
 
     def refresh_current_previews(self):
         self._preview_refresh_job = None
-        if self.selected_file:
+        if not self.selected_file:
+            return
+        # 倍率変更・リサイズ時はデコード済み画像から再サンプルするだけにする
+        if self._preview_sources.get("thermal") == Path(self.selected_file):
+            self.render_previews()
+        else:
             self.update_previews(self.selected_file)
 
     def schedule_preview_refresh(self, delay=120):
@@ -1909,22 +3797,184 @@ class ThermalVisibleFileDialog:
         self.schedule_preview_refresh()
 
     @staticmethod
-    def find_visible_counterpart(thermal_path: Path):
+    def get_visible_dir(thermal_dir: Path):
+        return Path(thermal_dir).parent / "可視画像"
+
+    def refresh_counterpart_index(self):
+        """現在のフォルダに対応する可視画像フォルダの対応表を、フォルダ変更時のみ作り直す"""
+        visible_dir = self.get_visible_dir(self.current_dir)
         try:
-            stem = thermal_path.stem
-            if not stem:
-                return None
-            if stem[-1].upper() != "T":
-                return None
-            counterpart_stem = stem[:-1] + "V"
-            visible_dir = thermal_path.parent.parent / "可視画像"
-            visible_path = visible_dir / f"{counterpart_stem}{thermal_path.suffix}"
-            if visible_path.exists():
-                return visible_path
-            return None
+            mtime = os.stat(visible_dir).st_mtime_ns
+        except OSError:
+            mtime = None
+        cached = self._counterpart_indexes.get(str(visible_dir))
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        index = VisibleCounterpartIndex(visible_dir, self.IMAGE_EXTS)
+        self._counterpart_indexes[str(visible_dir)] = (mtime, index)
+        return index
+
+    def get_counterpart_index(self, visible_dir: Path):
+        cached = self._counterpart_indexes.get(str(visible_dir))
+        if cached is not None:
+            return cached[1]
+        index = VisibleCounterpartIndex(visible_dir, self.IMAGE_EXTS)
+        self._counterpart_indexes[str(visible_dir)] = (None, index)
+        return index
+
+    def find_visible_counterpart(self, thermal_path: Path):
+        try:
+            thermal_path = Path(thermal_path)
+            return self.get_counterpart_index(self.get_visible_dir(thermal_path.parent)).lookup(thermal_path)
         except Exception:
             return None
 
+    def get_file_label(self, thermal_path: Path):
+        mark = "●" if self.find_visible_counterpart(thermal_path) else "○"
+        stats = self.thermal_stats.get(thermal_path)
+        if stats is None:
+            return f"{mark} {thermal_path.name}"
+        if stats.get("source") == "radiometric":
+            # 換算係数が機種依存・未検証の推定値のため「≈」を付ける
+            return f"{mark} {thermal_path.name}  [最高 ≈{stats['max']:.1f}℃ / 平均 ≈{stats['mean']:.1f}℃]"
+        # パレット画像は画像ごとに自動レンジされるため温度に換算せず、無次元の輝度スコアで示す
+        return f"{mark} {thermal_path.name}  [輝度 最高 {stats['score_max']:.0f} / 平均 {stats['score_mean']:.0f}]"
+
+    def start_thermal_analysis(self):
+        """現在のフォルダのサーモ画像を一括で温度解析（解析済みで更新の無い画像は除外）"""
+        self.cancel_thermal_analysis()
+        count = self.thermal_stats.start_batch(self.files_in_current_dir)
+        if count == 0:
+            self.stats_status_var.set("温度解析: 対象の画像がありません")
+            return
+        self.stats_status_var.set(f"温度解析中… 0 / {count}")
+        self._stats_poll_job = self.window.after(self.STATS_POLL_MS, self._poll_thermal_stats)
+
+    def _poll_thermal_stats(self):
+        self._stats_poll_job = None
+        if self.thermal_stats.collect():
+            # 並び替え中は一覧の順序を保ち、ラベル（温度表示）だけ更新する
+            self.refresh_listbox()
+        done, total = self.thermal_stats.progress()
+        if self.thermal_stats.is_running():
+            self.stats_status_var.set(f"温度解析中… {done} / {total}")
+            self._stats_poll_job = self.window.after(self.STATS_POLL_MS, self._poll_thermal_stats)
+            return
+        analyzed = self.thermal_stats.analyzed_count()
+        if analyzed:
+            self.stats_status_var.set(f"温度解析完了: {analyzed}件（推定値）")
+        else:
+            self.stats_status_var.set("温度解析: すべて解析済み")
+        self.thermal_stats.save()
+        if self.sort_mode != "name" or self.min_peak_temp is not None:
+            self.apply_file_view()
+
+    def cancel_thermal_analysis(self):
+        if self._stats_poll_job is not None:
+            try:
+                self.window.after_cancel(self._stats_poll_job)
+            except Exception:
+                pass
+            self._stats_poll_job = None
+        self.thermal_stats.collect()
+        self.thermal_stats.cancel_batch()
+
+    def on_sort_change(self, event=None):
+        label = self.sort_var.get()
+        mode = next((key for key, text in self.SORT_OPTIONS if text == label), "name")
+        if mode == self.sort_mode:
+            return
+        self.sort_mode = mode
+        self.current_page = 1
+        if mode in ("time", "gps"):
+            self.start_metadata_load()
+        self.apply_file_view()
+
+    def schedule_search(self):
+        if self._search_job is not None:
+            self.window.after_cancel(self._search_job)
+        self._search_job = self.window.after(self.SEARCH_DELAY_MS, self.apply_search)
+
+    def apply_search(self):
+        self._search_job = None
+        text = self.search_var.get().strip()
+        label = self.search_mode_var.get()
+        mode = next((key for key, name in self.SEARCH_MODES if name == label), "substring")
+        if text == self.search_text and mode == self.search_mode:
+            return
+        self.search_text = text
+        self.search_mode = mode
+        self.current_page = 1
+        self.apply_file_view()
+
+    def on_pair_filter_change(self, event=None):
+        label = self.pair_filter_var.get()
+        value = next((key for key, name in self.PAIR_FILTERS if name == label), None)
+        if value == self.pair_filter:
+            return
+        self.pair_filter = value
+        self.current_page = 1
+        self.apply_file_view()
+
+    def ensure_sort_metadata(self):
+        """撮影日時・GPS順で表示中にフォルダが替わった場合、未取得分を読み込む"""
+        if self.sort_mode in ("time", "gps") and self._metadata_thread is None:
+            self.start_metadata_load()
+
+    def start_metadata_load(self):
+        """撮影日時・GPS の未取得分をバックグラウンドで読み込み、完了時に一覧へ反映する"""
+        self.get_view_files()
+        targets = self.file_index.missing_metadata(self.files_in_current_dir)
+        if not targets:
+            return
+        self.cancel_metadata_load()
+        self._metadata_cancel = threading.Event()
+        self._metadata_thread = threading.Thread(
+            target=self.file_index.load_metadata, args=(targets, self._metadata_cancel), daemon=True
+        )
+        self._metadata_thread.start()
+        self._metadata_poll_job = self.window.after(self.STATS_POLL_MS, self._poll_metadata_load)
+
+    def _poll_metadata_load(self):
+        self._metadata_poll_job = None
+        if self._metadata_thread is not None and self._metadata_thread.is_alive():
+            self.stats_status_var.set(
+                f"撮影情報を読み込み中… {self.file_index.metadata_loaded} / {self.file_index.metadata_total}"
+            )
+            self._metadata_poll_job = self.window.after(self.STATS_POLL_MS, self._poll_metadata_load)
+            return
+        self._metadata_thread = None
+        self.stats_status_var.set("")
+        self._view_metadata_version = self.file_index.metadata_version
+        if self.sort_mode in ("time", "gps"):
+            self.apply_file_view()
+
+    def cancel_metadata_load(self):
+        if self._metadata_poll_job is not None:
+            try:
+                self.window.after_cancel(self._metadata_poll_job)
+            except Exception:
+                pass
+            self._metadata_poll_job = None
+        self._metadata_cancel.set()
+        self._metadata_thread = None
+
+    def on_temperature_filter_change(self, event=None):
+        value = self.min_peak_var.get().strip()
+        if not value:
+            threshold = None
+        else:
+            try:
+                threshold = float(value)
+            except ValueError:
+                self.min_peak_var.set("" if self.min_peak_temp is None else f"{self.min_peak_temp:g}")
+                return
+        if threshold == self.min_peak_temp:
+            return
+        self.min_peak_temp = threshold
+        self.current_page = 1
+        self.apply_file_view()
+
     def on_confirm(self):
         if not self.selected_file:
             messagebox.showwarning("警告", "サーモ画像を選択してください。", parent=self.window)
@@ -1935,11 +3985,23 @@ class ThermalVisibleFileDialog:
             messagebox.showwarning("警告", "同名ファイルが見つかりません。", parent=self.window)
             return
         self.result = (str(thermal_path), str(visible_path))
+        self._shutdown_thumbnail_workers()
+        self._shutdown_prefetch()
+        self.cancel_directory_scan()
+        self.cancel_thermal_analysis()
+        self.cancel_metadata_load()
+        self.thermal_stats.save()
         self.save_layout_preferences()
         self.window.destroy()
 
     def on_cancel(self):
         self.result = None
+        self._shutdown_thumbnail_workers()
+        self._shutdown_prefetch()
+        self.cancel_directory_scan()
+        self.cancel_thermal_analysis()
+        self.cancel_metadata_load()
+        self.thermal_stats.save()
         self.save_layout_preferences()
         self.window.destroy()
 
@@ -1948,7 +4010,224 @@ class ThermalVisibleFileDialog:
         return self.result
 
 
+class AnnotationStore(list):
+    """アノテーション一覧（annotations.json と同じ dict のリスト）に索引を付けたもの
+
+    ID→レコードの索引と ID順の並びは append/insert/remove/pop のたびに差分で更新する
+    （ID順の並びは bisect で挿入位置を求める）。並び替え・スライス代入・clear などの一括変更と
+    mark_dirty() の後は、最初に参照された時に作り直す。座標列（NumPy）は座標検索の時だけ作る。
+    レコードの 'id'・'x'・'y' を直接書き換えた場合は mark_dirty() を呼ぶこと。
+    """
+
+    def __init__(self, records=()):
+        super().__init__(records)
+        self._version = 0
+        self._index_version = -1
+        self._coords_version = -1
+        self._verified_version = -1
+        self._by_id = {}
+        self._order = []
+        self._order_keys = []
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._xs = np.zeros(0, dtype=np.float64)
+        self._ys = np.zeros(0, dtype=np.float64)
+
+    def mark_dirty(self):
+        self._version += 1
+
+    # --- リスト操作（1件単位は索引を差分更新、一括変更は作り直し） ---
+    def append(self, record):
+        super().append(record)
+        self._changed()
+        self._index_added(record)
+
+    def extend(self, records):
+        records = list(records)
+        super().extend(records)
+        self._changed()
+        for record in records:
+            self._index_added(record)
+
+    def insert(self, index, record):
+        # 末尾以外への挿入は同じIDの並び（リスト上の順）が変わるため作り直す
+        at_end = index >= len(self)
+        super().insert(index, record)
+        self._changed(incremental=at_end)
+        if at_end:
+            self._index_added(record)
+
+    def remove(self, record):
+        del self[self.index(record)]
+
+    def pop(self, index=-1):
+        record = self[index]
+        del self[index]
+        return record
+
+    def clear(self):
+        super().clear()
+        self._changed(incremental=False)
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._changed(incremental=False)
+
+    def reverse(self):
+        super().reverse()
+        self._changed(incremental=False)
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._changed(incremental=False)
+
+    def __delitem__(self, index):
+        record = None if isinstance(index, slice) else self[index]
+        super().__delitem__(index)
+        self._changed(incremental=record is not None)
+        if record is not None:
+            self._index_removed(record)
+
+    def __iadd__(self, records):
+        self.extend(records)
+        return self
+
+    # --- 索引 ---
+    @staticmethod
+    def _id_key(record):
+        try:
+            return int(record.get('id'))
+        except (TypeError, ValueError):
+            return None
+
+    @classmethod
+    def _order_key(cls, record):
+        key = cls._id_key(record)
+        # IDの無いレコードは末尾
+        return (key is None, key or 0)
+
+    def _changed(self, incremental=True):
+        """変更を記録。索引が最新なら差分更新を続け、そうでなければ次回参照時に作り直す"""
+        current = self._index_version == self._version
+        self._version += 1
+        if incremental and current:
+            self._index_version = self._version
+
+    def _index_added(self, record):
+        """末尾に加わったレコードを索引へ反映（同じIDは既存の後ろ＝リスト上の順）"""
+        if self._index_version != self._version:
+            return
+        order_key = self._order_key(record)
+        pos = bisect.bisect_right(self._order_keys, order_key)
+        self._order_keys.insert(pos, order_key)
+        self._order.insert(pos, record)
+        if not order_key[0]:
+            self._by_id.setdefault(order_key[1], record)
+
+    def _index_removed(self, record):
+        if self._index_version != self._version:
+            return
+        pos = next((i for i, r in enumerate(self._order) if r is record), None)
+        if pos is None:
+            self.mark_dirty()
+            return
+        order_key = self._order_keys.pop(pos)
+        del self._order[pos]
+        if not order_key[0] and self._by_id.get(order_key[1]) is record:
+            # 同じIDの次のレコード（ID順の並びでは直後）を繰り上げる
+            if pos < len(self._order) and self._order_keys[pos] == order_key:
+                self._by_id[order_key[1]] = self._order[pos]
+            else:
+                del self._by_id[order_key[1]]
+
+    def _ensure_index(self):
+        if self._index_version == self._version:
+            return
+        keyed = sorted(((self._order_key(record), i) for i, record in enumerate(self)))
+        by_id = {}
+        for (is_none, key), i in keyed:
+            # ID重複時は線形探索と同じくリスト上で先のレコードを返す
+            if not is_none and key not in by_id:
+                by_id[key] = self[i]
+        self._by_id = by_id
+        self._order_keys = [order_key for order_key, _i in keyed]
+        self._order = [self[i] for _order_key, i in keyed]
+        self._index_version = self._version
+
+    def _ensure_coordinates(self):
+        if self._coords_version == self._version:
+            return
+        self._ids = np.array([self._id_key(record) or 0 for record in self], dtype=np.int64)
+        self._xs = np.array([record.get('x', 0) or 0 for record in self], dtype=np.float64)
+        self._ys = np.array([record.get('y', 0) or 0 for record in self], dtype=np.float64)
+        self._coords_version = self._version
+
+    def find_by_id(self, annotation_id):
+        try:
+            key = int(annotation_id)
+        except (TypeError, ValueError):
+            return None
+        self._ensure_index()
+        record = self._by_id.get(key)
+        if record is None and self._verified_version != self._version:
+            # mark_dirty() 無しでIDが書き換えられていないか、変更後の最初の検索失敗時に1回だけ線形に確かめる
+            self._verified_version = self._version
+            if any(self._id_key(r) == key for r in self):
+                record = self._rebuild_and_find(key)
+        elif record is not None and self._id_key(record) != key:
+            record = self._rebuild_and_find(key)
+        return record
+
+    def _rebuild_and_find(self, key):
+        self.mark_dirty()
+        self._ensure_index()
+        self._verified_version = self._version
+        return self._by_id.get(key)
+
+    def sorted_by_id(self):
+        """ID順（同じIDはリスト上の順）に並べたレコードのリスト"""
+        self._ensure_index()
+        return list(self._order)
+
+    def max_id(self):
+        self._ensure_index()
+        for is_none, key in reversed(self._order_keys):
+            if not is_none:
+                return key
+        return 0
+
+    def coordinates(self):
+        """(ids, xs, ys) の NumPy 配列（リストと同じ並び・元画像ピクセル座標）"""
+        self._ensure_coordinates()
+        return self._ids, self._xs, self._ys
+
+    def nearest(self, x, y, max_distance):
+        """(x, y) から max_distance 未満で最も近いレコード（無ければ None）"""
+        self._ensure_coordinates()
+        if not len(self._xs):
+            return None
+        dist2 = (self._xs - x) ** 2 + (self._ys - y) ** 2
+        index = int(np.argmin(dist2))
+        if dist2[index] >= max_distance ** 2:
+            return None
+        return self[index]
+
+    def remove_id(self, annotation_id):
+        """指定IDのレコードをすべて取り除く"""
+        for index in range(len(self) - 1, -1, -1):
+            if self[index].get('id') == annotation_id:
+                del self[index]
+
+
 class OrthoImageAnnotationSystem:
+    # テーブル行の表示内容に関わる項目（差分更新の判定用）
+    TABLE_FIELDS = (
+        'area_no', 'pcs_no', 'junction_box_no', 'circuit_no', 'array_no',
+        'module_position', 'serial_no', 'defect_type',
+    )
+    # これを超える件数は表示範囲の行だけを生成する仮想表示に切り替える
+    VIRTUAL_TABLE_THRESHOLD = 3000
+    TABLE_FILTER_ALL = "すべて"
+
     def __init__(self, root):
         self.root = root
         self.root.title("太陽光発電所 オルソ画像アノテーションシステム v2.2")
@@ -1958,7 +4237,7 @@ class OrthoImageAnnotationSystem:
         # 変数の初期化
         self.current_image = None
         self.image_path = None
-        self.annotations = []
+        self.annotations = AnnotationStore()
         self.next_id = 1
         self.project_name = ""
         self.project_path = ""
@@ -1973,7 +4252,17 @@ class OrthoImageAnnotationSystem:
         self.annotation_icon_dir = os.path.join(base_dir, "アノテーション画像フォルダ")
         self.annotation_icon_cache = {}
         self.annotation_icon_tk_cache = {}
+        self.annotation_icon_generation = 0  # アイコン再読み込みごとに進める
         self.canvas_icon_refs = []  # キャンバス上でTkイメージを保持
+        # 編集ダイアログのプレビュー用（表示サイズに縮小済みの画像を、タブ・ダイアログ間で共有）
+        self.annotation_preview_cache = ImageMemoryCache(32 * 1024 * 1024)
+        # 同プレビューの拡大表示用（原寸デコード画像）
+        self.annotation_fullres_cache = ImageMemoryCache(256 * 1024 * 1024)
+        # 注釈ごとの派生情報（画像の有無・拡張子・出力ファイル名）と画像パスの存在確認結果
+        self._annotation_derived_cache = {}
+        # 編集ダイアログで注釈付き画像を書き出し中のプレビュー
+        self._annotation_exports = set()
+        self._path_exists_cache = {}
         self.annotation_default_icon_size = 64
         self._icon_warning_shown = False
         self._icon_dir_missing_warned = False
@@ -2138,13 +4427,61 @@ class OrthoImageAnnotationSystem:
         table_frame = ttk.LabelFrame(main_frame, text="不具合テーブル", padding=10)
         table_frame.pack(fill=tk.BOTH, expand=True)
 
+        # 絞り込み（不良分類・管理レベル・エリア）
+        table_filter_frame = ttk.Frame(table_frame)
+        table_filter_frame.pack(side=tk.TOP, fill=tk.X, pady=(0, 5))
+        ttk.Label(table_filter_frame, text="不良分類:").pack(side=tk.LEFT)
+        self.table_defect_filter_var = tk.StringVar(value=self.TABLE_FILTER_ALL)
+        self.table_defect_filter_combo = ttk.Combobox(
+            table_filter_frame, textvariable=self.table_defect_filter_var, state="readonly", width=15,
+            values=[self.TABLE_FILTER_ALL] + list(self.defect_types.keys())
+        )
+        self.table_defect_filter_combo.pack(side=tk.LEFT, padx=(5, 10))
+        ttk.Label(table_filter_frame, text="管理レベル:").pack(side=tk.LEFT)
+        self.table_level_filter_var = tk.StringVar(value=self.TABLE_FILTER_ALL)
+        table_level_filter_combo = ttk.Combobox(
+            table_filter_frame, textvariable=self.table_level_filter_var, state="readonly", width=6,
+            values=[self.TABLE_FILTER_ALL] + MANAGEMENT_LEVELS
+        )
+        table_level_filter_combo.pack(side=tk.LEFT, padx=(5, 10))
+        ttk.Label(table_filter_frame, text="エリア:").pack(side=tk.LEFT)
+        self.table_area_filter_var = tk.StringVar(value=self.TABLE_FILTER_ALL)
+        self.table_area_filter_combo = ttk.Combobox(
+            table_filter_frame, textvariable=self.table_area_filter_var, state="readonly", width=10,
+            values=[self.TABLE_FILTER_ALL]
+        )
+        self.table_area_filter_combo.pack(side=tk.LEFT, padx=(5, 10))
+        for combo in (self.table_defect_filter_combo, table_level_filter_combo, self.table_area_filter_combo):
+            combo.bind("<<ComboboxSelected>>", self.on_table_filter_change)
+
         # Treeview - 列を追加
         columns = ("ID", "エリア番号", "PCS番号", "接続箱番号", "回路番号", "アレイ№", "モジュール位置", "シリアル№", "不良分類", "形状", "サーモ画像", "可視画像", "備考", "報告年月日")
+        self.table_columns = columns
         self.tree = ttk.Treeview(table_frame, columns=columns, show="headings", height=8)
 
+        # テーブルの表示状態（差分更新・並び替え・絞り込み・仮想表示）
+        self._table_rows = {}  # iid -> 表示中の行の値（通常表示）
+        self._table_entries = []
+        self._table_iid_by_id = {}
+        self._table_data_version = 0
+        self._table_filter_choices_version = None
+        self._table_sort = (0, False)  # (列番号, 降順)
+        self._table_sort_chosen = False  # 見出しクリックで並び順を選んだか（初期状態はID昇順）
+        self._table_filters = {"defect_type": None, "management_level": None, "area_no": None}
+        self._table_view = []
+        self._table_view_index = {}
+        self._table_view_key = None
+        self._table_virtual = False
+        self._virtual_start = 0
+        self._virtual_slots = []
+        self._virtual_slot_values = {}
+        self._virtual_selected_id = None
+        self._virtual_selected_slot = None
+        self._virtual_render_job = None
+
         # 列の設定
         for col in columns:
-            self.tree.heading(col, text=col)
+            self.tree.heading(col, text=col, command=lambda c=col: self.sort_table_by_column(c))
             if col == "ID":
                 self.tree.column(col, width=50, anchor="center")
             elif col in ["エリア番号", "PCS番号", "接続箱番号", "回路番号", "アレイ№"]:
@@ -2165,6 +4502,7 @@ class OrthoImageAnnotationSystem:
         # スクロールバー
         tree_scroll = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.tree.yview)
         self.tree.configure(yscrollcommand=tree_scroll.set)
+        self.tree_scroll = tree_scroll
 
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
@@ -2172,6 +4510,13 @@ class OrthoImageAnnotationSystem:
         # テーブルイベント
         self.tree.bind("<Double-1>", self.on_tree_double_click)
         self.tree.bind("<Delete>", self.delete_annotation)
+        self.tree.bind("<<TreeviewSelect>>", self._on_table_select)
+        self.tree.bind("<Configure>", self._schedule_virtual_table_render)
+        self.tree.bind("<MouseWheel>", self._on_table_mouse_wheel)
+        self.tree.bind("<Button-4>", self._on_table_mouse_wheel)
+        self.tree.bind("<Button-5>", self._on_table_mouse_wheel)
+        self.tree.bind("<Up>", lambda e: self._on_table_key_step(-1))
+        self.tree.bind("<Down>", lambda e: self._on_table_key_step(1))
 
         # キーボードショートカット（ズーム操作）
         self.root.bind("<Control-plus>", lambda e: self.zoom_in())
@@ -2432,6 +4777,8 @@ class OrthoImageAnnotationSystem:
         self.missing_icon_types.clear()
         self.annotation_icon_cache.clear()
         self.annotation_icon_tk_cache.clear()
+        # 編集ダイアログ側で保持しているアイコンも引き直させる
+        self.annotation_icon_generation += 1
 
         icon_dir = self.annotation_icon_dir
         if not os.path.isdir(icon_dir):
@@ -2621,6 +4968,56 @@ class OrthoImageAnnotationSystem:
             elif shape == "rectangle":
                 self.draw_rectangle(x, y, color, annotation['id'])
 
+    def write_annotated_export(self, job):
+        """編集ダイアログの注釈付き画像を描画して保存（ワーカースレッド用）
+
+        一時ファイルへ書いてから置き換えるため、失敗しても既存の出力は壊れない。失敗時は例外を送出。
+        """
+        with Image.open(job["image_path"]) as src:
+            working_image = src.convert("RGBA")
+        draw = ImageDraw.Draw(working_image)
+        for point in job["points"]:
+            x = point["x"]
+            y = point["y"]
+            icon_height = self.draw_annotation_icon_on_image(
+                working_image,
+                draw,
+                x,
+                y,
+                job["defect_name"],
+                job["color"],
+                job["shape_code"],
+                job["annotation_scale"]
+            )
+
+            self._draw_id_label_on_image(
+                draw,
+                x,
+                y,
+                job["annotation_id"],
+                job["color"],
+                working_image.size,
+                job["annotation_scale"],
+                icon_height,
+            )
+
+        output_path = job["output_path"]
+        stem, file_ext = os.path.splitext(output_path)
+        save_image = working_image
+        if file_ext.lower() in (".jpg", ".jpeg") and save_image.mode not in ("RGB", "L"):
+            save_image = save_image.convert("RGB")
+        tmp_path = f"{stem}.saving{file_ext}"
+        try:
+            save_image.save(tmp_path)
+            os.replace(tmp_path, output_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+            raise
+
     def draw_annotation_icon_on_image(self, image, draw, x, y, defect_type, color, fallback_shape, scale_multiplier=1.0):
         try:
             scale_multiplier = float(scale_multiplier)
@@ -2762,9 +5159,14 @@ class OrthoImageAnnotationSystem:
         if new_id_int <= 0:
             raise ValueError("ID番号は 1 以上である必要があります。")
 
+        if self.annotation_export_in_progress():
+            # 書き出し完了時に旧IDのファイル名で確定されるのを防ぐ
+            raise ValueError("注釈付き画像の書き出し中はID番号を変更できません。完了してからやり直してください。")
+
         previous_ids = {id(ann): ann.get('id') for ann in self.annotations}
         annotation['id'] = new_id_int
         self._resolve_id_conflicts(annotation)
+        self.annotations.mark_dirty()
 
         changed_annotations = []
         for ann in self.annotations:
@@ -2776,11 +5178,10 @@ class OrthoImageAnnotationSystem:
             for target_annotation, old_id, updated_id in changed_annotations:
                 self._update_annotation_files_for_id_change(target_annotation, old_id, updated_id)
 
-        order_map = {id(ann): idx for idx, ann in enumerate(self.annotations)}
-        self.annotations.sort(key=lambda ann: (ann.get('id', 0), order_map.get(id(ann), 0)))
+        self.annotations[:] = self.annotations.sorted_by_id()
 
         if self.annotations:
-            self.next_id = max(ann.get('id', 0) for ann in self.annotations) + 1
+            self.next_id = self.annotations.max_id() + 1
         else:
             self.next_id = 1
 
@@ -2881,24 +5282,31 @@ class OrthoImageAnnotationSystem:
                 annotation[key] = new_path
 
     def find_annotation_by_id(self, annotation_id):
-        for annotation in self.annotations:
-            try:
-                if int(annotation.get('id')) == int(annotation_id):
-                    return annotation
-            except (TypeError, ValueError):
-                continue
-        return None
+        return self.annotations.find_by_id(annotation_id)
 
     def _select_tree_item_by_id(self, annotation_id):
         if annotation_id is None:
             return
-        for item in self.tree.get_children():
-            values = self.tree.item(item, "values")
-            if values and str(values[0]) == str(annotation_id):
-                self.tree.selection_set(item)
-                self.tree.focus(item)
-                self.tree.see(item)
-                break
+        iid = getattr(self, "_table_iid_by_id", {}).get(str(annotation_id))
+        if iid is None:
+            return
+        if self._table_virtual:
+            index = self._table_view_index.get(iid)
+            if index is None:
+                return
+            self._virtual_selected_id = str(annotation_id)
+            capacity = self._virtual_table_capacity()
+            if not (self._virtual_start <= index < self._virtual_start + capacity):
+                self._virtual_start = max(0, index - capacity // 2)
+            self._render_virtual_table()
+            slot = self._virtual_slots[index - self._virtual_start] if index - self._virtual_start < len(self._virtual_slots) else None
+            if slot is not None:
+                self.tree.focus(slot)
+            return
+        if self.tree.exists(iid):
+            self.tree.selection_set(iid)
+            self.tree.focus(iid)
+            self.tree.see(iid)
 
     def prompt_id_change_from_table(self, annotation):
         if not annotation:
@@ -2997,18 +5405,10 @@ class OrthoImageAnnotationSystem:
         canvas_x = self.canvas.canvasx(event.x)
         canvas_y = self.canvas.canvasy(event.y)
 
-        # 最も近いアノテーションを検索
-        min_distance = float('inf')
-        selected_annotation = None
-
-        for annotation in self.annotations:
-            ann_x = annotation["x"] * self.zoom_factor
-            ann_y = annotation["y"] * self.zoom_factor
-            distance = ((canvas_x - ann_x) ** 2 + (canvas_y - ann_y) ** 2) ** 0.5
-
-            if distance < 30 and distance < min_distance:
-                min_distance = distance
-                selected_annotation = annotation
+        # 最も近いアノテーションを検索（画面上 30px 以内）
+        selected_annotation = self.annotations.nearest(
+            canvas_x / self.zoom_factor, canvas_y / self.zoom_factor, 30 / self.zoom_factor
+        )
 
         if selected_annotation:
             self.edit_annotation_dialog(selected_annotation)
@@ -3018,18 +5418,10 @@ class OrthoImageAnnotationSystem:
         canvas_x = self.canvas.canvasx(event.x)
         canvas_y = self.canvas.canvasy(event.y)
 
-        # 最も近いアノテーションを検索
-        min_distance = float('inf')
-        selected_annotation = None
-
-        for annotation in self.annotations:
-            ann_x = annotation["x"] * self.zoom_factor
-            ann_y = annotation["y"] * self.zoom_factor
-            distance = ((canvas_x - ann_x) ** 2 + (canvas_y - ann_y) ** 2) ** 0.5
-
-            if distance < 30 and distance < min_distance:
-                min_distance = distance
-                selected_annotation = annotation
+        # 最も近いアノテーションを検索（画面上 30px 以内）
+        selected_annotation = self.annotations.nearest(
+            canvas_x / self.zoom_factor, canvas_y / self.zoom_factor, 30 / self.zoom_factor
+        )
 
         if selected_annotation:
             if messagebox.askyesno("確認", f"ID{selected_annotation['id']}のアノテーションを削除しますか？"):
@@ -3037,11 +5429,15 @@ class OrthoImageAnnotationSystem:
 
     def delete_annotation_by_id(self, annotation_id):
         """指定されたIDのアノテーションを削除し、ID番号を振り直し"""
+        if self.annotation_export_in_progress():
+            # ID振り直しに伴うファイル名変更と書き出し結果の確定が競合しないようにする
+            messagebox.showwarning("警告", "注釈付き画像の書き出し中です。完了してから削除してください。")
+            return
         # キャンバスからアノテーション画像を削除
         self.canvas.delete(f"annotation_{annotation_id}")
         
         # アノテーションを削除
-        self.annotations = [ann for ann in self.annotations if ann['id'] != annotation_id]
+        self.annotations.remove_id(annotation_id)
 
         # ID番号を振り直し
         self.reassign_ids()
@@ -3056,8 +5452,7 @@ class OrthoImageAnnotationSystem:
             self.next_id = 1
             return
 
-        order_map = {id(ann): idx for idx, ann in enumerate(self.annotations)}
-        self.annotations.sort(key=lambda ann: (ann.get('id', 0), order_map.get(id(ann), 0)))
+        self.annotations[:] = self.annotations.sorted_by_id()
 
         changed = []
         for index, annotation in enumerate(self.annotations, 1):
@@ -3067,6 +5462,7 @@ class OrthoImageAnnotationSystem:
                 annotation['id'] = index
 
         if changed:
+            self.annotations.mark_dirty()
             for ann, old_id, new_id in changed:
                 self._update_annotation_files_for_id_change(ann, old_id, new_id)
 
@@ -3089,7 +5485,7 @@ class OrthoImageAnnotationSystem:
             item = self.tree.item(selected_item[0])
             annotation_id = int(item['values'][0])
 
-            annotation = next((ann for ann in self.annotations if ann['id'] == annotation_id), None)
+            annotation = self.annotations.find_by_id(annotation_id)
             if annotation:
                 self.edit_annotation_dialog(annotation)
 
@@ -3414,15 +5810,29 @@ class OrthoImageAnnotationSystem:
                 self.canvas = tk.Canvas(self.frame, width=self.canvas_width, height=self.canvas_height, bg="#1f1f1f", highlightthickness=0)
                 self.canvas.pack(fill=tk.BOTH, expand=True)
 
-                ttk.Label(self.frame, text="左クリック: アノテーション追加 / 右クリック: 削除", foreground="#666666").pack(fill=tk.X, pady=(6, 8))
+                ttk.Label(
+                    self.frame,
+                    text="左クリック: アノテーション追加 / 右クリック: 削除 / ホイール: 拡大縮小 / 中ボタンドラッグ: 移動",
+                    foreground="#666666"
+                ).pack(fill=tk.X, pady=(6, 8))
 
                 control_frame = ttk.Frame(self.frame)
                 control_frame.pack(fill=tk.X)
+                ttk.Button(control_frame, text="－", width=3, command=lambda: self.set_view_zoom(self.view_zoom / 1.25)).pack(side=tk.LEFT)
+                ttk.Button(control_frame, text="＋", width=3, command=lambda: self.set_view_zoom(self.view_zoom * 1.25)).pack(side=tk.LEFT, padx=(4, 0))
+                ttk.Button(control_frame, text="全体", width=5, command=lambda: self.set_view_zoom(1.0)).pack(side=tk.LEFT, padx=(4, 0))
+                self.zoom_label_var = tk.StringVar(value="")
+                ttk.Label(control_frame, textvariable=self.zoom_label_var, width=8).pack(side=tk.LEFT, padx=(8, 0))
                 ttk.Button(control_frame, text="決定", command=self.confirm).pack(side=tk.RIGHT, padx=(8, 0))
                 ttk.Button(control_frame, text="キャンセル", command=self.cancel).pack(side=tk.RIGHT)
 
                 self.canvas.bind("<Button-1>", self.on_left_click)
                 self.canvas.bind("<Button-3>", self.on_right_click)
+                self.canvas.bind("<MouseWheel>", self.on_mouse_wheel)
+                self.canvas.bind("<Button-4>", self.on_mouse_wheel)
+                self.canvas.bind("<Button-5>", self.on_mouse_wheel)
+                self.canvas.bind("<ButtonPress-2>", self.on_pan_start)
+                self.canvas.bind("<B2-Motion>", self.on_pan_move)
 
                 self.image_path = None
                 self.tk_image = None
@@ -3434,6 +5844,25 @@ class OrthoImageAnnotationSystem:
                 self.original_points = []
                 self.working_points = []
                 self.icon_refs = []
+                self._overlay_tags = []
+                self._overlay_seq = itertools.count()
+                self._overlay_icon = None
+                self._overlay_icon_defect = object()
+                self._drawn_style = None
+                self._drawn_icon = None
+                self.view_zoom = 1.0
+                self.fit_scale = 1.0
+                self.original_size = (0, 0)
+                self._fit_display_size = (0, 0)
+                self._source_key = None
+                self._tile_renderer = None
+                self._tile_render_job = None
+                self._export_thread = None
+                self._pending_export = None
+                self._export_results = queue.Queue()
+                # 書き出し中（未反映）の点。完了までは未保存扱いの判定にこちらを使う
+                self._confirming_points = None
+                self.export_failed = False
 
                 self.update_source(initial_path, overlay_points or [])
 
@@ -3453,35 +5882,163 @@ class OrthoImageAnnotationSystem:
                 self.offset_y = 0
                 self.display_width = 0
                 self.display_height = 0
+                self.view_zoom = 1.0
+                self._tile_renderer = None
+                self._source_key = None
+                self.zoom_label_var.set("")
+                self.canvas.configure(scrollregion=(0, 0, self.canvas_width, self.canvas_height))
+                self.canvas.xview_moveto(0)
+                self.canvas.yview_moveto(0)
 
-                if not self.image_path or not os.path.exists(self.image_path):
+                try:
+                    stat = os.stat(self.image_path) if self.image_path else None
+                except OSError:
+                    stat = None
+                if stat is None:
                     self.status_var.set("画像未選択です。")
                     self.canvas.create_text(self.canvas_width / 2, self.canvas_height / 2, text="画像が選択されていません", fill="#aaaaaa")
                     return
 
-                try:
-                    with Image.open(self.image_path) as img:
-                        img = img.convert("RGBA")
-                        width, height = img.size
+                # 同じ画像（更新なし）を同じキャンバスサイズで表示済みなら縮小処理を省く
+                cache_key = (
+                    os.path.abspath(self.image_path), stat.st_mtime_ns, stat.st_size,
+                    self.canvas_width, self.canvas_height,
+                )
+                cached = self.outer.annotation_preview_cache.get(cache_key)
+                if cached is None:
+                    try:
+                        canvas_size = (self.canvas_width, self.canvas_height)
+                        img, (width, height) = open_image_reduced(self.image_path, canvas_size, with_original_size=True)
                         scale = min(self.canvas_width / width, self.canvas_height / height, 1.0)
                         display_size = (max(1, int(width * scale)), max(1, int(height * scale)))
-                        display_image = img.resize(display_size, Image.Resampling.LANCZOS) if scale != 1.0 else img.copy()
-                except Exception as e:
-                    self.status_var.set(f"画像を読み込めません: {e}")
-                    self.canvas.create_text(self.canvas_width / 2, self.canvas_height / 2, text="読み込み失敗", fill="#ff6666")
+                        display_image = img.resize(display_size, Image.Resampling.LANCZOS) if img.size != display_size else img
+                    except Exception as e:
+                        self.status_var.set(f"画像を読み込めません: {e}")
+                        self.canvas.create_text(self.canvas_width / 2, self.canvas_height / 2, text="読み込み失敗", fill="#ff6666")
+                        return
+                    cached = (ImageTk.PhotoImage(display_image), (width, height), display_size)
+                    self.outer.annotation_preview_cache.put(cache_key, cached)
+                tk_image, (width, height), display_size = cached
+                self._source_key = cache_key[:3]
+                self.original_size = (width, height)
+                self._fit_display_size = display_size
+                self.fit_scale = width and (display_size[0] / width) or 1.0
+
+                self.canvas.create_rectangle(0, 0, self.canvas_width, self.canvas_height, fill="#1f1f1f", outline="", tags="background")
+                self.tk_image = tk_image
+                self._apply_view()
+                self.status_var.set(f"{os.path.basename(self.image_path)} / {width}x{height}px")
+                self.redraw_overlays()
+
+            def _max_view_zoom(self):
+                # 原寸の4倍表示まで（縮小表示から見た倍率）
+                return max(1.0, 4.0 / self.fit_scale) if self.fit_scale else 1.0
+
+            def _apply_view(self):
+                """現在の倍率で背景画像を配置（全体表示はキャッシュ済み縮小画像、拡大時はタイル描画）"""
+                width, height = self.original_size
+                self.canvas.delete("base_image")
+                self.canvas.delete("image_tile")
+                if self.view_zoom <= 1.0:
+                    self.view_zoom = 1.0
+                    self.display_width, self.display_height = self._fit_display_size
+                    self.display_scale = self.fit_scale
+                    self.offset_x = (self.canvas_width - self.display_width) / 2
+                    self.offset_y = (self.canvas_height - self.display_height) / 2
+                    self.canvas.configure(scrollregion=(0, 0, self.canvas_width, self.canvas_height))
+                    self.canvas.xview_moveto(0)
+                    self.canvas.yview_moveto(0)
+                    self.canvas.create_image(self.offset_x, self.offset_y, anchor=tk.NW, image=self.tk_image, tags="base_image")
+                else:
+                    self.display_scale = self.fit_scale * self.view_zoom
+                    self.display_width = max(1, int(width * self.display_scale))
+                    self.display_height = max(1, int(height * self.display_scale))
+                    self.offset_x = max(0.0, (self.canvas_width - self.display_width) / 2)
+                    self.offset_y = max(0.0, (self.canvas_height - self.display_height) / 2)
+                    self.canvas.configure(scrollregion=(
+                        0, 0, self.display_width + 2 * self.offset_x, self.display_height + 2 * self.offset_y
+                    ))
+                    self._tile_renderer.reset_canvas_items()
+                self.canvas.tag_lower("background")
+                self.zoom_label_var.set(f"{self.display_scale * 100:.0f}%")
+
+            def _get_tile_renderer(self):
+                """原寸画像のタイル描画器（デコード結果はダイアログ間で共有）"""
+                if self._tile_renderer is not None:
+                    return self._tile_renderer
+                full_image = self.outer.annotation_fullres_cache.get(self._source_key)
+                if full_image is None:
+                    try:
+                        full_image = open_image_reduced(self.image_path)
+                    except Exception as e:
+                        self.status_var.set(f"拡大表示用の画像を読み込めません: {e}")
+                        return None
+                    self.outer.annotation_fullres_cache.put(self._source_key, full_image)
+                self._tile_renderer = TiledImageRenderer(full_image)
+                return self._tile_renderer
+
+            def _render_tiles(self):
+                self._tile_render_job = None
+                if self.view_zoom <= 1.0 or self._tile_renderer is None:
                     return
+                view_w = max(self.canvas.winfo_width(), self.canvas_width)
+                view_h = max(self.canvas.winfo_height(), self.canvas_height)
+                viewport = (
+                    self.canvas.canvasx(0),
+                    self.canvas.canvasy(0),
+                    self.canvas.canvasx(view_w),
+                    self.canvas.canvasy(view_h),
+                )
+                self._tile_renderer.render(
+                    self.canvas, self.display_scale, viewport, tag="image_tile", offset=(self.offset_x, self.offset_y)
+                )
+                self.canvas.tag_lower("background")
 
-                self.display_width, self.display_height = display_size
-                self.display_scale = width and (display_size[0] / width) or 1.0
-                self.offset_x = (self.canvas_width - self.display_width) / 2
-                self.offset_y = (self.canvas_height - self.display_height) / 2
+            def _schedule_tile_render(self):
+                if self._tile_render_job is None:
+                    self._tile_render_job = self.canvas.after_idle(self._render_tiles)
 
-                self.canvas.create_rectangle(0, 0, self.canvas_width, self.canvas_height, fill="#1f1f1f", outline="")
-                self.tk_image = ImageTk.PhotoImage(display_image)
-                self.canvas.create_image(self.offset_x, self.offset_y, anchor=tk.NW, image=self.tk_image, tags="base_image")
-                self.status_var.set(f"{os.path.basename(self.image_path)} / {width}x{height}px")
+            def set_view_zoom(self, zoom, anchor=None):
+                """表示倍率を変更（anchor のウィジェット座標にある画素が同じ位置に留まるようスクロール）"""
+                if not self.tk_image:
+                    return
+                zoom = max(1.0, min(zoom, self._max_view_zoom()))
+                if abs(zoom - self.view_zoom) < 1e-6:
+                    return
+                if zoom > 1.0 and self._get_tile_renderer() is None:
+                    return
+                if anchor is None:
+                    anchor = (self.canvas_width / 2, self.canvas_height / 2)
+                anchor_x, anchor_y = anchor
+                original_x = (self.canvas.canvasx(anchor_x) - self.offset_x) / self.display_scale
+                original_y = (self.canvas.canvasy(anchor_y) - self.offset_y) / self.display_scale
+                self.view_zoom = zoom
+                self._apply_view()
+                if self.view_zoom > 1.0:
+                    region_w = self.display_width + 2 * self.offset_x
+                    region_h = self.display_height + 2 * self.offset_y
+                    self.canvas.xview_moveto(max(0.0, (original_x * self.display_scale + self.offset_x - anchor_x) / region_w))
+                    self.canvas.yview_moveto(max(0.0, (original_y * self.display_scale + self.offset_y - anchor_y) / region_h))
+                    self._render_tiles()
                 self.redraw_overlays()
 
+            def on_mouse_wheel(self, event):
+                if getattr(event, "num", None) == 5 or getattr(event, "delta", 0) < 0:
+                    factor = 1 / 1.25
+                else:
+                    factor = 1.25
+                self.set_view_zoom(self.view_zoom * factor, anchor=(event.x, event.y))
+                return "break"
+
+            def on_pan_start(self, event):
+                if self.view_zoom > 1.0:
+                    self.canvas.scan_mark(event.x, event.y)
+
+            def on_pan_move(self, event):
+                if self.view_zoom > 1.0:
+                    self.canvas.scan_dragto(event.x, event.y, gain=1)
+                    self._schedule_tile_render()
+
             def _current_color(self):
                 defect_name = self.defect_combo.get() or self.annotation.get("defect_type")
                 return self.outer.defect_types.get(defect_name, "#FF0000")
@@ -3492,58 +6049,122 @@ class OrthoImageAnnotationSystem:
                     return self.outer.annotation_shapes[shape_label]
                 return self.annotation.get("shape", "cross")
 
+            def _overlay_style(self):
+                defect_name = self.defect_combo.get() or self.annotation.get("defect_type")
+                return (defect_name, self._current_shape_code(), self._current_color())
+
+            def _resolve_overlay_icon(self, defect_name):
+                # 不良分類が変わった時・アイコンが再読み込みされた時だけ引き直す
+                key = (defect_name, getattr(self.outer, "annotation_icon_generation", 0))
+                if key != self._overlay_icon_defect:
+                    icon_size = max(24, int(self.outer.annotation_default_icon_size * 0.9))
+                    self._overlay_icon = self.outer.get_tk_icon(defect_name, icon_size)
+                    # 読み込めなかった場合は記憶せず、次回も引き直す
+                    self._overlay_icon_defect = key if self._overlay_icon is not None else object()
+                return self._overlay_icon
+
             def redraw_overlays(self):
+                """全点の描画を作り直す（画像や表示倍率が変わった時）"""
                 self.canvas.delete("overlay")
+                self._overlay_tags = []
+                self._drawn_style = None
                 if not self.tk_image:
                     return
 
-                self.icon_refs = []
-                color = self._current_color()
-                shape_code = self._current_shape_code()
-                defect_name = self.defect_combo.get() or self.annotation.get("defect_type")
-                icon_size = max(24, int(self.outer.annotation_default_icon_size * 0.9))
-                tk_icon = self.outer.get_tk_icon(defect_name, icon_size)
-
+                style = self._overlay_style()
+                tk_icon = self._resolve_overlay_icon(style[0])
+                self.icon_refs = [tk_icon] if tk_icon else []
+                self._drawn_style = style
+                self._drawn_icon = tk_icon
                 for point in self.working_points:
-                    disp_x = point["x"] * self.display_scale + self.offset_x
-                    disp_y = point["y"] * self.display_scale + self.offset_y
-
-                    if tk_icon:
-                        self.canvas.create_image(
-                            disp_x,
-                            disp_y,
-                            image=tk_icon,
-                            anchor=tk.CENTER,
-                            tags="overlay"
-                        )
-                        self.icon_refs.append(tk_icon)
-                        label_y = disp_y - (tk_icon.height() / 2) - 6
-                        self.canvas.create_text(
-                            disp_x,
-                            label_y,
-                            text=f"ID{self.annotation['id']}",
-                            fill="white",
-                            font=("Arial", 10, "bold"),
-                            tags="overlay"
-                        )
-                    else:
-                        self._draw_shape_on_canvas(disp_x, disp_y, color, shape_code)
+                    self._overlay_tags.append(self._draw_point(point, tk_icon, style))
+
+            def _draw_point(self, point, tk_icon, style):
+                """1点分のキャンバス項目を作成し、その点専用のタグを返す"""
+                tag = f"overlay_p{next(self._overlay_seq)}"
+                disp_x = point["x"] * self.display_scale + self.offset_x
+                disp_y = point["y"] * self.display_scale + self.offset_y
+
+                if tk_icon:
+                    self.canvas.create_image(
+                        disp_x,
+                        disp_y,
+                        image=tk_icon,
+                        anchor=tk.CENTER,
+                        tags=("overlay", "overlay_icon", tag)
+                    )
+                    label_y = disp_y - (tk_icon.height() / 2) - 6
+                    self.canvas.create_text(
+                        disp_x,
+                        label_y,
+                        text=f"ID{self.annotation['id']}",
+                        fill="white",
+                        font=("Arial", 10, "bold"),
+                        tags=("overlay", tag)
+                    )
+                else:
+                    self._draw_shape_on_canvas(disp_x, disp_y, style[2], style[1], tag)
+                return tag
+
+            def add_overlay_point(self, point):
+                self.working_points.append(point)
+                if not self.tk_image:
+                    return
+                self.refresh_overlay_style()
+                self._overlay_tags.append(self._draw_point(point, self._drawn_icon, self._drawn_style))
+
+            def remove_overlay_point(self, index):
+                self.working_points.pop(index)
+                if index < len(self._overlay_tags):
+                    self.canvas.delete(self._overlay_tags.pop(index))
+
+            def refresh_overlay_style(self):
+                """不良分類・形状の変更を反映（アイコンや色だけの変更は一括 itemconfigure）"""
+                if not self.tk_image:
+                    return
+                style = self._overlay_style()
+                if style == self._drawn_style:
+                    # アイコンを読み込めずに図形で描いている場合は、読み込めるようになったか確認する
+                    if self._drawn_icon is not None or self._resolve_overlay_icon(style[0]) is None:
+                        return
+                if self._drawn_style is None:
+                    self.redraw_overlays()
+                    return
+                tk_icon = self._resolve_overlay_icon(style[0])
+                old_icon = self._drawn_icon
+                if tk_icon and old_icon and tk_icon.height() == old_icon.height():
+                    self.canvas.itemconfigure("overlay_icon", image=tk_icon)
+                elif not tk_icon and not old_icon and style[1] == self._drawn_style[1]:
+                    self.canvas.itemconfigure("overlay_fill", fill=style[2])
+                    self.canvas.itemconfigure("overlay_outline", outline=style[2])
+                else:
+                    # アイコン⇔図形の切り替えや図形の種類変更は形が変わるため描き直す
+                    self.redraw_overlays()
+                    return
+                self._drawn_style = style
+                self._drawn_icon = tk_icon
+                self.icon_refs = [tk_icon] if tk_icon else []
 
-            def _draw_shape_on_canvas(self, x, y, color, shape_code):
+            def _draw_shape_on_canvas(self, x, y, color, shape_code, tag):
                 size = 14
+                line_tags = ("overlay", "overlay_fill", tag)
+                outline_tags = ("overlay", "overlay_outline", tag)
                 if shape_code == "cross":
-                    self.canvas.create_line(x, y - size, x, y + size, fill=color, width=2, tags="overlay")
-                    self.canvas.create_line(x - size, y, x + size, y, fill=color, width=2, tags="overlay")
+                    self.canvas.create_line(x, y - size, x, y + size, fill=color, width=2, tags=line_tags)
+                    self.canvas.create_line(x - size, y, x + size, y, fill=color, width=2, tags=line_tags)
                 elif shape_code == "arrow":
-                    self.canvas.create_line(x, y - size, x, y + size, fill=color, width=2, tags="overlay")
-                    self.canvas.create_polygon(x, y - size, x - 6, y - size + 12, x + 6, y - size + 12, fill=color, outline=color, tags="overlay")
+                    self.canvas.create_line(x, y - size, x, y + size, fill=color, width=2, tags=line_tags)
+                    self.canvas.create_polygon(
+                        x, y - size, x - 6, y - size + 12, x + 6, y - size + 12,
+                        fill=color, outline=color, tags=("overlay", "overlay_fill", "overlay_outline", tag)
+                    )
                 elif shape_code == "circle":
                     radius = size
-                    self.canvas.create_oval(x - radius, y - radius, x + radius, y + radius, outline=color, width=2, tags="overlay")
+                    self.canvas.create_oval(x - radius, y - radius, x + radius, y + radius, outline=color, width=2, tags=outline_tags)
                 elif shape_code == "rectangle":
-                    self.canvas.create_rectangle(x - size, y - size, x + size, y + size, outline=color, width=2, tags="overlay")
+                    self.canvas.create_rectangle(x - size, y - size, x + size, y + size, outline=color, width=2, tags=outline_tags)
 
-                self.canvas.create_text(x, y - size - 6, text=f"ID{self.annotation['id']}", fill="white", font=("Arial", 10, "bold"), tags="overlay")
+                self.canvas.create_text(x, y - size - 6, text=f"ID{self.annotation['id']}", fill="white", font=("Arial", 10, "bold"), tags=("overlay", tag))
 
             def on_left_click(self, event):
                 if not self.tk_image:
@@ -3556,8 +6177,7 @@ class OrthoImageAnnotationSystem:
                     return
                 original_x = norm_x / self.display_scale
                 original_y = norm_y / self.display_scale
-                self.working_points.append({"x": original_x, "y": original_y})
-                self.redraw_overlays()
+                self.add_overlay_point({"x": original_x, "y": original_y})
                 self.status_var.set(f"アノテーションを追加しました ({len(self.working_points)}件)")
 
             def on_right_click(self, event):
@@ -3581,53 +6201,19 @@ class OrthoImageAnnotationSystem:
                         min_index = idx
 
                 if min_index is not None:
-                    self.working_points.pop(min_index)
-                    self.redraw_overlays()
+                    self.remove_overlay_point(min_index)
                     self.status_var.set("アノテーションを削除しました。")
 
             def confirm(self):
+                """注釈付き画像をバックグラウンドで描画・保存し、書き込み完了後に点と出力パスを確定する"""
                 if not self.image_path or not os.path.exists(self.image_path):
                     messagebox.showwarning("警告", "画像が選択されていません。")
                     return
 
-                try:
-                    with Image.open(self.image_path) as src:
-                        working_image = src.convert("RGBA")
-                except Exception as e:
-                    messagebox.showerror("エラー", f"画像の読み込みに失敗しました: {e}")
-                    return
-
-                draw = ImageDraw.Draw(working_image)
-                color = self._current_color()
-                shape_code = self._current_shape_code()
                 defect_name = self.defect_combo.get() or self.annotation.get("defect_type")
                 scale_key = self.image_type if self.image_type in ("thermal", "visible") else "overall"
-                annotation_scale = self.outer._get_annotation_scale(scale_key)
-
-                for point in self.working_points:
-                    x = point["x"]
-                    y = point["y"]
-                    icon_height = self.outer.draw_annotation_icon_on_image(
-                        working_image,
-                        draw,
-                        x,
-                        y,
-                        defect_name,
-                        color,
-                        shape_code,
-                        annotation_scale
-                    )
-
-                    self.outer._draw_id_label_on_image(
-                        draw,
-                        x,
-                        y,
-                        self.annotation['id'],
-                        color,
-                        working_image.size,
-                        annotation_scale,
-                        icon_height,
-                    )
+                # Tk 変数・警告ダイアログに触れる処理はメインスレッドで済ませておく
+                self.outer.load_annotation_icon(defect_name)
 
                 if getattr(self.outer, "project_path", None):
                     base_dir = os.path.join(self.outer.project_path, "アノテーション入り画像フォルダ")
@@ -3641,29 +6227,99 @@ class OrthoImageAnnotationSystem:
                     type_dir = os.path.join(base_dir, "可視画像フォルダ")
                 else:
                     type_dir = base_dir
-                
-                os.makedirs(type_dir, exist_ok=True)
+
+                try:
+                    os.makedirs(type_dir, exist_ok=True)
+                except OSError as e:
+                    messagebox.showerror("エラー", f"保存先フォルダを作成できません: {e}", parent=self.frame)
+                    return
 
                 name, ext = os.path.splitext(os.path.basename(self.image_path))
                 if not ext:
                     ext = ".png"
                 output_path = os.path.join(type_dir, f"ID{self.annotation['id']}_{name}_{self.image_type}_annotated{ext}")
+                points = copy.deepcopy(self.working_points)
+                job = {
+                    "image_path": self.image_path,
+                    "points": points,
+                    "defect_name": defect_name,
+                    "color": self._current_color(),
+                    "shape_code": self._current_shape_code(),
+                    "annotation_scale": self.outer._get_annotation_scale(scale_key),
+                    "annotation_id": self.annotation['id'],
+                    "output_path": output_path,
+                }
+                self._confirming_points = copy.deepcopy(points)
+                self.export_failed = False
+                if self._export_thread is not None:
+                    # 書き出し中は最新の内容だけを次に回す（同じファイルへの書き込みを直列化）
+                    self._pending_export = job
+                    self.status_var.set("保存待ち…（前回の書き出しが完了次第保存します）")
+                    return
+                self._start_export(job)
+
+            def _start_export(self, job):
+                self.status_var.set(f"保存中… {os.path.basename(job['output_path'])}")
+                self.outer._annotation_exports.add(self)
+                self._export_thread = threading.Thread(target=self._export_worker, args=(job,), daemon=True)
+                self._export_thread.start()
+                self.outer.root.after(50, self._poll_export)
 
+            def _export_worker(self, job):
                 try:
-                    file_ext = os.path.splitext(output_path)[1].lower()
-                    save_image = working_image
-                    if file_ext in (".jpg", ".jpeg") and save_image.mode not in ("RGB", "L"):
-                        save_image = save_image.convert("RGB")
-                    save_image.save(output_path)
+                    self.outer.write_annotated_export(job)
+                    job["error"] = None
                 except Exception as e:
-                    messagebox.showerror("エラー", f"注釈付き画像の保存に失敗しました: {e}")
+                    job["error"] = e
+                self._export_results.put(job)
+
+            def _poll_export(self):
+                try:
+                    job = self._export_results.get_nowait()
+                except queue.Empty:
+                    self.outer.root.after(50, self._poll_export)
+                    return
+                self._export_thread = None
+                self._finish_export(job)
+                pending, self._pending_export = self._pending_export, None
+                if pending is not None:
+                    self._start_export(pending)
+                else:
+                    self._confirming_points = None
+                    self.outer._annotation_exports.discard(self)
+
+            def _finish_export(self, job):
+                alive = self._is_alive()
+                output_path = job["output_path"]
+                if job["error"] is None:
+                    # ファイルの書き込みが済んでから点と出力パスを確定する
+                    self.annotation[self.annotated_path_key] = output_path
+                    self.annotation[self.annotation_key] = copy.deepcopy(job["points"])
+                    if job["image_path"] == self.image_path:
+                        self.original_points = copy.deepcopy(job["points"])
+                    self.export_failed = False
+                    if alive:
+                        self.status_var.set(f"保存完了: {output_path}")
                     return
+                # 確定前の状態のまま残る（編集中の点は未保存として扱われる）
+                self.export_failed = True
+                message = f"注釈付き画像の保存に失敗しました: {job['error']}"
+                if alive:
+                    self.status_var.set("保存に失敗しました。")
+                    messagebox.showerror("エラー", message, parent=self.frame)
+                else:
+                    # 編集ダイアログを閉じた後はメインウィンドウで通知する
+                    messagebox.showerror("エラー", message, parent=self.outer.root)
+
+            def is_exporting(self):
+                """注釈付き画像の書き出しが実行中・待機中か"""
+                return self._export_thread is not None or self._pending_export is not None
 
-                self.annotation[self.annotated_path_key] = output_path
-                self.annotation[self.annotation_key] = copy.deepcopy(self.working_points)
-                self.original_points = copy.deepcopy(self.working_points)
-                self.status_var.set(f"保存完了: {os.path.basename(output_path)}")
-                messagebox.showinfo("保存完了", f"アノテーション入り画像を保存しました。\n{output_path}")
+            def _is_alive(self):
+                try:
+                    return bool(self.frame.winfo_exists())
+                except tk.TclError:
+                    return False
 
             def cancel(self):
                 self.working_points = copy.deepcopy(self.original_points)
@@ -3674,11 +6330,15 @@ class OrthoImageAnnotationSystem:
                 """未保存の変更があるかチェック"""
                 if not self.image_path:
                     return False
-                # working_pointsとoriginal_pointsを比較
-                if len(self.working_points) != len(self.original_points):
+                # 書き出し中は確定待ちの点を保存済みとみなす
+                saved_points = self.original_points
+                if self.is_exporting() and self._confirming_points is not None:
+                    saved_points = self._confirming_points
+                # working_pointsとsaved_pointsを比較
+                if len(self.working_points) != len(saved_points):
                     return True
                 # 各ポイントを比較（順序も含めて）
-                for wp, op in zip(self.working_points, self.original_points):
+                for wp, op in zip(self.working_points, saved_points):
                     if wp.get("x") != op.get("x") or wp.get("y") != op.get("y"):
                         return True
                 return False
@@ -3706,8 +6366,8 @@ class OrthoImageAnnotationSystem:
         notebook.add(visible_preview.frame, text="可視画像")
 
         def refresh_preview_style(event=None):
-            thermal_preview.redraw_overlays()
-            visible_preview.redraw_overlays()
+            thermal_preview.refresh_overlay_style()
+            visible_preview.refresh_overlay_style()
 
         defect_combo.bind("<<ComboboxSelected>>", refresh_preview_style)
         shape_combo.bind("<<ComboboxSelected>>", refresh_preview_style)
@@ -3874,7 +6534,26 @@ class OrthoImageAnnotationSystem:
 
             self.update_table()
             self.draw_annotations()
-            dialog.destroy()
+            close_after_exports()
+
+        def close_after_exports():
+            """書き出し中の注釈付き画像があれば完了を待って閉じる（失敗した場合は閉じずに残す）"""
+            previews = (thermal_preview, visible_preview)
+            for preview in previews:
+                if not preview.is_exporting():
+                    preview.export_failed = False
+
+            def poll():
+                if not dialog.winfo_exists():
+                    return
+                if any(preview.is_exporting() for preview in previews):
+                    dialog.after(100, poll)
+                    return
+                if any(preview.export_failed for preview in previews):
+                    return
+                dialog.destroy()
+
+            poll()
 
         def check_unsaved_and_close():
             """未保存の変更をチェックしてダイアログを閉じる"""
@@ -3908,7 +6587,7 @@ class OrthoImageAnnotationSystem:
                         visible_preview.confirm()
                 # いいえの場合は何もせずにダイアログを閉じる
             
-            dialog.destroy()
+            close_after_exports()
         
         def cancel_changes():
             check_unsaved_and_close()
@@ -3920,51 +6599,422 @@ class OrthoImageAnnotationSystem:
 
         dialog.protocol("WM_DELETE_WINDOW", check_unsaved_and_close)
 
-    def update_table(self):
-        """テーブルを更新"""
-        # 既存のアイテムをクリア
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+    def _table_row_signature(self, annotation):
+        """行の表示内容を決める項目の組（変化が無ければ行の再計算を省く）"""
+        return (
+            annotation.get('id'),
+            tuple(annotation.get(key, '') for key in self.TABLE_FIELDS),
+            annotation.get('management_level'),
+            annotation.get('shape', 'cross'),
+            annotation.get('thermal_image'),
+            annotation.get('visible_image'),
+            annotation.get('remarks', ''),
+            annotation.get('report_date', ''),
+        )
 
-        # アノテーションをIDでソート
-        sorted_annotations = sorted(self.annotations, key=lambda x: x['id'])
+    def _path_exists_cached(self, path):
+        exists = self._path_exists_cache.get(path)
+        if exists is None:
+            exists = os.path.exists(path)
+            self._path_exists_cache[path] = exists
+        return exists
 
-        # テーブルに追加
-        for annotation in sorted_annotations:
-            shape_name = next((k for k, v in self.annotation_shapes.items() 
-                            if v == annotation.get("shape", "cross")), "十字")
-            
-            # サーモ画像のファイル名を命名規則に従って生成
-            thermal_filename = ""
-            if annotation.get('thermal_image'):
-                src_path = annotation['thermal_image']
-                if os.path.exists(src_path):
-                    thermal_filename = f"ID{annotation['id']}_{annotation['defect_type']}_サーモ異常{os.path.splitext(src_path)[1]}"
-            
-            # 可視画像のファイル名を命名規則に従って生成
-            visible_filename = ""
-            if annotation.get('visible_image'):
-                src_path = annotation['visible_image']
-                if os.path.exists(src_path):
-                    visible_filename = f"ID{annotation['id']}_{annotation['defect_type']}_可視異常{os.path.splitext(src_path)[1]}"
-            
-            values = (
-                annotation['id'],
-                annotation.get('area_no', ''),
-                annotation.get('pcs_no', ''),
-                annotation.get('junction_box_no', ''),
-                annotation.get('circuit_no', ''),
-                annotation.get('array_no', ''),           # 追加
-                annotation.get('module_position', ''),    # 追加
-                annotation.get('serial_no', ''),          # 追加
-                annotation.get('defect_type', ''),
-                shape_name,
-                thermal_filename,
-                visible_filename,
-                annotation.get('remarks', ''),
-                annotation.get('report_date', '')         # 追加
+    def invalidate_annotation_derived(self):
+        """派生情報と画像の存在確認結果を破棄（次回参照時に各画像を1回だけ確認し直す）"""
+        self._annotation_derived_cache.clear()
+        self._path_exists_cache.clear()
+
+    def refresh_annotation_file_state(self):
+        """全注釈の画像の有無を1枚1回だけ確認し直し、結果が変わった注釈の派生情報・テーブル行だけを破棄
+
+        変わった注釈IDの集合を返す。
+        """
+        paths = set()
+        for annotation in self.annotations:
+            for key in ('thermal_image', 'visible_image'):
+                if annotation.get(key):
+                    paths.add(annotation[key])
+        cache = self._path_exists_cache
+        changed_paths = set()
+        for path in paths:
+            exists = os.path.exists(path)
+            if cache.get(path) != exists:
+                changed_paths.add(path)
+            cache[path] = exists
+        changed_ids = set()
+        if not changed_paths:
+            return changed_ids
+        for annotation_id, derived in list(self._annotation_derived_cache.items()):
+            _id, _defect, thermal_path, visible_path = derived["signature"]
+            if thermal_path in changed_paths or visible_path in changed_paths:
+                del self._annotation_derived_cache[annotation_id]
+                changed_ids.add(annotation_id)
+        row_cache = getattr(self, "_table_row_cache", {})
+        for annotation_id in changed_ids:
+            row_cache.pop(annotation_id, None)
+        return changed_ids
+
+    def get_annotation_derived(self, annotation):
+        """画像の有無・拡張子・出力ファイル名（テーブル・CSV・Excel・画像コピーで共有）
+
+        ID・不良分類・画像パスが変わった場合のみ作り直す。
+        """
+        signature = (
+            annotation.get('id'),
+            annotation.get('defect_type'),
+            annotation.get('thermal_image'),
+            annotation.get('visible_image'),
+        )
+        previous = self._annotation_derived_cache.get(annotation.get('id'))
+        if previous is not None and previous["signature"] == signature:
+            return previous
+
+        derived = {"signature": signature}
+        for index, (kind, label) in enumerate((("thermal", "サーモ異常"), ("visible", "可視異常")), 2):
+            # 命名規則: ID{番号}_{不良分類}_{サーモ異常|可視異常}{元の拡張子}
+            src_path = annotation.get(f"{kind}_image")
+            if src_path and previous is not None and previous["signature"][index] != src_path:
+                # 編集ダイアログ等で画像が差し替えられた場合は、その画像だけ確認し直す
+                self._path_exists_cache.pop(src_path, None)
+            exists = bool(src_path) and self._path_exists_cached(src_path)
+            ext = os.path.splitext(src_path)[1] if src_path else ""
+            derived[f"{kind}_exists"] = exists
+            derived[f"{kind}_ext"] = ext
+            derived[f"{kind}_filename"] = (
+                f"ID{annotation['id']}_{annotation['defect_type']}_{label}{ext}" if exists else ""
             )
-            self.tree.insert("", tk.END, values=values)
+            derived[f"{kind}_copy_name"] = (
+                f"ID{annotation['id']:03d}_{annotation['defect_type']}_{label}{ext}" if exists else ""
+            )
+        self._annotation_derived_cache[annotation.get('id')] = derived
+        return derived
+
+    def _build_table_values(self, annotation):
+        shape_name = next((k for k, v in self.annotation_shapes.items() 
+                        if v == annotation.get("shape", "cross")), "十字")
+        
+        derived = self.get_annotation_derived(annotation)
+        thermal_filename = derived["thermal_filename"]
+        visible_filename = derived["visible_filename"]
+
+        return (
+            annotation['id'],
+            annotation.get('area_no', ''),
+            annotation.get('pcs_no', ''),
+            annotation.get('junction_box_no', ''),
+            annotation.get('circuit_no', ''),
+            annotation.get('array_no', ''),           # 追加
+            annotation.get('module_position', ''),    # 追加
+            annotation.get('serial_no', ''),          # 追加
+            annotation.get('defect_type', ''),
+            shape_name,
+            thermal_filename,
+            visible_filename,
+            annotation.get('remarks', ''),
+            annotation.get('report_date', '')         # 追加
+        )
+
+    @staticmethod
+    def _table_sort_key(value):
+        """列の並び替えキー（数値として読める値は数値順、それ以外は文字列順）"""
+        text = str(value).strip() if value is not None else ""
+        try:
+            return (0, float(text), text)
+        except ValueError:
+            return (1, 0.0, text)
+
+    def _build_table_entry(self, annotation, signature):
+        """行の値・列ごとの並び替えキー・絞り込み項目をまとめて作成（変更時のみ）"""
+        values = self._build_table_values(annotation)
+        return {
+            "signature": signature,
+            "values": values,
+            "keys": tuple(self._table_sort_key(v) for v in values),
+            "defect_type": annotation.get('defect_type', ''),
+            "management_level": normalize_management_level(annotation.get('management_level')),
+            "area_no": str(annotation.get('area_no', '') or ''),
+        }
+
+    def update_table(self, refresh_files=False):
+        """テーブルを更新（IDをキーに差分のみ挿入・更新・削除。件数が多い場合は表示行のみ生成）
+
+        refresh_files=True の場合は画像ファイルの有無も確認し直す（プロジェクト読込時など）。
+        """
+        if refresh_files or not hasattr(self, "_table_row_cache"):
+            self._table_row_cache = {}  # id -> 行データ（シグネチャ・値・並び替えキー）
+            self._table_data_version += 1
+            if refresh_files:
+                self.invalidate_annotation_derived()
+        row_cache = self._table_row_cache
+
+        changed = False
+        entries = []
+        iid_by_id = {}
+        used_iids = set()
+        for annotation in self.annotations.sorted_by_id():
+            annotation_id = annotation['id']
+            signature = self._table_row_signature(annotation)
+            entry = row_cache.get(annotation_id)
+            if entry is None or entry["signature"] != signature:
+                entry = self._build_table_entry(annotation, signature)
+                row_cache[annotation_id] = entry
+                changed = True
+            iid = f"ann_{annotation_id}"
+            # ID重複時も行が潰れないようにする
+            suffix = 1
+            while iid in used_iids:
+                suffix += 1
+                iid = f"ann_{annotation_id}_{suffix}"
+            used_iids.add(iid)
+            iid_by_id.setdefault(str(annotation_id), iid)
+            entries.append((iid, entry))
+
+        live_ids = {annotation['id'] for annotation in self.annotations}
+        for annotation_id in [k for k in row_cache if k not in live_ids]:
+            del row_cache[annotation_id]
+            changed = True
+        for annotation_id in [k for k in self._annotation_derived_cache if k not in live_ids]:
+            del self._annotation_derived_cache[annotation_id]
+        if changed or len(entries) != len(self._table_entries):
+            self._table_data_version += 1
+        self._table_entries = entries
+        self._table_iid_by_id = iid_by_id
+
+        self._refresh_table_filter_choices()
+        view = self._get_table_view()
+        if len(view) > self.VIRTUAL_TABLE_THRESHOLD:
+            self._render_virtual_table()
+        else:
+            self._sync_table_rows(view)
+
+    def _get_table_view(self):
+        """絞り込み・並び替え済みの行一覧（データ・条件が変わらない限り再計算しない）"""
+        filters = self._table_filters
+        key = (
+            self._table_data_version, self._table_sort,
+            filters["defect_type"], filters["management_level"], filters["area_no"],
+        )
+        if key == self._table_view_key:
+            return self._table_view
+        view = [
+            (iid, entry) for iid, entry in self._table_entries
+            if (filters["defect_type"] is None or entry["defect_type"] == filters["defect_type"])
+            and (filters["management_level"] is None or entry["management_level"] == filters["management_level"])
+            and (filters["area_no"] is None or entry["area_no"] == filters["area_no"])
+        ]
+        column, descending = self._table_sort
+        # 行はID順に並んでいるため、ID昇順のときは並び替え不要
+        if column != 0 or descending:
+            view.sort(key=lambda row: row[1]["keys"][column], reverse=descending)
+        self._table_view = view
+        self._table_view_index = {iid: index for index, (iid, _entry) in enumerate(view)}
+        self._table_view_key = key
+        return view
+
+    def _sync_table_rows(self, view):
+        """通常表示: 差分のみ挿入・更新・削除"""
+        self._leave_virtual_table()
+        rows = self._table_rows
+        wanted = self._table_view_index
+        for iid in [k for k in rows if k not in wanted]:
+            if self.tree.exists(iid):
+                self.tree.delete(iid)
+            del rows[iid]
+
+        for index, (iid, entry) in enumerate(view):
+            values = entry["values"]
+            current = rows.get(iid)
+            if current is None:
+                self.tree.insert("", index, iid=iid, values=values)
+                rows[iid] = values
+            elif current != values:
+                self.tree.item(iid, values=values)
+                rows[iid] = values
+
+        # ID変更・並び替えなどで順序が崩れた場合のみ並べ替える
+        desired_order = [iid for iid, _entry in view]
+        if list(self.tree.get_children()) != desired_order:
+            for index, iid in enumerate(desired_order):
+                self.tree.move(iid, "", index)
+
+    def _refresh_table_filter_choices(self):
+        if self._table_filter_choices_version == self._table_data_version:
+            return
+        self._table_filter_choices_version = self._table_data_version
+        areas = {entry["area_no"] for _iid, entry in self._table_entries if entry["area_no"]}
+        self.table_area_filter_combo.configure(
+            values=[self.TABLE_FILTER_ALL] + sorted(areas, key=self._table_sort_key)
+        )
+        self.table_defect_filter_combo.configure(values=[self.TABLE_FILTER_ALL] + list(self.defect_types.keys()))
+
+    def on_table_filter_change(self, event=None):
+        def selected(var):
+            value = var.get()
+            return None if value in ("", self.TABLE_FILTER_ALL) else value
+
+        self._table_filters = {
+            "defect_type": selected(self.table_defect_filter_var),
+            "management_level": selected(self.table_level_filter_var),
+            "area_no": selected(self.table_area_filter_var),
+        }
+        self._virtual_start = 0
+        self.update_table()
+
+    def sort_table_by_column(self, column_name):
+        """見出しクリックで並び替え（同じ列を再度クリックすると昇順／降順を切り替え）"""
+        column = self.table_columns.index(column_name)
+        current_column, descending = self._table_sort
+        if column == current_column and self._table_sort_chosen:
+            descending = not descending
+        elif column != current_column:
+            descending = False
+        # 初回クリックは現在の向き（初期状態の ID なら昇順）のまま見出しに反映する
+        self._table_sort = (column, descending)
+        self._table_sort_chosen = True
+        for index, name in enumerate(self.table_columns):
+            mark = ""
+            if index == self._table_sort[0]:
+                mark = " ▼" if self._table_sort[1] else " ▲"
+            self.tree.heading(name, text=name + mark)
+        self._virtual_start = 0
+        self.update_table()
+
+    def _enter_virtual_table(self):
+        if self._table_virtual:
+            return
+        for iid in list(self._table_rows):
+            if self.tree.exists(iid):
+                self.tree.delete(iid)
+        self._table_rows = {}
+        self._table_virtual = True
+        self.tree.configure(yscrollcommand="")
+        self.tree_scroll.configure(command=self._on_virtual_table_scroll)
+
+    def _leave_virtual_table(self):
+        if not self._table_virtual:
+            return
+        for slot in self._virtual_slots:
+            if self.tree.exists(slot):
+                self.tree.delete(slot)
+        self._virtual_slots = []
+        self._virtual_slot_values = {}
+        self._virtual_selected_slot = None
+        self._table_virtual = False
+        self.tree.configure(yscrollcommand=self.tree_scroll.set)
+        self.tree_scroll.configure(command=self.tree.yview)
+
+    def _virtual_table_capacity(self):
+        """ウィジェットの高さに収まる行数"""
+        try:
+            row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        except (TypeError, ValueError, tk.TclError):
+            row_height = 20
+        height = self.tree.winfo_height()
+        if height <= 1:
+            return max(1, int(self.tree.cget("height")))
+        # 見出し行の分を差し引く
+        return max(1, (height - row_height - 4) // row_height)
+
+    def _render_virtual_table(self):
+        """仮想表示: 表示範囲の行だけを固定数の行（スロット）に割り当てる"""
+        self._virtual_render_job = None
+        self._enter_virtual_table()
+        view = self._table_view
+        capacity = self._virtual_table_capacity()
+        total = len(view)
+        self._virtual_start = max(0, min(self._virtual_start, total - capacity))
+        window = view[self._virtual_start:self._virtual_start + capacity]
+        slots = self._virtual_slots
+        while len(slots) < len(window):
+            slot = f"vrow_{len(slots)}"
+            self.tree.insert("", tk.END, iid=slot, values=())
+            slots.append(slot)
+        while len(slots) > len(window):
+            slot = slots.pop()
+            self._virtual_slot_values.pop(slot, None)
+            self.tree.delete(slot)
+
+        selected_slot = None
+        for slot, (_iid, entry) in zip(slots, window):
+            values = entry["values"]
+            if self._virtual_slot_values.get(slot) != values:
+                self.tree.item(slot, values=values)
+                self._virtual_slot_values[slot] = values
+            if str(values[0]) == self._virtual_selected_id:
+                selected_slot = slot
+        # 選択は注釈IDで保持し、行の割り当て直し後にその行へ付け直す
+        self._virtual_selected_slot = selected_slot
+        current = self.tree.selection()
+        if selected_slot is not None:
+            if tuple(current) != (selected_slot,):
+                self.tree.selection_set(selected_slot)
+                self.tree.focus(selected_slot)
+        elif current:
+            # 選択中の注釈が表示範囲外の間は行の選択だけ外す（選択IDは保持）
+            self.tree.selection_remove(*current)
+        if total:
+            self.tree_scroll.set(self._virtual_start / total, (self._virtual_start + len(window)) / total)
+        else:
+            self.tree_scroll.set(0.0, 1.0)
+
+    def _schedule_virtual_table_render(self, event=None):
+        if self._table_virtual and self._virtual_render_job is None:
+            self._virtual_render_job = self.root.after_idle(self._render_virtual_table)
+
+    def _on_virtual_table_scroll(self, *args):
+        if not args:
+            return
+        capacity = self._virtual_table_capacity()
+        if args[0] == "moveto":
+            start = int(float(args[1]) * len(self._table_view))
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if len(args) > 2 and args[2] == "pages":
+                amount *= capacity
+            start = self._virtual_start + amount
+        else:
+            return
+        if start != self._virtual_start:
+            self._virtual_start = start
+            self._render_virtual_table()
+
+    def _on_table_mouse_wheel(self, event):
+        if not self._table_virtual:
+            return None
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self._on_virtual_table_scroll("scroll", -3, "units")
+        else:
+            self._on_virtual_table_scroll("scroll", 3, "units")
+        return "break"
+
+    def _on_table_select(self, event=None):
+        if not self._table_virtual:
+            return
+        selection = self.tree.selection()
+        # 表示範囲外へスクロールして選択が外れた場合や、描画時に付け直した選択の通知では選択IDを変えない
+        if not selection or tuple(selection) == (self._virtual_selected_slot,):
+            return
+        values = self._virtual_slot_values.get(selection[0])
+        if values:
+            self._virtual_selected_id = str(values[0])
+            self._virtual_selected_slot = selection[0]
+
+    def _on_table_key_step(self, delta):
+        """仮想表示で先頭／末尾の行からさらに上下キーを押したときは表示範囲を送る"""
+        if not self._table_virtual or not self._virtual_slots:
+            return None
+        focus = self.tree.focus()
+        edge = self._virtual_slots[0] if delta < 0 else self._virtual_slots[-1]
+        if focus != edge:
+            return None
+        self._on_virtual_table_scroll("scroll", delta, "units")
+        self.tree.selection_set(edge)
+        self.tree.focus(edge)
+        values = self._virtual_slot_values.get(edge)
+        if values:
+            self._virtual_selected_id = str(values[0])
+            self._virtual_selected_slot = edge
+        return "break"
 
     def on_mouse_wheel(self, event):
         """マウスホイールでスクロール（縦横対応）"""
@@ -4108,7 +7158,7 @@ class OrthoImageAnnotationSystem:
         if messagebox.askyesno("確認", "画像をリセットしますか？アノテーションもすべて削除されます。"):
             self.current_image = None
             self.image_path = None
-            self.annotations = []
+            self.annotations = AnnotationStore()
             self.next_id = 1
             self.canvas.delete("all")
             self.update_table()
@@ -4145,8 +7195,15 @@ class OrthoImageAnnotationSystem:
         ttk.Button(dialog, text="適用", command=apply_colors).grid(row=len(self.defect_types), 
                                                                   column=0, columnspan=2, pady=20)
 
+    def annotation_export_in_progress(self):
+        """編集ダイアログの注釈付き画像の書き出しが実行中・待機中か"""
+        return bool(getattr(self, "_annotation_exports", None))
+
     def save_project(self):
         """プロジェクトを保存"""
+        if self.annotation_export_in_progress():
+            messagebox.showwarning("警告", "注釈付き画像の書き出し中です。完了してから保存してください。")
+            return
         if not self.annotations:
             messagebox.showwarning("警告", "保存するアノテーションがありません。")
             return
@@ -4166,6 +7223,10 @@ class OrthoImageAnnotationSystem:
             with open(annotation_file, 'w', encoding='utf-8') as f:
                 json.dump(annotation_data, f, ensure_ascii=False, indent=2)
 
+            # 保存時は画像の有無を1枚1回だけ確認し直し、変わった注釈の行だけを更新して各出力で共有する
+            self.refresh_annotation_file_state()
+            self.update_table()
+
             # 不具合一覧表をCSV形式で保存
             self.export_to_csv()
 
@@ -4422,24 +7483,14 @@ class OrthoImageAnnotationSystem:
             writer.writerow(headers)
 
             # データ
-            for annotation in sorted(self.annotations, key=lambda x: x['id']):
+            for annotation in self.annotations.sorted_by_id():
                 shape_name = next((k for k, v in self.annotation_shapes.items() 
                                 if v == annotation.get("shape", "cross")), "十字")
                 
-                # サーモ画像のファイル名を命名規則に従って生成
-                thermal_filename = ""
-                if annotation.get('thermal_image'):
-                    src_path = annotation['thermal_image']
-                    if os.path.exists(src_path):
-                        thermal_filename = f"ID{annotation['id']}_{annotation['defect_type']}_サーモ異常{os.path.splitext(src_path)[1]}"
-                
-                # 可視画像のファイル名を命名規則に従って生成
-                visible_filename = ""
-                if annotation.get('visible_image'):
-                    src_path = annotation['visible_image']
-                    if os.path.exists(src_path):
-                        visible_filename = f"ID{annotation['id']}_{annotation['defect_type']}_可視異常{os.path.splitext(src_path)[1]}"
-                
+                derived = self.get_annotation_derived(annotation)
+                thermal_filename = derived["thermal_filename"]
+                visible_filename = derived["visible_filename"]
+
                 row = [
                     annotation['id'],
                     annotation.get('area_no', ''),
@@ -4466,24 +7517,14 @@ class OrthoImageAnnotationSystem:
 
         # データフレーム作成
         data = []
-        for annotation in sorted(self.annotations, key=lambda x: x['id']):
+        for annotation in self.annotations.sorted_by_id():
             shape_name = next((k for k, v in self.annotation_shapes.items() 
                             if v == annotation.get("shape", "cross")), "十字")
             
-            # サーモ画像のファイル名を命名規則に従って生成
-            thermal_filename = ""
-            if annotation.get('thermal_image'):
-                src_path = annotation['thermal_image']
-                if os.path.exists(src_path):
-                    thermal_filename = f"ID{annotation['id']}_{annotation['defect_type']}_サーモ異常{os.path.splitext(src_path)[1]}"
-            
-            # 可視画像のファイル名を命名規則に従って生成
-            visible_filename = ""
-            if annotation.get('visible_image'):
-                src_path = annotation['visible_image']
-                if os.path.exists(src_path):
-                    visible_filename = f"ID{annotation['id']}_{annotation['defect_type']}_可視異常{os.path.splitext(src_path)[1]}"
-            
+            derived = self.get_annotation_derived(annotation)
+            thermal_filename = derived["thermal_filename"]
+            visible_filename = derived["visible_filename"]
+
             data.append({
                 "ID": annotation['id'],
                 "エリア番号": annotation.get('area_no', ''),
@@ -4544,7 +7585,7 @@ class OrthoImageAnnotationSystem:
         with open(csv_file, 'w', newline='', encoding='utf-8-sig') as f:
             w = csv.writer(f, lineterminator='\r\n')
             w.writerow(DEFECT_V2_HEADERS)
-            for annotation in sorted(self.annotations, key=lambda x: x['id']):
+            for annotation in self.annotations.sorted_by_id():
                 row = self.to_v2_row(annotation)
                 w.writerow(['' if v is None else v for v in row])
 
@@ -4559,7 +7600,7 @@ class OrthoImageAnnotationSystem:
             wb.remove(wb['defect_list_v2'])
         ws = wb.create_sheet('defect_list_v2')
         ws.append(DEFECT_V2_HEADERS)
-        for annotation in sorted(self.annotations, key=lambda x: x['id']):
+        for annotation in self.annotations.sorted_by_id():
             ws.append(self.to_v2_row(annotation))
         if 'Sheet' in wb.sheetnames and len(wb.sheetnames) > 1:
             try:
@@ -4571,21 +7612,17 @@ class OrthoImageAnnotationSystem:
     def copy_related_images(self):
         """関連画像をプロジェクトフォルダにコピー"""
         for annotation in self.annotations:
+            derived = self.get_annotation_derived(annotation)
+
             # サーモ画像のコピー
-            if annotation.get('thermal_image'):
-                src_path = annotation['thermal_image']
-                if os.path.exists(src_path):
-                    filename = f"ID{annotation['id']:03d}_{annotation['defect_type']}_サーモ異常{os.path.splitext(src_path)[1]}"
-                    dst_path = os.path.join(self.project_path, "サーモ画像フォルダ", filename)
-                    shutil.copy2(src_path, dst_path)
+            if derived["thermal_exists"]:
+                dst_path = os.path.join(self.project_path, "サーモ画像フォルダ", derived["thermal_copy_name"])
+                shutil.copy2(annotation['thermal_image'], dst_path)
 
             # 可視画像のコピー
-            if annotation.get('visible_image'):
-                src_path = annotation['visible_image']
-                if os.path.exists(src_path):
-                    filename = f"ID{annotation['id']:03d}_{annotation['defect_type']}_可視異常{os.path.splitext(src_path)[1]}"
-                    dst_path = os.path.join(self.project_path, "可視画像フォルダ", filename)
-                    shutil.copy2(src_path, dst_path)
+            if derived["visible_exists"]:
+                dst_path = os.path.join(self.project_path, "可視画像フォルダ", derived["visible_copy_name"])
+                shutil.copy2(annotation['visible_image'], dst_path)
 
     def load_annotations(self):
         """アノテーションを読み込み"""
@@ -4595,12 +7632,13 @@ class OrthoImageAnnotationSystem:
                 with open(annotation_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
 
-                self.annotations = data.get('annotations', [])
-                for ann in self.annotations:
+                annotations = data.get('annotations', [])
+                for ann in annotations:
                     try:
                         ann['id'] = int(ann.get('id', 0))
                     except (TypeError, ValueError):
                         ann['id'] = 0
+                self.annotations = AnnotationStore(annotations)
                 self.defect_types.update(data.get('defect_types', {}))
                 self.annotation_shapes.update(data.get('annotation_shapes', {}))
                 self.image_path = data.get('image_path', '')
@@ -4620,12 +7658,12 @@ class OrthoImageAnnotationSystem:
 
                 # 次のIDを設定
                 if self.annotations:
-                    max_id = max(ann['id'] for ann in self.annotations)
+                    max_id = self.annotations.max_id()
                     self.next_id = max_id + 1
                 else:
                     self.next_id = 1
 
-                self.update_table()
+                self.update_table(refresh_files=True)
                 if self.current_image:
                     self.draw_annotations()
 
@@ -4634,6 +7672,9 @@ class OrthoImageAnnotationSystem:
 
     def quit_application(self):
         """アプリケーションを終了"""
+        if self.annotation_export_in_progress():
+            messagebox.showwarning("警告", "注釈付き画像の書き出し中です。完了してから終了してください。")
+            return
         if self.annotations:
             result = messagebox.askyesnocancel("確認", "変更を保存しますか？")
             if result is True:  # Yes
@@ -4654,4 +7695,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # 温度解析のプロセスプールを exe 化した環境でも起動できるようにする
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Test script for the background annotated-image export.
+
+編集ダイアログの「決定」で使う書き出し処理（write_annotated_export）が
+一時ファイル経由で保存し、失敗時に既存の出力や一時ファイルを残さないこと、
+書き出し中はID番号の変更を受け付けないことを確認します。
+"""
+
+import os
+import sys
+import tempfile
+
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from ortho_annotation_system_v7 import AnnotationStore, OrthoImageAnnotationSystem
+
+
+def make_system():
+    # GUI を起動せずに描画処理だけを使う（アイコン未登録時は図形で描画される）
+    system = object.__new__(OrthoImageAnnotationSystem)
+    system.load_annotation_icon = lambda defect_type: None
+    return system
+
+
+def make_job(image_path, output_path, points):
+    return {
+        "image_path": image_path,
+        "points": points,
+        "defect_name": "ホットスポット",
+        "color": "#FF0000",
+        "shape_code": "circle",
+        "annotation_scale": 1.0,
+        "annotation_id": 7,
+        "output_path": output_path,
+    }
+
+
+def test_export_writes_annotated_jpeg():
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "DJI_0001_V.JPG")
+        Image.new("RGB", (200, 150), color="white").save(src, "JPEG")
+        out = os.path.join(tmp, "ID7_DJI_0001_V_visible_annotated.JPG")
+
+        make_system().write_annotated_export(make_job(src, out, [{"x": 100, "y": 75}]))
+
+        assert sorted(os.listdir(tmp)) == sorted([os.path.basename(src), os.path.basename(out)])
+        with Image.open(out) as img:
+            assert img.format == "JPEG" and img.size == (200, 150)
+            # 白一色の元画像に注釈が描き込まれている
+            assert img.convert("L").getextrema()[0] < 200
+
+
+def test_failed_export_keeps_previous_output():
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "DJI_0002_T.JPG")
+        Image.new("RGB", (64, 48), color="white").save(src, "JPEG")
+        out = os.path.join(tmp, "ID7_DJI_0002_T_thermal_annotated.JPG")
+        with open(out, "wb") as f:
+            f.write(b"previous")
+
+        system = make_system()
+
+        def broken_label(*args, **kwargs):
+            raise RuntimeError("draw failed")
+
+        system._draw_id_label_on_image = broken_label
+        try:
+            system.write_annotated_export(make_job(src, out, [{"x": 10, "y": 10}]))
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("描画失敗が呼び出し側へ伝わっていない")
+
+        with open(out, "rb") as f:
+            assert f.read() == b"previous"
+        assert not any(name.endswith(".saving.JPG") for name in os.listdir(tmp))
+
+
+def test_failed_save_removes_temp_file():
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "DJI_0003_T.JPG")
+        Image.new("RGB", (64, 48), color="white").save(src, "JPEG")
+        # 拡張子から保存形式を決められない出力先は save() で失敗する
+        out = os.path.join(tmp, "ID7_DJI_0003_T_thermal_annotated.unknownext")
+        try:
+            make_system().write_annotated_export(make_job(src, out, []))
+        except Exception:
+            pass
+        else:
+            raise AssertionError("保存失敗が呼び出し側へ伝わっていない")
+        assert sorted(os.listdir(tmp)) == [os.path.basename(src)]
+
+
+def test_id_change_is_refused_while_exporting():
+    system = make_system()
+    annotation = {"id": 7, "x": 0, "y": 0}
+    system.annotations = AnnotationStore([annotation])
+    # 書き出し中のプレビューがある間は、旧IDのファイル名で確定されるのを防ぐため変更を断る
+    system._annotation_exports = {object()}
+    assert system.annotation_export_in_progress()
+    try:
+        system.apply_annotation_id_change(annotation, 8)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("書き出し中にID番号が変更された")
+    assert annotation["id"] == 7
+
+    system._annotation_exports.clear()
+    assert not system.annotation_export_in_progress()
+
+
+if __name__ == "__main__":
+    test_export_writes_annotated_jpeg()
+    test_failed_export_keeps_previous_output()
+    test_failed_save_removes_temp_file()
+    test_id_change_is_refused_while_exporting()
+    print("✓ 注釈付き画像の書き出しテストはすべて成功しました")
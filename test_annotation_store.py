@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Test script for the indexed annotation list (AnnotationStore).
+
+リスト操作の後に索引（ID検索・ID順・座標）が差分更新・作り直しで正しく保たれること、
+レコードのIDを直接書き換えた後も find_by_id が正しいレコードを返すことを確認します。
+"""
+
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from ortho_annotation_system_v7 import AnnotationStore
+
+
+def make_store():
+    return AnnotationStore([
+        {"id": 3, "x": 30, "y": 30},
+        {"id": 1, "x": 10, "y": 10},
+        {"id": 2, "x": 20, "y": 20},
+    ])
+
+
+def test_index_follows_list_mutations():
+    store = make_store()
+    assert [a["id"] for a in store.sorted_by_id()] == [1, 2, 3]
+    assert store.max_id() == 3
+
+    store.append({"id": 7, "x": 70, "y": 70})
+    assert store.find_by_id(7)["x"] == 70
+    assert store.max_id() == 7
+
+    del store[0]
+    assert store.find_by_id(3) is None
+    assert [a["id"] for a in store.sorted_by_id()] == [1, 2, 7]
+
+    store.remove_id(2)
+    assert store.find_by_id(2) is None and len(store) == 2
+
+    store[:] = [{"id": 5, "x": 0, "y": 0}]
+    ids, xs, ys = store.coordinates()
+    assert list(ids) == [5] and list(xs) == [0.0]
+
+    store.clear()
+    assert store.max_id() == 0 and store.sorted_by_id() == []
+    assert store.nearest(0, 0, 10) is None
+
+
+def test_find_by_id_after_id_rewrite_with_mark_dirty():
+    store = make_store()
+    assert store.find_by_id(1) is store[1]
+    store[1]["id"] = 10
+    store.mark_dirty()
+    assert store.find_by_id(1) is None
+    assert store.find_by_id(10) is store[1]
+    assert store.max_id() == 10
+
+
+def test_find_by_id_after_id_rewrite_without_mark_dirty():
+    store = make_store()
+    record = store[1]
+    assert store.find_by_id(1) is record
+
+    # ID振り直しでレコードを直接書き換え、mark_dirty() を呼び忘れた場合
+    record["id"] = 10
+    assert store.find_by_id(1) is None
+    assert store.find_by_id(10) is record
+
+    # 2回目の書き換えでも古い索引のレコードを返さない
+    record["id"] = 20
+    assert store.find_by_id(10) is None
+    assert store.find_by_id(20) is record
+
+
+def test_duplicate_ids_return_first_in_list():
+    store = AnnotationStore([{"id": 1, "x": 0, "y": 0}, {"id": 1, "x": 5, "y": 5}])
+    assert store.find_by_id(1) is store[0]
+    assert store.find_by_id("1") is store[0]
+    assert store.find_by_id("abc") is None
+    assert store.sorted_by_id() == [store[0], store[1]]
+
+
+def test_nearest_respects_max_distance():
+    store = make_store()
+    assert store.nearest(11, 11, 5)["id"] == 1
+    assert store.nearest(25, 25, 5) is None
+    # 座標を直接書き換えた場合は mark_dirty() で反映する
+    store[0]["x"] = 100
+    store.mark_dirty()
+    assert store.nearest(99, 30, 5)["id"] == 3
+
+
+def test_json_roundtrip():
+    store = make_store()
+    restored = AnnotationStore(json.loads(json.dumps(store)))
+    assert restored == store
+    assert restored.find_by_id(2)["x"] == 20
+
+
+def expected_order(records):
+    keyed = [((r.get("id") is None, r.get("id") or 0), i) for i, r in enumerate(records)]
+    return [records[i] for _key, i in sorted(keyed)]
+
+
+def test_incremental_index_matches_full_rebuild():
+    rng = random.Random(0)
+    store = AnnotationStore()
+    store.sorted_by_id()
+    for _ in range(400):
+        op = rng.random()
+        if op < 0.5 or not store:
+            # 重複IDやIDの無いレコードも混ぜる
+            record = {"id": rng.choice([None, *range(1, 30)]), "x": 0, "y": 0}
+            if rng.random() < 0.2:
+                store.insert(len(store), record)
+            else:
+                store.append(record)
+        elif op < 0.7:
+            store.pop(rng.randrange(len(store)))
+        elif op < 0.85:
+            store.remove(store[rng.randrange(len(store))])
+        else:
+            del store[rng.randrange(len(store))]
+        # 差分更新のまま作り直されていないこと
+        assert store._index_version == store._version
+        assert store.sorted_by_id() == expected_order(store)
+        for key in range(1, 30):
+            first = next((r for r in store if r.get("id") == key), None)
+            assert store.find_by_id(key) is first
+        ids = [r["id"] for r in store if r.get("id") is not None]
+        assert store.max_id() == (max(ids) if ids else 0)
+
+
+def test_bulk_changes_rebuild_index():
+    store = make_store()
+    store.sorted_by_id()
+    store.insert(0, {"id": 3, "x": 0, "y": 0})
+    # 先頭への挿入で同じIDの優先順位が変わる
+    assert store.find_by_id(3) is store[0]
+    store.sort(key=lambda r: -r["id"])
+    assert [a["id"] for a in store.sorted_by_id()] == [1, 2, 3, 3]
+    assert store.find_by_id(3) is store[0]
+
+
+if __name__ == "__main__":
+    test_index_follows_list_mutations()
+    test_find_by_id_after_id_rewrite_with_mark_dirty()
+    test_find_by_id_after_id_rewrite_without_mark_dirty()
+    test_duplicate_ids_return_first_in_list()
+    test_nearest_respects_max_distance()
+    test_json_roundtrip()
+    test_incremental_index_matches_full_rebuild()
+    test_bulk_changes_rebuild_index()
+    print("✓ AnnotationStore のテストはすべて成功しました")
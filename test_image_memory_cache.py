@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test script for the memory-bounded image caches.
+
+ImageMemoryCache がバイト数上限を守って LRU で追い出すこと、
+プレビュー用のデコード済み画像が上書き保存後に古いまま使われないことを確認します。
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from ortho_annotation_system_v7 import (
+    ImageMemoryCache,
+    ThermalVisibleFileDialog,
+    open_image_reduced,
+)
+
+
+def test_estimate_bytes():
+    assert ImageMemoryCache.estimate_bytes(Image.new("RGBA", (10, 20))) == 800
+    assert ImageMemoryCache.estimate_bytes(Image.new("RGB", (10, 20))) == 600
+    assert ImageMemoryCache.estimate_bytes((Image.new("L", (10, 10)), (640, 512))) == 100
+
+
+def test_byte_bound_and_lru_order():
+    cache = ImageMemoryCache(max_bytes=3 * 400)
+    for name in ("a", "b", "c"):
+        cache.put(name, Image.new("RGBA", (10, 10)))
+    assert cache.current_bytes == 1200 and len(cache) == 3
+
+    # a を参照して最新にすると、次の追加で b が追い出される
+    assert cache.get("a") is not None
+    cache.put("d", Image.new("RGBA", (10, 10)))
+    assert "b" not in cache and "a" in cache and "d" in cache
+    assert cache.current_bytes <= cache.max_bytes
+    assert cache.evictions == 1
+
+
+def test_oversized_entry_is_not_stored():
+    cache = ImageMemoryCache(max_bytes=100)
+    cache.put("small", Image.new("L", (5, 5)))
+    cache.put("huge", Image.new("RGBA", (100, 100)))
+    assert "huge" not in cache and "small" in cache
+    assert cache.current_bytes == 25
+
+
+def test_replace_and_pop_keep_byte_count():
+    cache = ImageMemoryCache(max_bytes=10_000)
+    cache.put("a", Image.new("RGBA", (10, 10)))
+    cache.put("a", Image.new("RGBA", (20, 10)))
+    assert cache.current_bytes == 800
+    assert cache.pop("a") is not None
+    assert cache.current_bytes == 0 and len(cache) == 0
+
+
+def test_hit_miss_counters():
+    cache = ImageMemoryCache(max_bytes=10_000)
+    cache.get("missing")
+    cache.put("a", Image.new("L", (2, 2)))
+    cache.get("a")
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1 and stats["hit_rate"] == 0.5
+
+
+def test_open_image_reduced_reports_original_size():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "DJI_0001_V.JPG")
+        Image.new("RGB", (800, 600), color="green").save(path, "JPEG")
+        img, original_size = open_image_reduced(path, (100, 100), with_original_size=True)
+        assert original_size == (800, 600)
+        # DCT 縮小は目標サイズ以上の最小段（1/4 → 200x150）
+        assert img.size == (200, 150) and img.mode == "RGBA"
+
+
+def _make_dialog_stub():
+    dialog = object.__new__(ThermalVisibleFileDialog)
+    dialog.preview_base_cache = ImageMemoryCache(64 * 1024 * 1024)
+    dialog._preview_pyramids = {}
+    dialog._preview_sources = {}
+    return dialog
+
+
+def test_preview_base_is_reloaded_after_overwrite():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "ID001_annotated.jpg"
+        Image.new("RGB", (64, 48), color=(255, 0, 0)).save(path, "JPEG")
+        dialog = _make_dialog_stub()
+        first = dialog.get_preview_base_image(path, (64, 48))
+        assert dialog.get_preview_base_image(path, (64, 48)) is first
+
+        # 同じパスへ別内容を上書き（再出力されたアノテーション画像を想定）
+        Image.new("RGB", (96, 48), color=(0, 0, 255)).save(path, "JPEG")
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        second = dialog.get_preview_base_image(path, (96, 48))
+        assert second is not first and second.size == (96, 48)
+
+
+if __name__ == "__main__":
+    test_estimate_bytes()
+    test_byte_bound_and_lru_order()
+    test_oversized_entry_is_not_stored()
+    test_replace_and_pop_keep_byte_count()
+    test_hit_miss_counters()
+    test_open_image_reduced_reports_original_size()
+    test_preview_base_is_reloaded_after_overwrite()
+    print("✓ ImageMemoryCache のテストはすべて成功しました")
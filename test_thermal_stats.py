@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Test script for the batch thermal statistics engine.
+
+温度解析ワーカーが更新の無い画像を解析し直さないこと、ThermalStatsIndex が
+プロセスプールの結果を取り込み、画像の更新時に再解析すること、生データの温度と
+パレット輝度のスコアを別枠で並べることを確認します。
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from thermal_stats_worker import compute_thermal_stats_batch
+from ortho_annotation_system_v7 import ThermalStatsIndex
+
+
+def make_thermal(folder, name, hot=False):
+    path = os.path.join(folder, name)
+    img = Image.new("L", (64, 48), color=60)
+    if hot:
+        img.paste(250, (30, 20, 34, 24))
+    img.convert("RGB").save(path, "JPEG", quality=95)
+    return path
+
+
+def test_worker_skips_unchanged_files():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = make_thermal(tmp, "DJI_0001_T.JPG", hot=True)
+        [(result_path, stats)] = compute_thermal_stats_batch([(path, None)])
+        assert result_path == path
+        assert stats["source"] == "palette"
+        assert stats["mtime"] == os.stat(path).st_mtime_ns
+        assert stats["score_max"] > stats["score_mean"] and "max" not in stats
+
+        assert compute_thermal_stats_batch([(path, stats["mtime"])]) == [(path, None)]
+        assert compute_thermal_stats_batch([(os.path.join(tmp, "missing_T.JPG"), None)])[0][1] is None
+
+
+def wait_batch(index, timeout=60):
+    deadline = time.time() + timeout
+    while index.is_running() and time.time() < deadline:
+        index.collect()
+        time.sleep(0.05)
+    index.collect()
+
+
+def test_index_batch_and_reanalysis():
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [make_thermal(tmp, f"DJI_{i:04d}_T.JPG", hot=(i == 1)) for i in range(3)]
+        index = ThermalStatsIndex(os.path.join(tmp, "thermal_stats.json"))
+        try:
+            assert index.start_batch(paths, workers=2) == 3
+            wait_batch(index)
+            assert index.analyzed_count() == 3
+            assert index.progress() == (3, 3)
+            assert index.get(paths[1])["score_max"] > index.get(paths[0])["score_max"]
+
+            # 更新の無い画像は解析しない
+            index.start_batch(paths, workers=2)
+            wait_batch(index)
+            assert index.analyzed_count() == 0
+
+            # 1枚だけ更新すると、その画像だけ再解析される
+            st = os.stat(paths[2])
+            os.utime(paths[2], ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+            index.start_batch(paths, workers=2)
+            wait_batch(index)
+            assert index.analyzed_count() == 1
+        finally:
+            index.cancel_batch()
+
+        index.save()
+        reloaded = ThermalStatsIndex(os.path.join(tmp, "thermal_stats.json"))
+        assert reloaded.get(paths[1]) == index.get(paths[1])
+
+
+def test_radiometric_and_palette_are_ranked_separately():
+    radiometric = [{"source": "radiometric", "max": t, "mean": 20.0} for t in (35.0, 60.0)]
+    palette = [{"source": "palette", "score_max": s, "score_mean": 10.0} for s in (99.0, 40.0)]
+    entries = radiometric + palette + [None]
+    key = ThermalStatsIndex.peak_rank_key
+    ordered = sorted(entries, key=lambda stats: key(stats, True))
+    # 温度（℃）の画像が先、輝度スコアの画像が後、未解析は末尾
+    assert ordered == [radiometric[1], radiometric[0], palette[0], palette[1], None]
+    ordered = sorted(entries, key=lambda stats: key(stats, False))
+    assert ordered == [radiometric[0], radiometric[1], palette[1], palette[0], None]
+
+    # ℃の条件は生データの画像だけが対象
+    assert ThermalStatsIndex.peak_temperature(radiometric[0]) == 35.0
+    assert ThermalStatsIndex.peak_temperature(palette[0]) is None
+
+
+def test_legacy_palette_temperatures_are_discarded():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = os.path.join(tmp, "thermal_stats.json")
+        with open(store, "w", encoding="utf-8") as f:
+            json.dump({
+                "old.JPG": {"source": "palette", "max": 70.0, "mean": 40.0, "mtime": 1},
+                "raw.JPG": {"source": "radiometric", "max": 45.0, "mean": 30.0, "mtime": 1},
+            }, f)
+        index = ThermalStatsIndex(store)
+        assert index.get("old.JPG") is None
+        assert index.get("raw.JPG")["max"] == 45.0
+
+
+if __name__ == "__main__":
+    test_worker_skips_unchanged_files()
+    test_index_batch_and_reanalysis()
+    test_radiometric_and_palette_are_ranked_separately()
+    test_legacy_palette_temperatures_are_discarded()
+    print("✓ 温度解析のテストはすべて成功しました")
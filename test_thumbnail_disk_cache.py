@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test script for the on-disk thumbnail cache (ThumbnailDiskCache).
+
+書き込みが一時ファイル経由で行われること、書き込み失敗がサムネイル生成に
+影響しないこと、容量上限を超えた時に最終利用時刻の古いものから削除されることを確認します。
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from ortho_annotation_system_v7 import ThumbnailDiskCache
+
+
+def make_source(folder, name, color):
+    path = os.path.join(folder, name)
+    Image.new("RGB", (64, 48), color=color).save(path, "JPEG")
+    return path
+
+
+def cache_files(root):
+    return sorted(p.name for p in Path(root).rglob("*") if p.is_file())
+
+
+def test_put_and_get_roundtrip():
+    with tempfile.TemporaryDirectory() as tmp:
+        src = make_source(tmp, "DJI_0001_T.JPG", "red")
+        cache = ThumbnailDiskCache(os.path.join(tmp, "cache"))
+        assert cache.get(src, (32, 32)) is None
+
+        cache.put(src, (32, 32), Image.new("RGB", (32, 24), color="blue"))
+        files = cache_files(cache.root)
+        # 一時ファイルは残らず、エントリ1件だけが置かれる
+        assert len(files) == 1 and files[0].endswith(".jpg")
+
+        img = cache.get(src, (32, 32))
+        assert img is not None and img.size == (32, 24) and img.mode == "RGBA"
+        # 寸法違いは別エントリ
+        assert cache.get(src, (64, 64)) is None
+
+
+def test_key_changes_when_source_is_rewritten():
+    with tempfile.TemporaryDirectory() as tmp:
+        src = make_source(tmp, "DJI_0002_T.JPG", "red")
+        cache = ThumbnailDiskCache(os.path.join(tmp, "cache"))
+        cache.put(src, (32, 32), Image.new("RGB", (32, 24)))
+        st = os.stat(src)
+        os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert cache.get(src, (32, 32)) is None
+
+
+class _UnencodableImage:
+    """保存時に ValueError を出す画像（JPEG で書けないモードの代わり）"""
+
+    mode = "RGB"
+
+    def convert(self, mode):
+        return self
+
+    def save(self, *args, **kwargs):
+        raise ValueError("cannot write mode")
+
+
+def test_put_failure_is_swallowed_and_cleaned_up():
+    with tempfile.TemporaryDirectory() as tmp:
+        src = make_source(tmp, "DJI_0003_T.JPG", "red")
+        cache = ThumbnailDiskCache(os.path.join(tmp, "cache"))
+        cache.put(src, (32, 32), _UnencodableImage())
+        assert cache_files(cache.root) == []
+        assert cache.get(src, (32, 32)) is None
+
+
+def test_eviction_removes_least_recently_used():
+    with tempfile.TemporaryDirectory() as tmp:
+        sources = [make_source(tmp, f"DJI_{i:04d}_T.JPG", "red") for i in range(4)]
+        cache = ThumbnailDiskCache(os.path.join(tmp, "cache"), max_bytes=10**9)
+        for src in sources[:3]:
+            cache.put(src, (32, 32), Image.effect_noise((32, 32), 64).convert("RGB"))
+
+        # 最終利用時刻を 0 → 1 → 2 の順に古くしておき、0 を最後に参照する
+        for age, src in enumerate(sources[:3]):
+            key = cache.key_for(src, (32, 32))
+            entry = cache._entry_paths(key)[0]
+            os.utime(entry, (1_000_000 - age * 1000, 1_000_000 - age * 1000))
+        assert cache.get(sources[0], (32, 32)) is not None
+
+        entry_size = os.path.getsize(cache._entry_paths(cache.key_for(sources[0], (32, 32)))[0])
+        cache.max_bytes = entry_size * 3
+        cache.put(sources[3], (32, 32), Image.effect_noise((32, 32), 64).convert("RGB"))
+
+        assert cache._total_bytes <= cache.max_bytes
+        assert cache.get(sources[0], (32, 32)) is not None
+        assert cache.get(sources[3], (32, 32)) is not None
+        assert cache.get(sources[2], (32, 32)) is None
+
+
+if __name__ == "__main__":
+    test_put_and_get_roundtrip()
+    test_key_changes_when_source_is_rewritten()
+    test_put_failure_is_swallowed_and_cleaned_up()
+    test_eviction_removes_least_recently_used()
+    print("✓ ThumbnailDiskCache のテストはすべて成功しました")
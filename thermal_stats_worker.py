@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+サーモ画像（DJI R-JPEG）の温度統計を計算するワーカー関数
+
+ThermalStatsIndex がプロセスプールから呼び出す。このモジュール自体は NumPy と Pillow 以外に
+依存しないが、spawn 方式（Windows の既定）では子プロセスが起動スクリプト
+（ortho_annotation_system_v7.py）を __mp_main__ として読み込み直すため、そのトップレベルの
+import も子プロセスごとに実行される（if __name__ == "__main__" 以下は実行されない）。
+
+結果は2種類あり、互いに比較できない。
+- "radiometric": APP3 の16bit生データを RADIOMETRIC_RAW_SCALE で換算した温度（℃）。
+  換算係数は特定機種を想定した仮定で、機種ごとの検証・校正（DJI Thermal SDK の放射率・
+  距離・プランク定数等の補正）は行っていない。
+- "palette": 生データの無い画像。パレット表示の輝度を 0〜100 の無次元スコアとしたもの。
+  パレットは画像ごとに自動レンジされるため温度には換算しない。
+"""
+
+import os
+import struct
+
+import numpy as np
+from PIL import Image
+
+
+# 生データの換算（1/64 K 単位とみなす。機種依存の仮定で、実機での検証はしていない）
+RADIOMETRIC_RAW_SCALE = 1.0 / 64.0
+RADIOMETRIC_RAW_OFFSET = -273.15
+# 画面に出す換算の注記（係数を変えた場合はこちらも合わせる）
+RADIOMETRIC_SCALE_NOTE = "生データを1/64 K単位とみなした換算値（機種依存・未検証）"
+# 平均からこの差以上の画素をホットスポットとみなす（生データは℃、パレットはスコア）
+HOTSPOT_DELTA_C = 10.0
+HOTSPOT_DELTA_SCORE = 15.0
+PALETTE_DECODE_SIZE = (320, 256)
+
+
+def iter_jpeg_segments(f):
+    """SOS 直前までの JPEG マーカーセグメントを (マーカー, データ先頭位置, データ長) で列挙"""
+    if f.read(2) != b"\xff\xd8":
+        return
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return
+        code = marker[1]
+        while code == 0xFF:
+            nxt = f.read(1)
+            if not nxt:
+                return
+            code = nxt[0]
+        if code in (0xDA, 0xD9):
+            return
+        if code == 0x01 or 0xD0 <= code <= 0xD7:
+            continue
+        raw_len = f.read(2)
+        if len(raw_len) < 2:
+            return
+        length = struct.unpack(">H", raw_len)[0]
+        seg_start = f.tell()
+        yield code, seg_start, length - 2
+        f.seek(seg_start + length - 2)
+
+
+def read_radiometric_raw(path):
+    """APP3 セグメントに分割格納された16bit生データを (H, W) 配列で返す（無ければ None）"""
+    chunks = []
+    with open(path, "rb") as f:
+        for code, _seg_start, size in iter_jpeg_segments(f):
+            if code == 0xE3:
+                chunks.append(f.read(size))
+    if not chunks:
+        return None
+    with Image.open(path) as img:
+        width, height = img.size
+    data = b"".join(chunks)
+    if len(data) < width * height * 2:
+        return None
+    return np.frombuffer(data, dtype="<u2", count=width * height).reshape(height, width)
+
+
+def compute_thermal_stats(path):
+    """1枚分の統計（最高・平均・ホットスポット）
+
+    生データがあれば温度（"max"/"mean"、℃・未校正の推定値）、無ければパレット輝度の
+    無次元スコア（"score_max"/"score_mean"、0〜100）を返す。
+    """
+    try:
+        raw = read_radiometric_raw(path)
+    except (OSError, ValueError, struct.error):
+        raw = None
+    if raw is not None:
+        values = raw.astype(np.float32) * RADIOMETRIC_RAW_SCALE + RADIOMETRIC_RAW_OFFSET
+        stats = {"source": "radiometric", "estimated": True}
+        max_key, mean_key, delta = "max", "mean", HOTSPOT_DELTA_C
+    else:
+        with Image.open(path) as img:
+            img.draft("L", PALETTE_DECODE_SIZE)
+            gray = np.asarray(img.convert("L"), dtype=np.float32)
+        values = gray * (100.0 / 255.0)
+        stats = {"source": "palette"}
+        max_key, mean_key, delta = "score_max", "score_mean", HOTSPOT_DELTA_SCORE
+    peak = float(values.max())
+    mean = float(values.mean())
+    peak_y, peak_x = np.unravel_index(int(np.argmax(values)), values.shape)
+    height, width = values.shape
+    stats.update({
+        max_key: round(peak, 2),
+        mean_key: round(mean, 2),
+        "hotspot_ratio": round(float(np.count_nonzero(values >= mean + delta)) / values.size, 6),
+        # 最高点の位置は画像サイズに対する比率（縮小デコード時も元画像座標に換算できるように）
+        "hotspot": [round(float(peak_x + 0.5) / width, 4), round(float(peak_y + 0.5) / height, 4)],
+    })
+    return stats
+
+
+def compute_thermal_stats_batch(items):
+    """(パス, 前回解析時の mtime) の組をまとめて解析（プロセス間通信の回数を減らす）
+
+    更新有無の確認（os.stat）もここで行い、mtime が前回と同じ画像は解析しない。
+    戻り値は (パス, 統計) のリストで、解析不要・失敗の画像は統計が None。
+    統計には解析時点の "mtime" を含める。
+    """
+    results = []
+    for path, known_mtime in items:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            results.append((path, None))
+            continue
+        if known_mtime is not None and mtime == known_mtime:
+            results.append((path, None))
+            continue
+        try:
+            stats = compute_thermal_stats(path)
+        except Exception:
+            stats = None
+        if stats is not None:
+            stats["mtime"] = mtime
+        results.append((path, stats))
+    return results